@@ -3,9 +3,122 @@ from typing import Dict, Tuple, List
 import pickle
 import os
 
+import numpy as np
+
+# numba는 선택 의존성 -> 없으면 math/numpy 구현으로 동작
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# C++ 확장(pathfinding_cpp)의 하버사인 일괄 계산 커널 (선택, cpp_src 빌드 필요)
+# 이전 빌드에는 haversine_many_rad가 없을 수 있으므로 속성까지 확인
+try:
+    import pathfinding_cpp
+
+    _cpp_haversine_many_rad = getattr(pathfinding_cpp, "haversine_many_rad", None)
+except ImportError:
+    _cpp_haversine_many_rad = None
+
+EARTH_RADIUS_M = 6371000.0  # meters
+EARTH_DIAMETER_M = 2 * EARTH_RADIUS_M  # 하버사인 마지막 곱셈(2R)을 상수로 미리 계산
+DEG2RAD = math.pi / 180.0  # math.radians(x) == x * DEG2RAD (곱셈 1회, 함수 호출 없음)
+
+
+def _haversine_rad_py(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """하버사인 거리(meter) - 라디안 입력, math 모듈만 사용"""
+    a = (
+        math.sin((lat2 - lat1) * 0.5) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) * 0.5) ** 2
+    )
+    return EARTH_DIAMETER_M * math.asin(math.sqrt(a))
+
+
+def _haversine_rad_np(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """하버사인 거리(meter) - 라디안 배열 입력 (broadcast)"""
+    a = (
+        np.sin((lat2 - lat1) * 0.5) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    )
+    return EARTH_DIAMETER_M * np.arcsin(np.sqrt(a))
+
+
+if NUMBA_AVAILABLE:
+    # fastmath 미사용 -> math 구현과 같은 결과 유지 (A→B == B→A 대칭성 등)
+    _haversine_rad = njit(cache=True, boundscheck=False)(_haversine_rad_py)
+
+    @njit(cache=True, boundscheck=False)
+    def _haversine_m(lat1, lon1, lat2, lon2):
+        """하버사인 거리(meter) - 도(degree) 입력"""
+        return _haversine_rad(
+            lat1 * DEG2RAD, lon1 * DEG2RAD, lat2 * DEG2RAD, lon2 * DEG2RAD
+        )
+
+    # 직렬 루프: 경로 점은 수십 개 수준이라 병렬화 이득이 없고,
+    # 스레드풀에서 동시 호출 시 workqueue threading layer는 프로세스를 중단시킴
+    @njit(cache=True, boundscheck=False)
+    def _haversine_many_rad(lat0, lon0, lats, lons, out):
+        """한 지점에서 여러 지점까지의 하버사인 거리(meter)를 out에 기록 (라디안 입력)"""
+        for i in range(lats.shape[0]):
+            out[i] = _haversine_rad(lat0, lon0, lats[i], lons[i])
+
+    @njit(cache=True, boundscheck=False)
+    def nearest_equirectangular(qlat, qlon, lats, lons, cos_lats):
+        """
+        equirectangular 거리 기준 최근접 점의 index (한 번의 루프로 거리 계산 + argmin)
+        (lat, lon) 2차원 고정 -> 임시 배열 없이 루프 전개/벡터화
+        """
+        best = 0
+        best_d = np.inf
+        for i in range(lats.shape[0]):
+            dlat = lats[i] - qlat
+            dlon = (lons[i] - qlon) * cos_lats[i]
+            d = dlat * dlat + dlon * dlon
+            if d < best_d:
+                best_d = d
+                best = i
+        return best
+
+    # import 시점에 JIT 컴파일 (첫 요청/테스트에서 컴파일 비용이 발생하지 않도록)
+    _haversine_m(0.0, 0.0, 0.0, 0.0)
+    _haversine_many_rad(0.0, 0.0, np.zeros(1), np.zeros(1), np.empty(1))
+    _f32 = np.zeros(1, dtype=np.float32)
+    nearest_equirectangular(np.float32(0.0), np.float32(0.0), _f32, _f32, _f32)
+else:
+
+    def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """하버사인 거리(meter) - 도(degree) 입력"""
+        return _haversine_rad_py(
+            lat1 * DEG2RAD, lon1 * DEG2RAD, lat2 * DEG2RAD, lon2 * DEG2RAD
+        )
+
+    # 일괄 계산은 _haversine_rad_np(numpy) 사용
+    _haversine_many_rad = None
+
+    def nearest_equirectangular(qlat, qlon, lats, lons, cos_lats):
+        """equirectangular 거리 기준 최근접 점의 index (numpy argmin)"""
+        dlat = lats - qlat
+        dlon = (lons - qlon) * cos_lats
+        return int(np.argmin(dlat * dlat + dlon * dlon))
+
+
+def cumulative_distance_rad(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    경로 시작점부터 각 점까지의 누적 하버사인 거리(meter) - 라디안 배열 입력
+    인접한 점 사이 거리를 한 번에 계산 후 누적 (첫 값은 0)
+    """
+    cum = np.zeros(lats.shape[0])
+    if lats.shape[0] > 1:
+        np.cumsum(
+            _haversine_rad_np(lats[:-1], lons[:-1], lats[1:], lons[1:]), out=cum[1:]
+        )
+    return cum
+
 
 class DistanceCalculator:
-    EARTH_RADIUS = 6371000  # meters
+    EARTH_RADIUS = EARTH_RADIUS_M  # meters
 
     def __init__(self, cache_file="distance_cache.pkl"):
         self.cache_file = cache_file
@@ -29,6 +142,46 @@ class DistanceCalculator:
         """두 좌표 간 거리 계산(meter)"""
         return self.haversine((lat1, lon1), (lat2, lon2))
 
+    def calculate_distance_vector(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        """
+        여러 좌표 쌍의 거리를 한 번에 계산(meter)
+        numpy 배열(또는 broadcast 가능한 스칼라) 입력 -> ufunc 한 번에 전체 계산
+        경로 상 모든 역까지의 거리처럼 다수의 거리를 구할 때 사용 (캐시 미사용)
+        """
+        if np.ndim(lat1) == 0 and np.ndim(lon1) == 0:
+            return self.distance_rad_one_side(
+                lat1, lon1, np.radians(lat2), np.radians(lon2)
+            )
+
+        lat1, lon1, lat2, lon2 = (
+            np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+        )
+        return _haversine_rad_np(lat1, lon1, lat2, lon2)
+
+    def distance_rad_one_side(
+        self, user_lat: float, user_lon: float, station_lat_rad, station_lon_rad
+    ) -> np.ndarray:
+        """
+        한 지점(도)에서 여러 역(라디안)까지의 거리 계산(meter)
+        역 좌표는 미리 라디안으로 변환해 두고 사용자 좌표만 변환
+        """
+        lat0 = user_lat * DEG2RAD
+        lon0 = user_lon * DEG2RAD
+        lats = np.ascontiguousarray(station_lat_rad, dtype=np.float64)
+        lons = np.ascontiguousarray(station_lon_rad, dtype=np.float64)
+
+        if lats.ndim == 1 and lats.shape == lons.shape:
+            if _cpp_haversine_many_rad is not None:
+                # C++ 커널 (SIMD 자동 벡터화, GIL 해제)
+                return _cpp_haversine_many_rad(lat0, lon0, lats, lons)
+            if _haversine_many_rad is not None:
+                # numba 커널 (직렬 루프)
+                out = np.empty(lats.shape[0], dtype=np.float64)
+                _haversine_many_rad(lat0, lon0, lats, lons, out)
+                return out
+
+        return _haversine_rad_np(lat0, lon0, lats, lons)
+
     def haversine(
         self, coord1: Tuple[float, float], coord2: Tuple[float, float]
     ) -> float:
@@ -41,18 +194,8 @@ class DistanceCalculator:
         if cache_key in self.cache:
             return self.cache[cache_key]
 
-        # radian convertion
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-        # haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-        distance = self.EARTH_RADIUS * c
+        # haversine formula (numba 사용 가능 시 JIT 커널)
+        distance = _haversine_m(lat1, lon1, lat2, lon2)
 
         # save cache
         self.cache[cache_key] = distance
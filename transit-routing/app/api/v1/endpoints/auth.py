@@ -48,7 +48,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
             status_code=status.HTTP_400_BAD_REQUEST, detail="만료된 사용자입니다."
         )
 
-    access_token = create_access_token(subject=str(user.user_id))
+    access_token = create_access_token(subject=user.user_id)
     refresh_token = create_refresh_token(user.user_id)
 
     AuthService.save_refresh_token(user.user_id, refresh_token)
@@ -71,7 +71,7 @@ async def refresh_token(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 리프레시 토큰입니다."
         )
 
-    access_token = create_access_token(subject=str(user_id))
+    access_token = create_access_token(subject=user_id)
     new_refresh_token = create_refresh_token(user_id)
 
     # 기존 토큰을 대체
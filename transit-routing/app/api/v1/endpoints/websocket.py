@@ -4,8 +4,12 @@ FAST API Websocket endpoint
 
 import asyncio
 import logging
+import operator
+import os
+import threading
 import uuid
 import time
+from collections import deque
 from typing import Dict
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, status
 from pydantic import ValidationError
@@ -19,8 +23,9 @@ from app.services.auth_service import AuthService  # user 정보 조회
 from app.services.pathfinding_service import PathfindingService
 from app.services.guidance_service import GuidanceService
 from app.db.redis_client import init_redis
+from app.core.config import DISABILITY_TYPES
 from app.core.exceptions import KindMapException
-from app.tasks.tasks import save_location_history, save_navigation_event
+from app.tasks.tasks import save_navigation_event
 from app.auth.security import decode_token  # JWT 디코딩 함수 임포트
 from app.services.stt_service import get_stt_service, STTException
 from app.services.station_parser_service import get_station_parser_service
@@ -28,6 +33,15 @@ from app.services.station_parser_service import get_station_parser_service
 # Redis Pub/Sub
 from app.services.redis_pubsub_manager import get_pubsub_manager
 
+# 위치 이력 배치 저장
+from app.services.location_history_buffer import get_location_buffer
+
+# orjson(C 구현 JSON 직렬화)은 선택 의존성 -> 없으면 Starlette send_json(stdlib json) 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -62,6 +76,104 @@ def get_guidance_service():
     return _guidance_service
 
 
+# route_id용 UUID4 풀: os.urandom 한 번으로 _UUID_POOL_SIZE개 생성 (uuid4()마다 getrandom syscall 방지)
+_UUID_POOL_SIZE = 1024
+_uuid_pool: deque = deque()
+_uuid_pool_lock = threading.Lock()
+# fork된 worker가 부모와 같은 ID를 꺼내지 않도록 자식 프로세스에서 풀 비움
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _refill_uuid_pool():
+    """UUID4 풀 재충전 (version=4 -> RFC 4122 버전/variant 비트 설정)"""
+    buf = os.urandom(16 * _UUID_POOL_SIZE)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, len(buf), 16)
+    )
+
+
+def _new_uuid() -> str:
+    """str(uuid.uuid4())와 같은 형식의 ID (풀이 비었을 때만 lock 잡고 재충전)"""
+    while True:
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            with _uuid_pool_lock:
+                if not _uuid_pool:
+                    _refill_uuid_pool()
+
+
+# numpy 스칼라(거리/진행률 계산 결과)도 그대로 직렬화
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+async def _send_json(websocket: WebSocket, message: dict):
+    """
+    JSON 텍스트 프레임 전송
+
+    위치 업데이트마다 호출되는 경로 -> orjson으로 직렬화 후 send_text
+    (클라이언트가 받는 프레임 형식은 send_json과 동일한 JSON 텍스트)
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(message, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson이 지원하지 않는 타입 -> stdlib json 경로로 전송
+            pass
+        else:
+            await websocket.send_text(payload.decode())
+            return
+    await websocket.send_json(message)
+
+
+# route_calculated / route_recalculated 메시지에 route_data에서 그대로 복사하는 필드
+_ROUTE_PAYLOAD_FIELDS = (
+    "origin",
+    "origin_cd",
+    "destination",
+    "destination_cd",
+    "routes",
+    "total_routes_found",
+    "routes_returned",
+)
+_get_route_payload_values = operator.itemgetter(*_ROUTE_PAYLOAD_FIELDS)
+
+
+def _route_payload(message_type: str, route_id: str, route_data: dict, **extra) -> dict:
+    """경로 계산 결과 메시지 생성 (공통 필드는 itemgetter 한 번으로 추출)"""
+    payload = {"type": message_type, "route_id": route_id}
+    payload.update(zip(_ROUTE_PAYLOAD_FIELDS, _get_route_payload_values(route_data)))
+    payload["selected_route_rank"] = 1
+    payload.update(extra)
+    return payload
+
+
+# navigation_update 메시지 필드 (GuidanceService 일반 안내 결과는 항상 이 키를 모두 포함)
+_NAVIGATION_UPDATE_FIELDS = (
+    "current_station",
+    "current_station_name",
+    "next_station",
+    "next_station_name",
+    "distance_to_next",
+    "remaining_stations",
+    "is_transfer",
+    "transfer_from_line",
+    "transfer_to_line",
+    "message",
+    "progress_percent",
+)
+_get_navigation_update_values = operator.itemgetter(*_NAVIGATION_UPDATE_FIELDS)
+
+
+def _navigation_update_payload(guidance: dict) -> dict:
+    """위치 업데이트마다 보내는 안내 메시지 생성 (필드는 itemgetter 한 번으로 추출)"""
+    payload = {"type": "navigation_update"}
+    payload.update(
+        zip(_NAVIGATION_UPDATE_FIELDS, _get_navigation_update_values(guidance))
+    )
+    return payload
+
+
 class ConnectionManager:
     """websocket 연결 관리자"""
 
@@ -113,8 +225,8 @@ class ConnectionManager:
         )
 
     def disconnect(self, user_id: str):
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
+        # 멤버십 확인 + 삭제를 dict 조회 1회로 처리 (없는 사용자는 무시)
+        if self.active_connections.pop(user_id, None) is not None:
             logger.info(
                 f"클라이언트 연결 해제: {user_id}, 남은 연결: {len(self.active_connections)}개"
             )
@@ -130,8 +242,8 @@ class ConnectionManager:
         # 로컬에 존재 => 직접 전송
         if user_id in self.active_connections:
             try:
-                await self.active_connections[user_id].send_json(message)
-                logger.debug(f"로컬 전송 성공: user_id={user_id}")
+                await _send_json(self.active_connections[user_id], message)
+                logger.debug("로컬 전송 성공: user_id=%s", user_id)
                 return
             except Exception as e:
                 logger.error(f"로컬 메시지 전송 실패 (user={user_id}): {e}")
@@ -141,7 +253,7 @@ class ConnectionManager:
         # pubsub_manger <- 활성화된 상태여야 함
         if self.pubsub_manager.enabled:
             await self.pubsub_manager.publish(user_id, message)
-            logger.debug(f"Redis 발행: user_id={user_id} (다른 백엔드로 전달)")
+            logger.debug("Redis 발행: user_id=%s (다른 백엔드로 전달)", user_id)
         else:
             logger.warning(
                 f"메시지 전송 실패: user_id={user_id} (로컬 연결 없음, Pub/Sub 비활성화)"
@@ -156,14 +268,14 @@ class ConnectionManager:
         """
         if user_id in self.active_connections:
             try:
-                await self.active_connections[user_id].send_json(message)
-                logger.debug(f"Pub/Sub 메시지 전송 성공: user_id={user_id}")
+                await _send_json(self.active_connections[user_id], message)
+                logger.debug("Pub/Sub 메시지 전송 성공: user_id=%s", user_id)
             except Exception as e:
                 logger.error(f"Pub/Sub 메시지 전송 실패: {e}")
                 self.disconnect(user_id)
         else:
             # 이 백엔드에는 연결이 없음 => 다른 백엔드에서 처리할 것
-            logger.debug(f"Pub/Sub 메시지 무시: user_id={user_id} (로컬 연결 없음)")
+            logger.debug("Pub/Sub 메시지 무시: user_id=%s (로컬 연결 없음)", user_id)
 
     async def send_error(self, user_id: str, error_message: str, code: str = None):
         """에러 메시지 전송"""
@@ -173,7 +285,7 @@ class ConnectionManager:
                 "type": "error",
                 "message": error_message,
                 "code": code,
-                "timestamp": str(uuid.uuid4()),
+                "timestamp": _new_uuid(),
             },
         )
 
@@ -236,8 +348,13 @@ async def websocket_endpoint(
                 return
 
             # 본인 확인: 요청한 URL의 user_id와 토큰의 주인이 같은지 검사
-            # 문자열로 변환하여 비교 (UUID vs str 문제 방지)
-            if str(token_user_id) != str(user_id):
+            # sub는 UUID hex 형식이므로 UUID로 정규화하여 비교 (하이픈 유무 차이 방지)
+            try:
+                is_same_user = uuid.UUID(str(token_user_id)) == uuid.UUID(str(user_id))
+            except ValueError:
+                is_same_user = False
+
+            if not is_same_user:
                 logger.warning(
                     f"WebSocket 연결 거부 (ID 불일치): URL={user_id}, Token={token_user_id}"
                 )
@@ -280,7 +397,7 @@ async def websocket_endpoint(
             data = await websocket.receive_json()
             message_type = data.get("type")
 
-            logger.debug(f"메시지 수신: user={user_id}, type={message_type}")
+            logger.debug("메시지 수신: user=%s, type=%s", user_id, message_type)
 
             # 메시지 타입별 처리
             if message_type == "start_navigation":
@@ -368,6 +485,15 @@ async def handle_start_navigation(
     if not final_disability_type:
         final_disability_type = "PHY"  # default -> PHY
 
+    # 경로 계산(스레드풀) 전에 한 번만 검증
+    if final_disability_type not in DISABILITY_TYPES:
+        await manager.send_error(
+            user_id,
+            f"유효하지 않은 교통약자 유형입니다: {final_disability_type}",
+            "INVALID_PARAMETERS",
+        )
+        return
+
     try:
         # ThreadPoolExecutor에서 실행 (이벤트 루프 블로킹 방지)
         # 타임아웃 60초 설정
@@ -381,27 +507,16 @@ async def handle_start_navigation(
             timeout=60.0,
         )
 
-        route_id = str(uuid.uuid4())
+        route_id = _new_uuid()
         route_data["route_id"] = route_id
 
-        # Redis 세션 생성
-        get_redis_client().create_session(user_id, route_data)
+        # Redis 세션 생성 (동기 Redis 호출 -> 스레드풀에서 실행)
+        await run_in_threadpool(get_redis_client().create_session, user_id, route_data)
 
         # 클라이언트에 경로 정보 전송
         await manager.send_message(
             user_id,
-            {
-                "type": "route_calculated",
-                "route_id": route_id,
-                "origin": route_data["origin"],
-                "origin_cd": route_data["origin_cd"],
-                "destination": route_data["destination"],
-                "destination_cd": route_data["destination_cd"],
-                "routes": route_data["routes"],
-                "total_routes_found": route_data["total_routes_found"],
-                "routes_returned": route_data["routes_returned"],
-                "selected_route_rank": 1,
-            },
+            _route_payload("route_calculated", route_id, route_data),
         )
 
         # 비동기 이벤트 저장 (게스트는 스킵)
@@ -454,8 +569,8 @@ async def handle_location_update(
         )
         return
 
-    # 세션 확인
-    session = get_redis_client().get_session(user_id)
+    # 세션 확인 (동기 Redis 조회 -> 스레드풀에서 실행해 다른 소켓의 처리를 막지 않음)
+    session = await run_in_threadpool(get_redis_client().get_session, user_id)
     if not session:
         await manager.send_error(
             user_id,
@@ -483,12 +598,16 @@ async def handle_location_update(
             return
 
     logger.debug(
-        f"위치 업데이트: user={user_id}, lat={lat:.6f}, lon={lon:.6f}, accuracy={accuracy}m"
+        "위치 업데이트: user=%s, lat=%.6f, lon=%.6f, accuracy=%sm",
+        user_id, lat, lon, accuracy,
     )
 
     try:
-        # 실시간 경로 안내 계산
-        guidance = guidance_service.get_navigation_guidance(user_id, lat, lon)
+        # 실시간 경로 안내 계산 (거리 계산 + Redis 위치 갱신 -> 스레드풀)
+        # 위에서 조회한 세션을 넘겨 Redis 재조회 생략
+        guidance = await run_in_threadpool(
+            guidance_service.get_navigation_guidance, user_id, lat, lon, session
+        )
 
         # 경로 이탈 감지
         if guidance.get("recalculate"):
@@ -534,27 +653,11 @@ async def handle_location_update(
             return
 
         # 일반 경로 안내
-        await manager.send_message(
-            user_id,
-            {
-                "type": "navigation_update",
-                "current_station": guidance["current_station"],
-                "current_station_name": guidance["current_station_name"],
-                "next_station": guidance.get("next_station"),
-                "next_station_name": guidance.get("next_station_name"),
-                "distance_to_next": guidance.get("distance_to_next"),
-                "remaining_stations": guidance["remaining_stations"],
-                "is_transfer": guidance.get("is_transfer", False),
-                "transfer_from_line": guidance.get("transfer_from_line"),
-                "transfer_to_line": guidance.get("transfer_to_line"),
-                "message": guidance["message"],
-                "progress_percent": guidance.get("progress_percent", 0),
-            },
-        )
+        await manager.send_message(user_id, _navigation_update_payload(guidance))
 
-        # 비동기 위치 이력 저장 (게스트는 스킵)
+        # 위치 이력 버퍼에 추가 -> 백그라운드에서 배치 발행 (게스트는 스킵)
         if not user_id.startswith("temp_"):
-            save_location_history.delay(
+            get_location_buffer().add(
                 user_id, lat, lon, accuracy, session["route_id"]
             )
 
@@ -581,10 +684,14 @@ async def handle_switch_route(user_id: str, data: dict):
     logger.info(f"경로 변경 요청: user={user_id}, target_rank={target_rank}")
 
     try:
-        success = get_redis_client().switch_route(user_id, target_rank)
+        # 동기 Redis 호출 -> 스레드풀에서 실행
+        redis_client = get_redis_client()
+        success = await run_in_threadpool(
+            redis_client.switch_route, user_id, target_rank
+        )
 
         if success:
-            session = get_redis_client().get_session(user_id)
+            session = await run_in_threadpool(redis_client.get_session, user_id)
 
             await manager.send_message(
                 user_id,
@@ -622,7 +729,7 @@ async def handle_recalculate_route(
     """
     현재 위치에서 목적지까지 새로운 경로 탐색
     """
-    session = get_redis_client().get_session(user_id)
+    session = await run_in_threadpool(get_redis_client().get_session, user_id)
 
     if not session:
         await manager.send_error(user_id, "활성 세션이 없습니다", "NO_ACTIVE_SESSION")
@@ -630,7 +737,7 @@ async def handle_recalculate_route(
 
     lat = data.get("latitude")
     lon = data.get("longitude")
-    disability_type = data.get("disability_type", "PHY")
+    disability_type = data.get("disability_type") or "PHY"
 
     if lat is None or lon is None:
         await manager.send_error(
@@ -638,11 +745,21 @@ async def handle_recalculate_route(
         )
         return
 
+    if disability_type not in DISABILITY_TYPES:
+        await manager.send_error(
+            user_id,
+            f"유효하지 않은 교통약자 유형입니다: {disability_type}",
+            "INVALID_PARAMETERS",
+        )
+        return
+
     logger.info(f"경로 재계산 요청: user={user_id}")
 
     try:
         # 현재 위치에서 가장 가까운 역 찾기
-        current_station_name = guidance_service.find_nearest_station_name(lat, lon)
+        current_station_name = await run_in_threadpool(
+            guidance_service.find_nearest_station_name, lat, lon
+        )
         destination_name = session["destination"]
 
         logger.info(f"재계산 시작: {current_station_name} → {destination_name}")
@@ -658,27 +775,20 @@ async def handle_recalculate_route(
             timeout=60.0,
         )
 
-        route_id = str(uuid.uuid4())
+        route_id = _new_uuid()
         route_data["route_id"] = route_id
 
         # 세션 업데이트
-        get_redis_client().create_session(user_id, route_data)
+        await run_in_threadpool(get_redis_client().create_session, user_id, route_data)
 
         await manager.send_message(
             user_id,
-            {
-                "type": "route_recalculated",
-                "route_id": route_id,
-                "origin": route_data["origin"],
-                "origin_cd": route_data["origin_cd"],
-                "destination": route_data["destination"],
-                "destination_cd": route_data["destination_cd"],
-                "routes": route_data["routes"],
-                "total_routes_found": route_data["total_routes_found"],
-                "routes_returned": route_data["routes_returned"],
-                "selected_route_rank": 1,
-                "message": "경로가 재계산되었습니다",
-            },
+            _route_payload(
+                "route_recalculated",
+                route_id,
+                route_data,
+                message="경로가 재계산되었습니다",
+            ),
         )
 
         # 비동기 이벤트 저장 (게스트는 스킵)
@@ -700,24 +810,17 @@ async def handle_end_navigation(user_id: str):
     """
     세션 삭제 및 종료 이벤트 기록
     """
-    session = get_redis_client().get_session(user_id)
+    # 세션 조회는 1회 (route_id는 종료 이벤트/응답에 사용)
+    redis_client = get_redis_client()
+    session = await run_in_threadpool(redis_client.get_session, user_id)
 
     if session:
         route_id_from_client = session.get("route_id")
 
-        session = get_redis_client().get_session(user_id)
-        if session:
-            # route_id 검증 => 잘못된 삭제 방지
-            if route_id_from_client and session.get("route_id") != route_id_from_client:
-                logger.warning(f"end_navigation route_id 불일치: user={user_id}")
-                await manager.send_error(
-                    user_id, "경로 ID가 일치하지 않습니다.", "ROUTE_ID_MISMATCH"
-                )
-            return
-
         # Redis 세션 삭제 => 내브 구현에 직접 접근하는 방식은 위험
+        # 세션은 session:{user_id} 단일 키 -> DEL 1회로 정리 (패턴 SCAN 불필요)
         # get_redis_client().redis_client.delete(f"session:{user_id}")
-        get_redis_client().delete_session(user_id)  # => 캡슐화 유지
+        await run_in_threadpool(redis_client.delete_session, user_id)  # 캡슐화 유지
 
         # 종료 이벤트 저장 (게스트는 스킵)
         if not user_id.startswith("temp_"):
@@ -854,29 +957,22 @@ async def handle_voice_input(
             timeout=60.0,
         )
 
-        route_id = str(uuid.uuid4())
+        route_id = _new_uuid()
         route_data["route_id"] = route_id
 
-        # Redis 세션 생성
-        get_redis_client().create_session(user_id, route_data)
+        # Redis 세션 생성 (동기 Redis 호출 -> 스레드풀에서 실행)
+        await run_in_threadpool(get_redis_client().create_session, user_id, route_data)
 
         # route_calculated 전송
         await manager.send_message(
             user_id,
-            {
-                "type": "route_calculated",
-                "route_id": route_id,
-                "origin": route_data["origin"],
-                "origin_cd": route_data["origin_cd"],
-                "destination": route_data["destination"],
-                "destination_cd": route_data["destination_cd"],
-                "routes": route_data["routes"],
-                "total_routes_found": route_data["total_routes_found"],
-                "routes_returned": route_data["routes_returned"],
-                "selected_route_rank": 1,
-                "disability_type": disability_type,
-                "input_method": "voice",
-            },
+            _route_payload(
+                "route_calculated",
+                route_id,
+                route_data,
+                disability_type=disability_type,
+                input_method="voice",
+            ),
         )
 
         # 이벤트 저장 (게스트는 제외)
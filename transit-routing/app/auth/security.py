@@ -1,29 +1,58 @@
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Optional, Union, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from jose import JWTError, jwk, jwt
 from uuid import UUID
 import logging
 import hashlib
+import re
+import time
+import bcrypt
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# bcrypt cost factor -> 테스트에서는 monkeypatch로 낮춰서 사용
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
 
-# 암호화 컨텍스트 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 검증된 토큰의 claims 캐시 {token: (cache_expire_at, payload)}
+# 같은 토큰이 반복 검증될 때 서명 검증(HMAC)을 생략
+# 검증 실패한 토큰은 캐싱하지 않음
+_CLAIMS_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_CLAIMS_CACHE_MAX_SIZE = 4096
+_CLAIMS_CACHE_TTL_SECONDS = 5
+_claims_cache_lock = Lock()
+
+# JWS compact 형식 (header.payload.signature, base64url)
+# 형식이 다른 토큰은 base64/JSON 디코딩, 서명 계산 전에 거부
+_JWT_FORMAT = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+
+
+@lru_cache(maxsize=1)
+def _get_signing_key(secret: str, algorithm: str):
+    """
+    JWT 서명/검증 키 객체를 한 번만 생성하여 재사용
+    문자열 secret을 넘기면 python-jose가 매 호출마다 HMACKey를 새로 만들기 때문
+    secret/algorithm이 바뀌면 (테스트 설정 등) 새로 생성
+    """
+    return jwk.construct(secret, algorithm)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     평문 비밀번호와 해시된 비밀번호 비교
     72byte 초과의 경우 SHA-256 전처리를 수행 후 검증
+    bcrypt.checkpw -> 해시 비교를 상수 시간으로 수행 (timing attack 방지)
     """
     if len(plain_password.encode("utf-8")) > 72:
         plain_password = hashlib.sha256(plain_password.encode("utf-8")).hexdigest()
 
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
 
 
 def get_password_hash(password: str) -> str:
@@ -34,7 +63,26 @@ def get_password_hash(password: str) -> str:
     if len(password.encode("utf-8")) > 72:
         password = hashlib.sha256(password.encode("utf-8")).hexdigest()
 
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def _subject_claim(subject: Any) -> str:
+    """
+    sub 클레임 값 생성
+    UUID는 하이픈 없는 hex(32자)로 저장 -> 서명 입력/전송 크기 축소
+    읽는 쪽은 UUID(payload["sub"])로 두 형식 모두 파싱 가능
+    """
+    if isinstance(subject, UUID):
+        return subject.hex
+    return str(subject)
+
+
+def _expires_at(expires_delta: timedelta) -> int:
+    """
+    exp 클레임 값 (epoch 초, int)
+    datetime 객체 생성 없이 time.time()으로 계산 -> jose가 다시 epoch로 변환하는 과정도 생략
+    """
+    return int(time.time() + expires_delta.total_seconds())
 
 
 def create_access_token(
@@ -46,33 +94,31 @@ def create_access_token(
     expires_delta -> 만료 시간 커스텀 설정
     """
     if expires_delta:
-        # python 최신 버전에서는 utcnow -> 사용 권장 안함
-        # 타임존 정보가 없는 시간을 반환하여 나중에 타임존이 있는 시간과 비교할 때 오류 유발 가능성 존재
-        # datetime.now를 사용해 명시적으로 UTC 타임존 지정해야 함
-        expire = datetime.now(timezone.utc) + expires_delta
+        # epoch 기준(UTC)이므로 타임존 혼동 없음
+        expire = _expires_at(expires_delta)
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = _expires_at(timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
 
     # sub(subject) -> 명시적으로 포함, type을 통해 토큰 용도 구분
-    to_encode = {"sub": str(subject), "exp": expire, "type": "access"}
+    to_encode = {"sub": _subject_claim(subject), "exp": expire, "type": "access"}
 
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode,
+        _get_signing_key(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM),
+        algorithm=settings.JWT_ALGORITHM,
     )
     return encoded_jwt
 
 
 def create_refresh_token(user_id: UUID) -> str:
     """Refresh Token 생성"""
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    expire = _expires_at(timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS))
 
-    to_encode = {"sub": str(user_id), "exp": expire, "type": "refresh"}
+    to_encode = {"sub": _subject_claim(user_id), "exp": expire, "type": "refresh"}
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode,
+        _get_signing_key(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM),
+        algorithm=settings.JWT_ALGORITHM,
     )
     return encoded_jwt
 
@@ -82,11 +128,43 @@ def decode_token(token: str) -> Optional[dict]:
     토큰 디코딩 및 검증
     return payload dict or None(유효하지 않은 경우)
     """
+    # 형식 검사를 캐시 조회보다 먼저 (해시 불가능한 입력도 None 반환)
+    if not isinstance(token, str) or not _JWT_FORMAT.fullmatch(token):
+        logger.error("JWT error: malformed token")
+        return None
+
+    now = time.time()
+    with _claims_cache_lock:
+        cached = _CLAIMS_CACHE.get(token)
+        if cached is not None:
+            if cached[0] > now:
+                _CLAIMS_CACHE.move_to_end(token)
+                # 호출자마다 복사본 반환 (한 요청의 수정이 다른 요청에 전파되지 않도록)
+                return dict(cached[1])
+            del _CLAIMS_CACHE[token]
+
     try:
+        # 서명 검증과 필수 클레임(exp, sub) 확인을 한 번의 decode로 처리
         payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            token,
+            _get_signing_key(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM),
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"require_exp": True, "require_sub": True},
         )
-        return payload
+        # type은 python-jose가 require 옵션을 지원하지 않으므로 검증된 payload에서 확인
+        if "type" not in payload:
+            logger.error("JWT error: missing 'type' claim")
+            return None
     except JWTError as e:
         logger.error(f"JWT error: {e}")
         return None
+
+    # 캐시 만료 시점: 토큰 만료 시각과 TTL 중 빠른 쪽
+    cache_expire_at = min(payload["exp"], now + _CLAIMS_CACHE_TTL_SECONDS)
+    with _claims_cache_lock:
+        _CLAIMS_CACHE[token] = (cache_expire_at, dict(payload))
+        _CLAIMS_CACHE.move_to_end(token)
+        if len(_CLAIMS_CACHE) > _CLAIMS_CACHE_MAX_SIZE:
+            _CLAIMS_CACHE.popitem(last=False)
+
+    return payload
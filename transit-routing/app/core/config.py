@@ -39,6 +39,12 @@ class Settings:
         os.getenv("ROUTE_CACHE_TTL_SECONDS", 1209600)
     )  # 14일 (1209600초)
 
+    # Redis 경로 캐시 앞단 프로세스 로컬 캐시 (0이면 비활성화)
+    ROUTE_LOCAL_CACHE_TTL_SECONDS: float = float(
+        os.getenv("ROUTE_LOCAL_CACHE_TTL_SECONDS", 60)
+    )
+    ROUTE_LOCAL_CACHE_MAX_SIZE: int = int(os.getenv("ROUTE_LOCAL_CACHE_MAX_SIZE", 4096))
+
     # 캐시 메트릭 활성화 플래그
     ENABLE_CACHE_METRICS: bool = (
         os.getenv("ENABLE_CACHE_METRICS", "true").lower() == "true"
@@ -56,6 +62,14 @@ class Settings:
         os.getenv("SLOW_REQUEST_THRESHOLD_MS", 1000)
     )  # 느린 요청 기준 (ms)
 
+    # 위치 이력 배치 저장 (batch_size건이 쌓이거나 flush 주기마다 batch_save_locations 발행)
+    LOCATION_BATCH_SIZE: int = int(os.getenv("LOCATION_BATCH_SIZE", 100))
+    LOCATION_FLUSH_INTERVAL_SECONDS: float = float(
+        os.getenv("LOCATION_FLUSH_INTERVAL_SECONDS", 1.0)
+    )
+    # 발행 실패한 배치는 버퍼에 되돌려 재시도, 연속 실패가 이 횟수를 넘으면 폐기
+    LOCATION_PUBLISH_MAX_RETRIES: int = int(os.getenv("LOCATION_PUBLISH_MAX_RETRIES", 3))
+
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/1")
     CELERY_RESULT_BACKEND: str = os.getenv(
         "CELERY_RESULT_BACKEND", "redis://redis:6379/2"
@@ -67,6 +81,13 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # 테스트 모드 (tests/test/conftest.py에서 모듈 임포트 전에 설정)
+    TESTING: bool = os.getenv("TESTING", "false").lower() == "true"
+
+    # bcrypt cost factor (2^rounds 반복)
+    # 테스트 모드에서는 최소값(4) 사용 -> 12 대비 256배 빠름, 운영 보안 수준에는 영향 없음
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 4 if TESTING else 12))
+
     # CORS 설정
     # ALLOWED_HOSTS(X) => ALLOWED_ORIGINS
     ALLOWED_ORIGINS: list[str] = os.getenv(
@@ -8,6 +8,8 @@ Thread Lock으로 서버 시작 시 한 번만 로드하여 메모리에 유지
 """
 
 import logging
+import sys
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from threading import Lock
 
@@ -20,6 +22,12 @@ _cache_init = False
 _stations_cache: Dict[str, Dict] = {}  # {station_cd: station_info}
 _stations_list_cache: List[Dict] = []
 _station_name_map_cache: Dict[str, str] = {}  # {name: station_cd}
+_station_name_by_cd_cache: Dict[str, str] = {}  # {station_cd: name}
+# {부분 일치로 찾은 입력 이름: station_cd} - 사용자 입력이 키 -> 크기 제한 LRU
+_station_alias_cache: "OrderedDict[str, str]" = OrderedDict()
+_station_alias_lock = Lock()
+_STATION_ALIAS_CACHE_MAX_SIZE = 1024
+_STATION_ALIAS_MAX_LENGTH = 32  # 역 이름보다 긴 입력은 별칭으로 저장하지 않음
 _sections_cache: List[Dict] = []
 _transfer_conv_cache: Dict[str, Dict] = {}  # {station_cd: conv_scores}
 _lines_cache: Dict[str, List[str]] = {}  # {line: [station_cd, ...]}
@@ -38,7 +46,7 @@ def initialize_cache():
 
     global _cache_init
     global _stations_cache, _stations_list_cache, _station_name_map_cache
-    global _lines_cache, _transfer_conv_cache
+    global _station_name_by_cd_cache, _lines_cache, _transfer_conv_cache
 
     with _cache_lock:
         if _cache_init:
@@ -60,9 +68,16 @@ def initialize_cache():
         # 1. 역 정보 로드
         _stations_list_cache = get_all_stations()
         _stations_cache = {s["station_cd"]: s for s in _stations_list_cache}
-        _station_name_map_cache = {
-            s["name"]: s["station_cd"] for s in _stations_list_cache
-        }
+        # 역 이름 <-> 역 코드 양방향 매핑 (역 정보 dict를 거치지 않고 바로 조회)
+        # 키/값 문자열을 intern -> 두 dict가 같은 문자열 객체를 공유
+        _station_name_map_cache = {}
+        _station_name_by_cd_cache = {}
+        _station_alias_cache.clear()
+        for s in _stations_list_cache:
+            name = sys.intern(s["name"])
+            station_cd = sys.intern(s["station_cd"])
+            _station_name_map_cache[name] = station_cd
+            _station_name_by_cd_cache[station_cd] = name
 
         # 호선별 역 코드 매핑
         for station in _stations_list_cache:
@@ -163,8 +178,10 @@ def get_station_by_code(station_cd: str) -> Optional[Dict]:
 
 
 def get_station_name_by_code(station_cd: str) -> str:
-    station = get_station_by_code(station_cd)
-    return station["name"] if station else station_cd
+    if not _cache_init:
+        initialize_cache()
+    # 없는 역 코드는 코드를 그대로 반환
+    return _station_name_by_cd_cache.get(station_cd, station_cd)
 
 
 def get_station_cd_by_name(station_name: str) -> Optional[str]:
@@ -173,14 +190,26 @@ def get_station_cd_by_name(station_name: str) -> Optional[str]:
 
     station_name = station_name.strip()
 
-    # 1단계: 정확 일치
-    if station_name in _station_name_map_cache:
-        return _station_name_map_cache[station_name]
+    # 1단계: 정확 일치 (dict 조회 1회)
+    station_cd = _station_name_map_cache.get(station_name)
+    if station_cd is not None:
+        return station_cd
+
+    # 2단계: 부분 일치 (전체 역 순회 -> 찾은 결과는 별칭으로 저장해 다음부터 dict 조회 1회)
+    with _station_alias_lock:
+        station_cd = _station_alias_cache.get(station_name)
+        if station_cd is not None:
+            _station_alias_cache.move_to_end(station_name)
+            return station_cd
 
-    # 2단계: 부분 일치
     for name, cd in _station_name_map_cache.items():
         if station_name in name or name in station_name:
             logger.debug(f"부분 일치: {station_name} → {name} ({cd})")
+            if len(station_name) <= _STATION_ALIAS_MAX_LENGTH:
+                with _station_alias_lock:
+                    _station_alias_cache[station_name] = cd
+                    if len(_station_alias_cache) > _STATION_ALIAS_CACHE_MAX_SIZE:
+                        _station_alias_cache.popitem(last=False)
             return cd
 
     # 3단계: DB 쿼리
@@ -241,13 +270,15 @@ def get_line_by_station_cd(station_cd: str) -> Optional[str]:
 def clear_cache():
     global _cache_init
     global _stations_cache, _stations_list_cache, _station_name_map_cache
-    global _sections_cache, _transfer_conv_cache
+    global _station_name_by_cd_cache, _sections_cache, _transfer_conv_cache
     global _lines_cache, _facility_cache, _congestion_cache
 
     with _cache_lock:
         _stations_cache.clear()
         _stations_list_cache.clear()
         _station_name_map_cache.clear()
+        _station_name_by_cd_cache.clear()
+        _station_alias_cache.clear()
         _sections_cache.clear()
         _transfer_conv_cache.clear()
         _lines_cache.clear()
@@ -6,9 +6,32 @@ import logging
 
 from app.core.config import settings
 
+# orjson(C 구현 JSON 직렬화)은 선택 의존성 -> 없으면 stdlib json 사용
+# 경로 캐시 값 형식은 동일한 JSON 텍스트 (기존 캐시와 호환)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_route(route_data: Dict[str, Any]) -> str:
+    """경로 캐시 직렬화 (orjson: 공백 없는 UTF-8 JSON, numpy 스칼라 지원)"""
+    if orjson is not None:
+        return orjson.dumps(
+            route_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(route_data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads_route(cached_data: str) -> Dict[str, Any]:
+    """경로 캐시 역직렬화 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)"""
+    if orjson is not None:
+        return orjson.loads(cached_data)
+    return json.loads(cached_data)
+
+
 class RedisSessionManager:
     def __init__(self):
         # Connection pooling for improved concurrency
@@ -191,7 +214,7 @@ class RedisSessionManager:
             cached_data = self.redis_client.get(cache_key)
             if cached_data:
                 logger.debug(f"캐시 HIT:{cache_key}")
-                return json.loads(cached_data)
+                return _loads_route(cached_data)
             logger.debug(f"캐시 MISS: {cache_key}")
             return None
         except redis.RedisError as e:
@@ -208,7 +231,7 @@ class RedisSessionManager:
         경로 계산 결과 redis에 캐싱
         """
         try:
-            serialized_data = json.dumps(route_data, ensure_ascii=False)
+            serialized_data = _dumps_route(route_data)
             self.redis_client.setex(cache_key, ttl, serialized_data)
 
             try:
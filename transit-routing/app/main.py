@@ -21,6 +21,9 @@ from app.api.v1.router import api_router
 from app.services.redis_pubsub_manager import get_pubsub_manager
 from app.api.v1.endpoints.websocket import manager as websocket_manager
 
+# 위치 이력 배치 저장
+from app.services.location_history_buffer import get_location_buffer
+
 # 성능 모니터링
 from app.middleware.performance_monitoring import (
     PerformanceMonitoringMiddleware,
@@ -51,8 +54,10 @@ async def lifespan(app: FastAPI):
     - Redis 클라이언트 초기화 (세션 관리용)
     - Redis Pub/Sub 초기화 및 리스너 시작
     - Websocket 메시지 핸들러 등록 및 리스너 시
+    - 위치 이력 배치 발행 태스크 시작
 
     서버 종료 시 실행:
+    - 위치 이력 버퍼 flush
     - Redis Pub/Sub 종료
     - PostgreSQL 연결 풀 종
     """
@@ -84,6 +89,9 @@ async def lifespan(app: FastAPI):
             message_handler=websocket_manager.handle_pubsub_message
         )
 
+        # 위치 이력 배치 발행 태스크 시작
+        await get_location_buffer().start()
+
         logger.info("=" * 60)
         logger.info("KindMap Backend 시작 완료!")
         logger.info("=" * 60)
@@ -101,13 +109,17 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
 
     try:
-        # 1. Redis Pub/Sub 종료
-        logger.info("1/2 Redis Pub/Sub 종료 중...")
+        # 1. 위치 이력 버퍼 flush
+        logger.info("1/3 위치 이력 버퍼 flush 중...")
+        await get_location_buffer().stop()
+
+        # 2. Redis Pub/Sub 종료
+        logger.info("2/3 Redis Pub/Sub 종료 중...")
         pubsub_manager = get_pubsub_manager()
         await pubsub_manager.close()
 
-        # 2. PostgreSQL 연결 풀 종료
-        logger.info("2/2 PostgreSQL 연결 풀 종료 중...")
+        # 3. PostgreSQL 연결 풀 종료
+        logger.info("3/3 PostgreSQL 연결 풀 종료 중...")
         close_pool()
 
         logger.info("=" * 60)
@@ -1,7 +1,8 @@
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from jose import JWTError
+import hashlib
 import psycopg2.extras
 
 from app.models.domain import User
@@ -14,6 +15,14 @@ from app.db.database import get_db_connection
 from app.core.config import settings
 
 
+def _refresh_token_digest(token: str) -> bytes:
+    """
+    Refresh Token의 SHA-256 digest (32byte)
+    DB에는 JWT 원문 대신 digest만 저장 -> 행 크기 축소, 유출 시 토큰 재사용 불가
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
 class AuthService:
     @staticmethod
     def create_user(
@@ -52,9 +61,10 @@ class AuthService:
     def authenticate_user(email: str, password: str) -> Optional[User]:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                # 조회는 SELECT (행 잠금/쓰기 없음) -> 실패한 로그인은 조회 1회로 끝남
                 cur.execute(
                     """
-                    SELECT user_id, email, password_hash, username, disability_type, is_active, created_at, last_login
+                    SELECT user_id, email, password_hash, username, disability_type, is_active, created_at
                     FROM users WHERE email = %s
                 """,
                     (email,),
@@ -63,9 +73,13 @@ class AuthService:
                 row = cur.fetchone()
                 if not row or not verify_password(password, row['password_hash']):
                     return None
+
+                # 비밀번호 검증 성공 시에만 last_login 갱신 (DB 시각을 그대로 반환)
                 cur.execute(
-                    "UPDATE users SET last_login = NOW() WHERE user_id = %s", (row['user_id'],)
+                    "UPDATE users SET last_login = NOW() WHERE user_id = %s RETURNING last_login",
+                    (row['user_id'],),
                 )
+                last_login = cur.fetchone()['last_login']
                 conn.commit()
 
                 return User(
@@ -75,11 +89,15 @@ class AuthService:
                     disability_type=row['disability_type'],
                     is_active=row['is_active'],
                     created_at=row['created_at'],
-                    last_login=datetime.now(timezone.utc),
+                    last_login=last_login,
                 )
 
     @staticmethod
-    def verify_refresh_token(token: str) -> Optional[UUID]:
+    def _refresh_token_user_id(token: str) -> Optional[UUID]:
+        """
+        Refresh Token의 서명/만료/type 검증 후 sub(user_id) 반환
+        DB 화이트리스트 확인 전 단계, 유효하지 않으면 None
+        """
         try:
             payload = decode_token(token)
 
@@ -95,26 +113,73 @@ class AuthService:
             if not user_id_str:
                 return None
 
-            user_id = UUID(user_id_str)
+            return UUID(user_id_str)
+        except (JWTError, ValueError, TypeError):
+            return None
 
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    # DB에 저장된 Refresh Token인지 확인 -> white list
-                    cur.execute(
-                        """
-                        SELECT user_id FROM refresh_tokens
-                        WHERE user_id = %s AND expires_at > NOW()
-                    """,
-                        (user_id,),
-                    )
+    @staticmethod
+    def verify_refresh_token(token: str) -> Optional[UUID]:
+        user_id = AuthService._refresh_token_user_id(token)
+        if user_id is None:
+            return None
 
-                    if cur.fetchone():
-                        return user_id
-        except (JWTError, ValueError, TypeError):
-            pass
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # DB에 저장된 Refresh Token인지 확인 -> white list
+                # JWT 서명 검증을 통과한 토큰만 digest로 조회
+                cur.execute(
+                    """
+                    SELECT user_id FROM refresh_tokens
+                    WHERE user_id = %s AND token_hash = %s AND expires_at > NOW()
+                """,
+                    (user_id, _refresh_token_digest(token)),
+                )
+
+                if cur.fetchone():
+                    return user_id
 
         return None
 
+    @staticmethod
+    def verify_refresh_tokens(tokens: List[str]) -> List[Optional[UUID]]:
+        """
+        여러 Refresh Token을 한 번에 검증 (정리 작업, 다중 기기 로그아웃 등)
+        토큰마다 SELECT 하지 않고 digest 배열로 한 번만 조회 (DB 왕복 N회 -> 1회)
+        return 입력 순서대로 user_id 또는 None
+        """
+        results: List[Optional[UUID]] = [None] * len(tokens)
+
+        # digest -> [(입력 index, 토큰의 user_id)], JWT 검증 통과한 토큰만 조회 대상
+        candidates = {}
+        for index, token in enumerate(tokens):
+            user_id = AuthService._refresh_token_user_id(token)
+            if user_id is not None:
+                candidates.setdefault(_refresh_token_digest(token), []).append(
+                    (index, user_id)
+                )
+
+        if not candidates:
+            return results
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT token_hash, user_id FROM refresh_tokens
+                    WHERE token_hash = ANY(%s) AND expires_at > NOW()
+                """,
+                    (list(candidates),),
+                )
+
+                for token_hash, row_user_id in cur.fetchall():
+                    # psycopg2는 bytea를 memoryview로 반환
+                    for index, user_id in candidates.get(bytes(token_hash), []):
+                        # 저장된 토큰의 소유자와 sub가 일치해야 유효
+                        if UUID(str(row_user_id)) == user_id:
+                            results[index] = user_id
+
+        return results
+
     @staticmethod
     def revoke_refresh_tokens(user_id: UUID):
         with get_db_connection() as conn:
@@ -127,8 +192,11 @@ class AuthService:
     def email_exists(email: str) -> bool:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT 1 FROM users WHERE email = %s", (email,))
-                return cur.fetchone() is not None
+                # EXISTS -> 첫 번째 일치 행에서 검색 종료, 항상 boolean 한 행 반환
+                cur.execute(
+                    "SELECT EXISTS(SELECT 1 FROM users WHERE email = %s)", (email,)
+                )
+                return bool(cur.fetchone()[0])
 
     @staticmethod
     def get_user_by_id(user_id: UUID) -> Optional[User]:
@@ -164,16 +232,17 @@ class AuthService:
 
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # 기존 토큰을 지우고 새로 넣을지, 누적할지는 추후 정책 결정 필요
-                # 우선 '단일 기기 로그인' 처럼 기존 토큰 삭제 후 삽입으로 구현
-                cur.execute("DELETE FROM refresh_tokens WHERE user_id = %s", (str(user_id),))
-
+                # '단일 기기 로그인' 정책 -> 사용자당 토큰 1개만 유지
+                # DELETE + INSERT 대신 upsert 한 번으로 처리 (DB 왕복 1회, 두 쿼리 사이 경쟁 상태 제거)
+                # refresh_tokens.user_id에 UNIQUE 제약 조건 필요
                 cur.execute(
                     """
-                    INSERT INTO refresh_tokens (user_id, token, expires_at)
+                    INSERT INTO refresh_tokens (user_id, token_hash, expires_at)
                     VALUES (%s, %s, %s)
+                    ON CONFLICT (user_id) DO UPDATE
+                    SET token_hash = EXCLUDED.token_hash, expires_at = EXCLUDED.expires_at
                     """,
-                    (str(user_id), token, expires_at),
+                    (str(user_id), _refresh_token_digest(token), expires_at),
                 )
                 conn.commit()
 
@@ -1,17 +1,37 @@
 import logging
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 
-# NNS => KD-TREE 사용하기
-from scipy.spatial import KDTree
 import numpy as np
 
 from app.db.redis_client import RedisSessionManager
-from app.algorithms.distance_calculator import DistanceCalculator
+from app.algorithms.distance_calculator import (
+    DistanceCalculator,
+    cumulative_distance_rad,
+    nearest_equirectangular,
+)
 from app.db.cache import get_stations_dict, get_station_name_by_code
+from app.core.config import settings
 from app.core.exceptions import SessionNotFoundException, InvalidLocationException
 
 logger = logging.getLogger(__name__)
 
+# 서울 권역 GPS 범위 (여유있게 설정)
+SEOUL_LAT_MIN, SEOUL_LAT_MAX = 36.0, 39.0
+SEOUL_LON_MIN, SEOUL_LON_MAX = 126.4, 127.6
+
+
+class RouteGeometry(NamedTuple):
+    """경로 상 역(역 정보가 있는 역만)의 코드, route_sequence 내 위치, 라디안 좌표, 누적 거리"""
+
+    station_cds: List[str]
+    positions: List[int]  # station_cds[i]의 route_sequence index
+    lat_rad: np.ndarray
+    lon_rad: np.ndarray
+    cum_distance: np.ndarray  # 첫 역부터 station_cds[i]까지의 누적 거리(meter)
+
 
 class GuidanceService:
     """실시간 경로 안내 서비스 클래스"""
@@ -19,27 +39,112 @@ class GuidanceService:
     # 경로 이탈 판단 거리 (미터)
     ROUTE_DEVIATION_THRESHOLD = 800  # 800m
 
+    # 경로 좌표 배열 캐시 최대 개수 (route_id 기준 LRU)
+    ROUTE_CACHE_MAX_SIZE = 1024
+
+    # 일괄 최근접 역 검색 시 한 번에 계산할 위치 수 (위치 x 역 거리 행렬 메모리 제한)
+    NEAREST_BATCH_CHUNK_SIZE = 1024
+
     def __init__(self, redis_client: RedisSessionManager):
         self.redis_client = redis_client
         self.distance_calc = DistanceCalculator()
 
+        # 경로 좌표 캐시 lock (안내 계산은 스레드풀에서 동시 실행)
+        self._route_cache_lock = threading.Lock()
+
         # 캐시에서 역 정보 로드 (DB 쿼리 없음)
         self.stations = get_stations_dict()
 
-        # KD-Tree 초기화
-        station_coords = []
-        self.station_cd_list = []
+        # 최근접 역 검색용 좌표 배열 초기화
+        self._build_station_index()
 
-        for station_cd, info in self.stations.items():
-            station_coords.append([info["lat"], info["lng"]])
-            self.station_cd_list.append(station_cd)
+        logger.info("GuidanceService 초기화 완료")
 
-        self.kdtree = KDTree(np.array(station_coords))
+    def _build_station_index(self):
+        """
+        self.stations로 최근접 역 검색용 좌표 배열(SoA) 생성
+        역 수천 개 수준 -> KD-Tree 대신 배열 전체를 한 번에 계산하는 것이 더 빠름
+        self.stations가 바뀌면 다시 호출해야 함
+        """
+        # 역 정보가 바뀌면 경로 좌표 캐시도 무효
+        self._route_cache = OrderedDict()
+
+        self.station_cd_list = list(self.stations.keys())
+        # 역 정보를 한 번만 순회해 (N, 2) 버퍼를 바로 채움 (중간 리스트 생성 없음)
+        coords = np.fromiter(
+            ((info["lat"], info["lng"]) for info in self.stations.values()),
+            dtype=np.dtype((np.float64, 2)),
+            count=len(self.stations),
+        )
+        lats = coords[:, 0]
+        lons = coords[:, 1]
+
+        # 기준점(역 좌표 평균) 대비 오프셋을 float32로 저장
+        # 절대 좌표(127.xx)를 float32로 저장하면 해상도 ~0.7m, 오프셋은 수 cm 수준 유지
+        self._origin_lat = float(lats.mean()) if lats.size else 0.0
+        self._origin_lon = float(lons.mean()) if lons.size else 0.0
+        # (열 슬라이스는 strided -> 연산 결과는 새 contiguous 배열)
+        self._lats = (lats - self._origin_lat).astype(np.float32)
+        self._lons = (lons - self._origin_lon).astype(np.float32)
+
+        # 하버사인 거리 계산용 라디안 좌표 (역 좌표는 고정 -> 변환을 한 번만 수행)
+        coords_rad = np.radians(coords)
+        self._lat_rad = np.ascontiguousarray(coords_rad[:, 0])
+        self._lon_rad = np.ascontiguousarray(coords_rad[:, 1])
+        # equirectangular 근사: 경도 차이에 cos(위도)를 곱해 실제 거리 비율 보정
+        self._cos_lats = np.cos(self._lat_rad).astype(np.float32)
+        self._codes = np.array(self.station_cd_list, dtype=object)
+        self._station_index = {cd: i for i, cd in enumerate(self.station_cd_list)}
+
+    def _get_route_geometry(
+        self, route_id: Optional[str], route_sequence: List[str]
+    ) -> RouteGeometry:
+        """
+        경로 상 역 코드, 경로 내 위치, 라디안 좌표, 누적 거리 배열 (역 정보가 없는 역은 제외)
+        GPS 업데이트마다 역 정보 조회/route_sequence.index()를 반복하지 않도록 route_id별로 캐싱
+        같은 route_id라도 route_sequence가 다르면 다시 생성
+        """
+        if route_id is not None:
+            with self._route_cache_lock:
+                cached = self._route_cache.get(route_id)
+                if cached is not None and cached[0] == route_sequence:
+                    self._route_cache.move_to_end(route_id)
+                    return cached[1]
+
+        positions = [
+            i for i, cd in enumerate(route_sequence) if cd in self._station_index
+        ]
+        station_cds = [route_sequence[i] for i in positions]
+        indices = np.fromiter(
+            (self._station_index[cd] for cd in station_cds),
+            dtype=np.intp,
+            count=len(station_cds),
+        )
+        lat_rad = self._lat_rad[indices]
+        lon_rad = self._lon_rad[indices]
+        geometry = RouteGeometry(
+            station_cds=station_cds,
+            positions=positions,
+            lat_rad=lat_rad,
+            lon_rad=lon_rad,
+            cum_distance=cumulative_distance_rad(lat_rad, lon_rad),
+        )
 
-        logger.info("GuidanceService 초기화 완료")
+        if route_id is not None:
+            with self._route_cache_lock:
+                self._route_cache[route_id] = (list(route_sequence), geometry)
+                self._route_cache.move_to_end(route_id)
+                if len(self._route_cache) > self.ROUTE_CACHE_MAX_SIZE:
+                    self._route_cache.popitem(last=False)
+
+        return geometry
 
     def get_navigation_guidance(
-        self, user_id: str, lat: float, lon: float
+        self,
+        user_id: str,
+        lat: float,
+        lon: float,
+        session: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         실시간 경로 안내 제공
@@ -56,6 +161,7 @@ class GuidanceService:
             user_id: 사용자 ID
             lat: 현재 위도
             lon: 현재 경도
+            session: 호출자가 이미 조회한 세션 (없으면 Redis에서 조회)
 
         Returns:
             안내 정보 딕셔너리
@@ -68,8 +174,9 @@ class GuidanceService:
         if not self._is_valid_location(lat, lon):
             raise InvalidLocationException(f"유효하지 않은 GPS 좌표: {lat}, {lon}")
 
-        # 세션 확인
-        session = self.redis_client.get_session(user_id)
+        # 세션 확인 (websocket 핸들러가 넘겨주면 Redis 재조회 생략)
+        if session is None:
+            session = self.redis_client.get_session(user_id)
         if not session:
             raise SessionNotFoundException("활성 세션이 없습니다")
 
@@ -83,26 +190,27 @@ class GuidanceService:
         transfer_info = session.get("transfer_info", [])
 
         logger.debug(
-            f"안내 계산: user={user_id}, current={current_station_cd}, route_len={len(route_sequence)}"
+            "안내 계산: user=%s, current=%s, route_len=%d",
+            user_id, current_station_cd, len(route_sequence),
         )
 
-        # 경로 상의 모든 역까지의 거리 계산
+        # 경로 상의 모든 역까지의 거리 계산 (numpy로 한 번에)
         min_distance = float('inf')
         nearest_route_station = None
 
-        for station_cd in route_sequence:
-            station_info = self.stations.get(station_cd)
-            if not station_info:
-                continue
-
-            distance = self.distance_calc.calculate_distance(
-                lat, lon,
-                station_info["lat"], station_info["lng"]
+        route = self._get_route_geometry(session.get("route_id"), route_sequence)
+        current_idx = -1
+        if route.station_cds:
+            # 역 좌표는 라디안으로 캐싱되어 있으므로 현재 위치만 변환
+            distances = self.distance_calc.distance_rad_one_side(
+                lat, lon, route.lat_rad, route.lon_rad
             )
-
-            if distance < min_distance:
-                min_distance = distance
-                nearest_route_station = station_cd
+            # argmin -> 최솟값이 여러 개면 경로 상 앞쪽 역 선택
+            nearest_idx = int(np.argmin(distances))
+            min_distance = float(distances[nearest_idx])
+            nearest_route_station = route.station_cds[nearest_idx]
+            # route_sequence 내 위치 (O(1), list.index 불필요)
+            current_idx = route.positions[nearest_idx]
 
         # Threshold 기반 경로 이탈 판단
         if min_distance > self.ROUTE_DEVIATION_THRESHOLD:
@@ -123,9 +231,7 @@ class GuidanceService:
 
         # 경로 유지: 가장 가까운 경로 상의 역 사용
         current_station_cd = nearest_route_station
-        try:
-            current_idx = route_sequence.index(current_station_cd)
-        except ValueError:
+        if current_idx < 0:
             # 발생하지 않아야 하지만 안전장치
             logger.error(f"경로 역 인덱스 찾기 실패: {current_station_cd}")
             return {"recalculate": True, "message": "경로 오류가 발생했습니다."}
@@ -155,73 +261,112 @@ class GuidanceService:
             distance = self.distance_calc.calculate_distance(
                 lat, lon, next_station_info["lat"], next_station_info["lng"]
             )
-
-            # 역 이름 조회
-            current_station_name = get_station_name_by_code(current_station_cd)
+            progress, remaining = self._route_progress(
+                route, nearest_idx, current_idx, len(route_sequence)
+            )
             next_station_name = next_station_info["name"]
 
-            # 진행률 계산
-            remaining = len(route_sequence) - current_idx - 1
-            progress = int((current_idx / (len(route_sequence) - 1)) * 100)
+            # 환승역 확인 (환승 상세 정보가 없으면 일반 안내)
+            transfer_detail = None
+            if next_station_cd in transfer_stations:
+                transfer_detail = next(
+                    (t for t in transfer_info if t[0] == next_station_cd), None
+                )
+
+            # 일반 안내도 같은 키 구성 유지 (websocket 핸들러가 itemgetter로 한 번에 추출)
+            from_line = to_line = None
+            if transfer_detail:
+                from_line, to_line = transfer_detail[1], transfer_detail[2]
+                # websocket의 message 필드에 안내 문구 전송
+                message = f"{next_station_name}에서 {from_line} → {to_line} 환승하세요"
+            else:
+                message = f"{next_station_name} 방향으로 이동 중 (약 {int(distance)}m)"
 
             guidance = {
                 "current_station": current_station_cd,
-                "current_station_name": current_station_name,
+                "current_station_name": get_station_name_by_code(current_station_cd),
                 "next_station": next_station_cd,
                 "next_station_name": next_station_name,
                 "distance_to_next": round(distance, 2),
                 "remaining_stations": remaining,
                 "route_id": session["route_id"],
                 "progress_percent": progress,
+                "is_transfer": transfer_detail is not None,
+                "transfer_from_line": from_line,
+                "transfer_to_line": to_line,
+                "message": message,
             }
 
-            # 환승역 확인
-            if next_station_cd in transfer_stations:
-                # 환승 상세 정보 찾기
-                transfer_detail = next(
-                    (t for t in transfer_info if t[0] == next_station_cd), None
-                )
-
-                if transfer_detail:
-                    from_line = transfer_detail[1]
-                    to_line = transfer_detail[2]
-
-                    guidance["is_transfer"] = True
-                    guidance["transfer_from_line"] = from_line
-                    guidance["transfer_to_line"] = to_line
-                    # websocket의 message 필드에 안내 문구 전송
-                    guidance["message"] = (
-                        f"{next_station_name}에서 {from_line} → {to_line} 환승하세요"
-                    )
-
-                    logger.info(
-                        f"환승 안내: user={user_id}, station={next_station_name}, {from_line}→{to_line}"
-                    )
-                else:
-                    guidance["is_transfer"] = False
-                    guidance["message"] = (
-                        f"{next_station_name} 방향으로 이동 중 (약 {int(distance)}m)"
-                    )
-            else:
-                guidance["is_transfer"] = False
-                guidance["message"] = (
-                    f"{next_station_name} 방향으로 이동 중 (약 {int(distance)}m)"
+            if transfer_detail:
+                logger.info(
+                    f"환승 안내: user={user_id}, station={next_station_name}, {from_line}→{to_line}"
                 )
 
-            # 세션에 현재 위치 업데이트
-            self.redis_client.update_location(user_id, current_station_cd)
+            # 세션에 현재 위치 업데이트 (역이 바뀌었거나 TTL 갱신이 필요할 때만 Redis 쓰기)
+            if self._needs_location_update(session, current_station_cd):
+                self.redis_client.update_location(user_id, current_station_cd)
 
             logger.debug(
-                f"안내 생성: user={user_id}, next={next_station_name}, dist={distance:.2f}m, progress={progress}%"
+                "안내 생성: user=%s, next=%s, dist=%.2fm, progress=%s%%",
+                user_id, next_station_name, distance, progress,
             )
 
             return guidance
 
         raise InvalidLocationException("경로가 올바르지 않습니다")
 
+    @staticmethod
+    def _needs_location_update(session: Dict[str, Any], current_station_cd: str) -> bool:
+        """
+        세션 위치 업데이트 필요 여부
+        같은 역에 머무는 동안은 Redis 쓰기 생략, 단 세션 만료를 막기 위해 TTL 절반이 지나면 갱신
+
+        Args:
+            session: 현재 세션 (get_session 결과)
+            current_station_cd: 현재 역 코드
+
+        Returns:
+            update_location 호출 필요 여부
+        """
+        if session.get("current_station") != current_station_cd:
+            return True
+
+        try:
+            last_update = datetime.fromisoformat(session["last_update"])
+        except (KeyError, TypeError, ValueError):
+            return True
+
+        elapsed = (datetime.now() - last_update).total_seconds()
+        return elapsed >= settings.SESSION_TTL_SECONDS / 2
+
+    @staticmethod
+    def _route_progress(
+        route: RouteGeometry, nearest_idx: int, current_idx: int, route_len: int
+    ) -> Tuple[int, int]:
+        """
+        경로 진행률(%)과 남은 역 수
+        진행률은 경로 누적 거리 기준 (역 간 거리가 달라도 실제 이동 비율 반영)
+        경로 길이가 0이면 (모든 역 좌표가 같은 경우 등) 역 개수 기준
+
+        Args:
+            route: 경로 좌표 정보 (_get_route_geometry)
+            nearest_idx: route.station_cds 내 현재 역 위치
+            current_idx: route_sequence 내 현재 역 위치
+            route_len: route_sequence 길이 (2 이상)
+
+        Returns:
+            (progress_percent, remaining_stations)
+        """
+        total = route.cum_distance[-1]
+        if total > 0:
+            progress = int(100 * route.cum_distance[nearest_idx] / total)
+        else:
+            progress = int((current_idx / (route_len - 1)) * 100)
+        return progress, route_len - current_idx - 1
+
     def find_nearest_station(self, lat: float, lon: float) -> str:
         """
-        현재 위치에서 가장 가까운 역 찾기 => KD-Tree 사용 : O(log N)
+        현재 위치에서 가장 가까운 역 찾기 => equirectangular 거리 + argmin : O(N) 1회 순회
 
         Args:
             lat: 위도
@@ -230,8 +375,41 @@ class GuidanceService:
         Returns:
             가장 가까운 역의 station_cd
         """
-        distance, index = self.kdtree.query([lat, lon])
-        return self.station_cd_list[index]
+        # 기준점 오프셋은 float64로 계산 후 float32 변환 (정밀도 손실 방지)
+        index = nearest_equirectangular(
+            np.float32(lat - self._origin_lat),
+            np.float32(lon - self._origin_lon),
+            self._lats,
+            self._lons,
+            self._cos_lats,
+        )
+        return self._codes[index]
+
+    def find_nearest_stations_batch(self, points) -> List[str]:
+        """
+        여러 위치의 최근접 역을 한 번에 찾기 (다수 사용자 위치, 경로 사전 계산 등)
+        위치 x 역 거리 행렬을 numpy로 계산 -> 위치마다 Python 호출하는 비용 제거
+
+        Args:
+            points: (M, 2) 형태의 [위도, 경도] 배열
+
+        Returns:
+            위치별 가장 가까운 역의 station_cd 리스트 (입력 순서)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result: List[str] = []
+
+        for start in range(0, len(points), self.NEAREST_BATCH_CHUNK_SIZE):
+            chunk = points[start : start + self.NEAREST_BATCH_CHUNK_SIZE]
+            qlat = (chunk[:, 0] - self._origin_lat).astype(np.float32)[:, None]
+            qlon = (chunk[:, 1] - self._origin_lon).astype(np.float32)[:, None]
+
+            dlat = self._lats - qlat
+            dlon = (self._lons - qlon) * self._cos_lats
+            indices = np.argmin(dlat * dlat + dlon * dlon, axis=1)
+            result.extend(self._codes[indices].tolist())
+
+        return result
 
     def find_nearest_station_name(self, lat: float, lon: float) -> str:
         """
@@ -253,20 +431,22 @@ class GuidanceService:
         서울 대략 범위:
         - 위도: 37.4 ~ 37.7
         - 경도: 126.8 ~ 127.2
-        """
 
+        비교 결과를 & 로 결합 -> GPS 업데이트마다 분기 없이 한 번에 평가
+        (체인 비교 a <= x <= b는 단락 평가로 분기하므로 비교를 하나씩 분리)
+        (NaN은 모든 비교가 False이므로 유효하지 않은 좌표로 처리)
+        """
         # 기본적인 GPS 범위 검증
-        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
-            return False
+        is_gps = (-90.0 <= lat) & (lat <= 90.0) & (-180.0 <= lon) & (lon <= 180.0)
 
         # 여유있게 서울 권역 검증
-        SEOUL_LAT_MIN, SEOUL_LAT_MAX = 36.0, 39.0
-        SEOUL_LON_MIN, SEOUL_LON_MAX = 126.4, 127.6
+        in_seoul = (
+            (SEOUL_LAT_MIN <= lat)
+            & (lat <= SEOUL_LAT_MAX)
+            & (SEOUL_LON_MIN <= lon)
+            & (lon <= SEOUL_LON_MAX)
+        )
 
-        if not (
-            SEOUL_LAT_MIN <= lat <= SEOUL_LAT_MAX
-            and SEOUL_LON_MIN <= lon <= SEOUL_LON_MAX
-        ):
+        if is_gps and not in_seoul:
             logger.warning(f"현재 지원하지 않는 지역입니다: lat={lat}, lon={lon}")
-            return False
-        return True
+        return bool(is_gps & in_seoul)
@@ -0,0 +1,70 @@
+# Redis 경로 캐시 앞단의 프로세스 로컬 캐시
+# 최근 조회된 경로는 Redis 왕복 없이 dict 조회로 반환 (cache-aside, TTL + LRU)
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+class LocalRouteCache:
+    """
+    프로세스 로컬 경로 캐시 (스레드풀에서 동시 호출 -> lock 사용)
+
+    반환값은 얕은 복사본: 핸들러가 route_data["route_id"]를 덮어써도 캐시 원본은 유지
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.ROUTE_LOCAL_CACHE_MAX_SIZE,
+        ttl_seconds: float = settings.ROUTE_LOCAL_CACHE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 경로 조회 (만료된 항목은 삭제 후 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+
+            expires_at, route_data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[cache_key]
+                return None
+
+            self._entries.move_to_end(cache_key)
+
+        return dict(route_data)
+
+    def put(self, cache_key: str, route_data: Dict[str, Any]):
+        """경로 저장 (가득 차면 가장 오래 사용하지 않은 항목부터 제거)"""
+        if not self.enabled:
+            return
+
+        entry = (time.monotonic() + self.ttl_seconds, dict(route_data))
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,130 @@
+# 위치 이력 배치 저장
+# GPS 업데이트마다 Celery 브로커에 task를 발행하지 않고 모아서 batch_save_locations로 한 번에 발행
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.tasks.tasks import batch_save_locations, save_location_history
+
+logger = logging.getLogger(__name__)
+
+
+class LocationHistoryBuffer:
+    """위치 이력 버퍼 (이벤트 루프 안에서만 append -> lock 불필요)"""
+
+    def __init__(self):
+        self.batch_size = settings.LOCATION_BATCH_SIZE
+        self.flush_interval = settings.LOCATION_FLUSH_INTERVAL_SECONDS
+        self.max_publish_retries = settings.LOCATION_PUBLISH_MAX_RETRIES
+
+        self._queue: deque = deque()
+        self._full = asyncio.Event()
+        # 배치 발행 연속 실패 횟수
+        self._publish_failures = 0
+
+        # flush 태스크
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def add(self, user_id: str, lat: float, lon: float, accuracy, route_id: str):
+        """
+        위치 이력 추가
+
+        flush 태스크가 없으면(lifespan 밖, 테스트 등) 기존처럼 건별 task 발행
+        """
+        if not self.running:
+            save_location_history.delay(user_id, lat, lon, accuracy, route_id)
+            return
+
+        # timestamp는 수신 시점 기준 (JSON 직렬화 가능한 ISO 문자열)
+        self._queue.append(
+            (user_id, lat, lon, accuracy, route_id, datetime.now().isoformat())
+        )
+        if len(self._queue) >= self.batch_size:
+            self._full.set()
+
+    async def start(self):
+        """(비동기)백그라운드 flush 태스크 시작"""
+        if self.running:
+            return
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            f"위치 이력 배치 저장 시작: batch_size={self.batch_size}, "
+            f"interval={self.flush_interval}s"
+        )
+
+    async def stop(self):
+        """(비동기)flush 태스크 중지 후 남은 이력 발행"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        # 발행 실패 시 flush가 배치를 되돌리므로 버퍼가 빌 때까지 반복
+        # (연속 실패가 max_publish_retries를 넘으면 폐기 -> 반드시 종료)
+        while self._queue:
+            await self.flush()
+        logger.info("위치 이력 배치 저장 중지됨")
+
+    async def flush(self):
+        """
+        (비동기)버퍼에 쌓인 이력을 batch_size 단위로 발행
+
+        발행 실패 시 배치를 버퍼 앞쪽에 되돌리고 중단 (다음 flush에서 재시도)
+        연속 실패가 max_publish_retries를 넘은 배치만 폐기
+        """
+        while self._queue:
+            n = min(len(self._queue), self.batch_size)
+            batch = [self._queue.popleft() for _ in range(n)]
+            try:
+                # delay()는 브로커(Redis)에 동기 발행 -> 스레드풀에서 실행
+                await run_in_threadpool(batch_save_locations.delay, batch)
+            except Exception as e:
+                self._publish_failures += 1
+                if self._publish_failures > self.max_publish_retries:
+                    self._publish_failures = 0
+                    logger.error(f"위치 이력 배치 발행 실패 ({len(batch)}건 유실): {e}")
+                    continue
+
+                # 순서 유지를 위해 역순으로 앞쪽에 추가
+                self._queue.extendleft(reversed(batch))
+                logger.warning(
+                    f"위치 이력 배치 발행 실패, 재시도 예정 "
+                    f"({self._publish_failures}/{self.max_publish_retries}): {e}"
+                )
+                return
+
+            self._publish_failures = 0
+
+    async def _flush_loop(self):
+        """(비동기)flush_interval마다 또는 batch_size가 차면 즉시 발행"""
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+
+# singleton instance
+_location_buffer: Optional[LocationHistoryBuffer] = None
+
+
+def get_location_buffer() -> LocationHistoryBuffer:
+    """LocationHistoryBuffer instance 반환"""
+    global _location_buffer
+    if _location_buffer is None:
+        _location_buffer = LocationHistoryBuffer()
+    return _location_buffer
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 
 from app.db.redis_client import RedisSessionManager
+from app.services.local_route_cache import LocalRouteCache
 from app.db.cache import (
     get_stations_dict,
     get_station_cd_by_name,
@@ -78,6 +79,9 @@ class PathfindingServiceCPP:
 
             self.redis_client = RedisSessionManager()
             logger.debug("   - Redis 클라이언트 초기화 완료")
+
+            # Redis 앞단 로컬 캐시 (최근 경로는 Redis 왕복 없이 반환)
+            self.local_route_cache = LocalRouteCache()
         except Exception as e:
             logger.error(f"❌ Python 캐시 로드 실패: {e}")
             logger.debug(f"   - 예외 타입: {type(e).__name__}")
@@ -375,8 +379,12 @@ class PathfindingServiceCPP:
             # 캐시 키 생성
             cache_key = f"route:cpp:{origin_cd}:{destination_cd}:{disability_type}"
 
-            # 캐시 확인
-            cached_result = self.redis_client.get_cached_route(cache_key)
+            # 캐시 확인 (로컬 캐시 -> Redis 순서)
+            cached_result = self.local_route_cache.get(cache_key)
+            if cached_result is None:
+                cached_result = self.redis_client.get_cached_route(cache_key)
+                if cached_result:
+                    self.local_route_cache.put(cache_key, cached_result)
 
             if cached_result:
                 elapsed_time = time.time() - start_time
@@ -472,7 +480,8 @@ class PathfindingServiceCPP:
                 "routes_returned": len(routes_info),
             }
 
-            # Redis 캐싱
+            # 로컬 + Redis 캐싱
+            self.local_route_cache.put(cache_key, result)
             cache_success = self.redis_client.cache_route(
                 cache_key, result, ttl=settings.ROUTE_CACHE_TTL_SECONDS
             )
@@ -606,6 +615,8 @@ class PathfindingServiceCPP:
                 return
 
             self.data_container.update_facility_scores(facility_rows)
+            # 점수가 바뀌면 로컬 캐시의 경로 순위도 달라질 수 있음
+            self.local_route_cache.clear()
             logger.info(f"✅ C++ 엔진 편의시설 점수 업데이트 완료")
         except Exception as e:
             logger.error(f"C++ 엔진 업데이트 중 오류 발생: {e}")
@@ -119,7 +119,7 @@ class RedisPubSubManager:
                 self.channel, json.dumps(payload, ensure_ascii=False)
             )
 
-            logger.debug(f"메시지 발행: user_id={user_id}, type={message.get('type')}")
+            logger.debug("메시지 발행: user_id=%s, type=%s", user_id, message.get("type"))
 
         except Exception as e:
             logger.error(f"메시지 발행 실패: {e}", exc_info=True)
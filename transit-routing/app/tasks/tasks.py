@@ -19,21 +19,18 @@ def save_location_history(self, user_id, lat, lon, accuracy, route_id):
         route_id: 경로 ID
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO user_location_history 
-            (user_id, latitude, longitude, accuracy, route_id, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """,
-            (user_id, lat, lon, accuracy, route_id, datetime.now()),
-        )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        # get_db_connection은 contextmanager -> with 블록 종료 시 pool에 반환
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO user_location_history 
+                    (user_id, latitude, longitude, accuracy, route_id, timestamp)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                """,
+                    (user_id, lat, lon, accuracy, route_id, datetime.now()),
+                )
+            conn.commit()
 
         logger.info(f"Location saved for user {user_id}: ({lat}, {lon})")
 
@@ -43,8 +40,8 @@ def save_location_history(self, user_id, lat, lon, accuracy, route_id):
         raise self.retry(exc=e, countdown=60)
 
 
-@celery.task()
-def batch_save_locations(location_batch):
+@celery.task(bind=True, max_retries=3)
+def batch_save_locations(self, location_batch):
     """
     위치 데이터 일괄 저장
 
@@ -56,27 +53,25 @@ def batch_save_locations(location_batch):
         return
 
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.executemany(
-            """
-            INSERT INTO user_location_history 
-            (user_id, latitude, longitude, accuracy, route_id, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """,
-            location_batch,
-        )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        # get_db_connection은 contextmanager -> with 블록 종료 시 pool에 반환
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.executemany(
+                    """
+                    INSERT INTO user_location_history 
+                    (user_id, latitude, longitude, accuracy, route_id, timestamp)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                """,
+                    location_batch,
+                )
+            conn.commit()
 
         logger.info(f"Batch saved {len(location_batch)} location records")
 
     except Exception as e:
-        logger.error(f"Batch save failed: {e}")
-        raise
+        logger.error(f"Batch save failed ({len(location_batch)} records): {e}")
+        # 재시도 (최대 3번, 60초 후) - 실패 시 배치 전체 유실 방지
+        raise self.retry(exc=e, countdown=60)
 
 
 @celery.task(bind=True, max_retries=3)
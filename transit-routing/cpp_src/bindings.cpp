@@ -1,5 +1,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <stdexcept>
 #include "engine.h"
 #include "data_loader.h"
 #include "utils.h"
@@ -32,10 +34,41 @@ std::vector<std::string> reconstruct_lines_wrapper(McRaptorEngine &engine, const
     return lines;
 }
 
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// 한 지점 -> 여러 지점 하버사인 거리 (numpy 배열 입출력, 라디안)
+DoubleArray haversine_many_rad_wrapper(double lat0, double lon0, DoubleArray lats, DoubleArray lons)
+{
+    if (lats.ndim() != 1 || lons.ndim() != 1 || lats.shape(0) != lons.shape(0))
+    {
+        throw std::invalid_argument("lats, lons must be 1-D arrays of the same length");
+    }
+
+    const auto n = static_cast<std::size_t>(lats.shape(0));
+    DoubleArray out(static_cast<py::ssize_t>(n));
+    const double *lat_ptr = lats.data();
+    const double *lon_ptr = lons.data();
+    double *out_ptr = out.mutable_data();
+
+    {
+        // 계산 중 GIL 해제
+        py::gil_scoped_release release;
+        PathfindingUtils::haversine_many_rad(lat0, lon0, lat_ptr, lon_ptr, out_ptr, n);
+    }
+    return out;
+}
+
 PYBIND11_MODULE(pathfinding_cpp, m)
 {
     m.doc() = "C++ McRaptor Engine";
 
+    m.def("haversine_many_rad", &haversine_many_rad_wrapper,
+          "한 지점에서 여러 지점까지의 하버사인 거리(meter), 라디안 입력",
+          py::arg("lat0"),
+          py::arg("lon0"),
+          py::arg("lats"),
+          py::arg("lons"));
+
     py::class_<Label>(m, "Label")
         .def_readonly("arrival_time", &Label::arrival_time)
         .def_readonly("transfers", &Label::transfers)
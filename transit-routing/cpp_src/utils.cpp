@@ -5,6 +5,23 @@
 
 namespace pathfinding
 {
+    // 하버사인 일괄 계산 (GuidanceService 경로 상 역까지의 거리)
+    void PathfindingUtils::haversine_many_rad(double lat0, double lon0,
+                                              const double *lats, const double *lons,
+                                              double *out, std::size_t n)
+    {
+        constexpr double R = 6371000.0;
+        const double cos_lat0 = std::cos(lat0);
+
+        for (std::size_t i = 0; i < n; ++i)
+        {
+            double s_lat = std::sin((lats[i] - lat0) * 0.5);
+            double s_lon = std::sin((lons[i] - lon0) * 0.5);
+            double a = s_lat * s_lat + cos_lat0 * std::cos(lats[i]) * s_lon * s_lon;
+            out[i] = 2.0 * R * std::asin(std::sqrt(a));
+        }
+    }
+
     // Direction 변환
     Direction PathfindingUtils::str_to_direction(const std::string &dir)
     {
@@ -1,5 +1,6 @@
 #pragma once
 #include <cmath>
+#include <cstddef>
 #include <string>
 #include <unordered_map>
 #include "types.h"
@@ -23,6 +24,12 @@ namespace pathfinding
             return R * c;
         }
 
+        // 한 지점 -> 여러 지점 하버사인 거리 (라디안 입력, meter)
+        // 분기 없는 단순 루프 -> Release(-O3 -march=native -ffast-math)에서 SIMD 자동 벡터화
+        static void haversine_many_rad(double lat0, double lon0,
+                                       const double *lats, const double *lons,
+                                       double *out, std::size_t n);
+
         static inline double normalize_score(double raw_score)
         {
             return 1.0 / (1.0 + std::exp(-0.3 * raw_score));
@@ -0,0 +1,30 @@
+-- refresh_tokens: 원본 refresh token 대신 SHA-256 digest 저장 + 사용자당 1행(upsert)
+-- 대상 코드: app/services/auth_service.py (save_refresh_token, verify_refresh_token)
+-- 요구사항: PostgreSQL 11+ (sha256 내장 함수)
+--
+-- 실행: psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f docs/migrations/001_refresh_tokens_token_hash.sql
+-- 새 코드 배포 전에 실행 (기존 스키마에서는 로그인/토큰 갱신 실패)
+
+BEGIN;
+
+-- 1. 사용자별 최신 토큰 1개만 유지 (ON CONFLICT (user_id) upsert 대상)
+DELETE FROM refresh_tokens t
+USING refresh_tokens newer
+WHERE t.user_id = newer.user_id
+  AND (t.expires_at, t.ctid) < (newer.expires_at, newer.ctid);
+
+ALTER TABLE refresh_tokens
+    ADD CONSTRAINT refresh_tokens_user_id_key UNIQUE (user_id);
+
+-- 2. token(원본 JWT) -> token_hash(BYTEA, 32byte)
+-- 기존 토큰도 digest로 변환 -> 배포 후 재로그인 없이 갱신 가능
+ALTER TABLE refresh_tokens ADD COLUMN token_hash BYTEA;
+
+UPDATE refresh_tokens
+SET token_hash = sha256(convert_to(token, 'UTF8'));
+
+ALTER TABLE refresh_tokens
+    ALTER COLUMN token_hash SET NOT NULL,
+    DROP COLUMN token;
+
+COMMIT;
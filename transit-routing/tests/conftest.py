@@ -0,0 +1,27 @@
+"""
+tests 공통 fixture
+"""
+
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session")
+def cpp_service():
+    """
+    테스트 세션 전체에서 공유하는 PathfindingServiceCPP 인스턴스
+
+    C++ 모듈 로드, 역 데이터 적재, Redis 연결은 세션당 한 번만 수행
+    """
+    # tests/test는 conftest에서 DB를 Mock으로 교체하므로 import는 fixture 안에서
+    from app.services.pathfinding_service_cpp import PathfindingServiceCPP
+
+    try:
+        service = PathfindingServiceCPP()
+        logger.info("PathfindingServiceCPP 초기화 성공")
+        return service
+    except RuntimeError as e:
+        pytest.skip(f"C++ 모듈을 사용할 수 없습니다: {e}")
@@ -2,12 +2,22 @@
 Pytest 설정 및 공통 Fixture
 """
 
+import asyncio
 import os
+import re
+import orjson
 import pytest
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import MagicMock, Mock
 
+# uvloop(libuv 기반 이벤트 루프)는 선택 의존성 -> 없으면(Windows 등) 기본 asyncio 루프 사용
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # 테스트 모드 환경 변수 설정 (모듈 임포트 전에 설정해야 함)
 os.environ['TESTING'] = 'true'
 
@@ -41,6 +51,14 @@ def pytest_configure(config):
     sys.modules['app.db.database'] = mock_database
 
 
+@pytest.fixture
+def event_loop():
+    """비동기 테스트용 이벤트 루프 (pytest-asyncio event_loop override, uvloop 우선)"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 @pytest.fixture
 def mock_redis_client():
     """Mock Redis 클라이언트"""
@@ -61,44 +79,63 @@ def mock_redis_session_manager(mocker):
     return mock_manager
 
 
-@pytest.fixture
+# 읽기 전용 샘플 데이터 (모듈 임포트 시 한 번만 생성, 수정이 필요하면 dict()로 복사)
+_SAMPLE_STATIONS = MappingProxyType({
+    "1000000100": {
+        "station_cd": "1000000100",
+        "name": "서울역",
+        "line": "1호선",
+        "lat": 37.5546788,
+        "lng": 126.9706188,
+    },
+    "2000000201": {
+        "station_cd": "2000000201",
+        "name": "강남역",
+        "line": "2호선",
+        "lat": 37.4979462,
+        "lng": 127.0276368,
+    },
+    "2000000202": {
+        "station_cd": "2000000202",
+        "name": "역삼역",
+        "line": "2호선",
+        "lat": 37.5003706,
+        "lng": 127.0363573,
+    },
+    "3000000301": {
+        "station_cd": "3000000301",
+        "name": "양재역",
+        "line": "3호선",
+        "lat": 37.4841611,
+        "lng": 127.0343323,
+    },
+})
+
+_STATION_NAME_MAP = MappingProxyType({
+    "서울역": "1000000100",
+    "강남역": "2000000201",
+    "역삼역": "2000000202",
+    "양재역": "3000000301",
+})
+
+_LINES = MappingProxyType({
+    "1호선": ["1000000100"],
+    "2호선": ["2000000201", "2000000202"],
+    "3호선": ["3000000301"],
+})
+
+
+@pytest.fixture(scope="session")
 def sample_stations():
-    """테스트용 샘플 역 데이터"""
-    return {
-        "1000000100": {
-            "station_cd": "1000000100",
-            "name": "서울역",
-            "line": "1호선",
-            "lat": 37.5546788,
-            "lng": 126.9706188,
-        },
-        "2000000201": {
-            "station_cd": "2000000201",
-            "name": "강남역",
-            "line": "2호선",
-            "lat": 37.4979462,
-            "lng": 127.0276368,
-        },
-        "2000000202": {
-            "station_cd": "2000000202",
-            "name": "역삼역",
-            "line": "2호선",
-            "lat": 37.5003706,
-            "lng": 127.0363573,
-        },
-        "3000000301": {
-            "station_cd": "3000000301",
-            "name": "양재역",
-            "line": "3호선",
-            "lat": 37.4841611,
-            "lng": 127.0343323,
-        },
-    }
+    """
+    테스트용 샘플 역 데이터 (세션 전체에서 공유하는 읽기 전용 view)
+    수정이 필요한 테스트는 dict(sample_stations)로 복사해서 사용
+    """
+    return _SAMPLE_STATIONS
 
 
-@pytest.fixture
-def sample_route_data():
-    """테스트용 샘플 경로 데이터"""
+def _build_sample_route_data():
+    """샘플 경로 데이터 생성 (호출마다 새 dict 반환)"""
     return {
         "origin": "서울역",
         "origin_cd": "1000000100",
@@ -155,8 +192,13 @@ def sample_route_data():
 
 
 @pytest.fixture
-def sample_session_data(sample_route_data):
-    """테스트용 샘플 세션 데이터"""
+def sample_route_data():
+    """테스트용 샘플 경로 데이터"""
+    return _build_sample_route_data()
+
+
+def _build_sample_session_data(sample_route_data):
+    """샘플 세션 데이터 생성 (호출마다 새 dict 반환)"""
     primary_route = sample_route_data["routes"][0]
     return {
         "route_id": sample_route_data["route_id"],
@@ -177,6 +219,30 @@ def sample_session_data(sample_route_data):
     }
 
 
+@pytest.fixture
+def sample_session_data(sample_route_data):
+    """테스트용 샘플 세션 데이터"""
+    return _build_sample_session_data(sample_route_data)
+
+
+@pytest.fixture(scope="module")
+def sample_session_json():
+    """
+    Redis에 저장된 형태의 샘플 세션 (리스트 필드도 JSON 문자열로 인코딩된 JSON 문자열)
+    문자열은 불변 -> 모듈 전체에서 한 번만 직렬화해서 공유
+    """
+    stored_data = _build_sample_session_data(_build_sample_route_data())
+    for field in [
+        "route_sequence",
+        "route_lines",
+        "transfer_stations",
+        "transfer_info",
+        "all_routes",
+    ]:
+        stored_data[field] = orjson.dumps(stored_data[field]).decode()
+    return orjson.dumps(stored_data).decode()
+
+
 @pytest.fixture
 def mock_db_connection():
     """Mock 데이터베이스 연결"""
@@ -184,22 +250,13 @@ def mock_db_connection():
     return mock
 
 
-@pytest.fixture
-def mock_cache(sample_stations):
-    """Mock 캐시"""
+@pytest.fixture(scope="session")
+def mock_cache():
+    """Mock 캐시 (읽기 전용 view, 모듈 전역에 설치할 때는 dict()로 복사)"""
     return {
-        "stations": sample_stations,
-        "station_name_map": {
-            "서울역": "1000000100",
-            "강남역": "2000000201",
-            "역삼역": "2000000202",
-            "양재역": "3000000301",
-        },
-        "lines": {
-            "1호선": ["1000000100"],
-            "2호선": ["2000000201", "2000000202"],
-            "3호선": ["3000000301"],
-        },
+        "stations": _SAMPLE_STATIONS,
+        "station_name_map": _STATION_NAME_MAP,
+        "lines": _LINES,
     }
 
 
@@ -224,6 +281,77 @@ def seoul_gps_coords():
 # 인증 관련 Fixtures
 # ============================================================
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """
+    테스트에서는 bcrypt cost를 최소값(4)으로 낮춤 (12 대비 2^8배 빠름)
+    세션 scope -> 세션 fixture에서 계산되는 해시에도 적용
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.auth.security.BCRYPT_ROUNDS", 4)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _jwt_hs256():
+    """
+    테스트용 JWT 설정 고정 (HS256 + 미리 정한 32byte secret)
+    환경 변수(.env)의 JWT 설정과 무관하게 대칭키 서명만 사용, 운영 설정에는 영향 없음
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core.config.settings.JWT_ALGORITHM", "HS256")
+        mp.setattr("app.core.config.settings.JWT_SECRET_KEY", "x" * 32)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_claims_cache():
+    """decode_token claims 캐시가 테스트 간에 공유되지 않도록 초기화"""
+    from app.auth.security import _CLAIMS_CACHE
+
+    _CLAIMS_CACHE.clear()
+    yield
+    _CLAIMS_CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def hash_cache():
+    """비밀번호 -> bcrypt 해시 캐시 (세션 전체 공유)"""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def cached_hash(hash_cache, tmp_path_factory, worker_id):
+    """
+    비밀번호별 bcrypt 해시를 한 번만 계산하여 재사용
+    해싱 자체를 검증하지 않는 테스트에서 사용
+    xdist 병렬 실행 시 워커 간 공유 디렉터리의 파일(FileLock)로 공유 -> 실행 전체에서 비밀번호당 1회 해싱
+    """
+    import hashlib
+    from filelock import FileLock
+    from app.auth.security import get_password_hash
+
+    # 단일 프로세스 실행(master)이면 프로세스 내 dict 캐시만 사용
+    shared_dir = None if worker_id == "master" else tmp_path_factory.getbasetemp().parent
+
+    def _hash(password):
+        if password in hash_cache:
+            return hash_cache[password]
+
+        if shared_dir is None:
+            hash_cache[password] = get_password_hash(password)
+        else:
+            key = hashlib.sha256(password.encode("utf-8")).hexdigest()[:16]
+            hash_file = shared_dir / f"pw-{key}.hash"
+            with FileLock(str(hash_file) + ".lock"):
+                if not hash_file.exists():
+                    hash_file.write_text(get_password_hash(password))
+            hash_cache[password] = hash_file.read_text()
+        return hash_cache[password]
+
+    return _hash
+
+
 @pytest.fixture
 def sample_user():
     """테스트용 샘플 사용자 데이터"""
@@ -260,16 +388,14 @@ def sample_inactive_user():
     )
 
 
-@pytest.fixture
-def sample_user_credentials():
-    """테스트용 사용자 자격증명"""
-    from app.auth.security import get_password_hash
-
+@pytest.fixture(scope="session")
+def sample_user_credentials(cached_hash):
+    """테스트용 사용자 자격증명 (bcrypt 해시는 세션 전체에서 한 번만 계산)"""
     plain_password = "testpassword123"
     return {
         "email": "test@example.com",
         "password": plain_password,
-        "password_hash": get_password_hash(plain_password),
+        "password_hash": cached_hash(plain_password),
         "wrong_password": "wrongpassword456"
     }
 
@@ -280,29 +406,193 @@ def sample_tokens(sample_user):
     from app.auth.security import create_access_token, create_refresh_token
 
     return {
-        "access_token": create_access_token(subject=str(sample_user.user_id)),
+        "access_token": create_access_token(subject=sample_user.user_id),
         "refresh_token": create_refresh_token(user_id=sample_user.user_id),
     }
 
 
 @pytest.fixture
-def mock_auth_db_cursor(mocker):
-    """인증 관련 DB 작업을 위한 Mock 커서"""
-    mock_conn = mocker.MagicMock()
-    mock_cursor = mocker.MagicMock()
+def dummy_tokens():
+    """
+    서명되지 않은 더미 토큰
+    토큰 생성/검증 함수를 patch하는 테스트에서 실제 JWT 서명 비용을 피하기 위해 사용
+    """
+    return {
+        "access_token": "dummy_access",
+        "refresh_token": "dummy_refresh",
+    }
+
+
+@pytest.fixture
+def mocked_db(mocker):
+    """
+    인증 서비스용 Mock DB 연결
+    return (mock_cursor, get_db_connection patcher)
+    """
+    import psycopg2.extensions
+
+    # spec 지정 -> psycopg2에 없는 속성 접근 시 즉시 AttributeError, 불필요한 child mock 생성 방지
+    mock_cursor = mocker.MagicMock(spec=psycopg2.extensions.cursor)
+    mock_conn = mocker.MagicMock(spec=psycopg2.extensions.connection)
 
     # Context manager 지원
-    mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-    mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-    mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-    mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
+    mock_conn.__enter__.return_value = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.__enter__.return_value = mock_cursor
 
     # 기본 동작 설정
     mock_cursor.fetchone.return_value = None
     mock_cursor.fetchall.return_value = []
     mock_cursor.rowcount = 0
 
-    return {
-        "connection": mock_conn,
-        "cursor": mock_cursor
-    }
+    patcher = mocker.patch(
+        "app.services.auth_service.get_db_connection", return_value=mock_conn
+    )
+    return mock_cursor, patcher
+
+
+# ============================================================
+# In-memory SQLite DB (인증 서비스 테스트용)
+# ============================================================
+
+_SQLITE_SCHEMA = """
+CREATE TABLE users (
+    user_id UUID PRIMARY KEY DEFAULT (gen_random_uuid()),
+    email TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    username TEXT,
+    disability_type TEXT,
+    is_active BOOLEAN NOT NULL DEFAULT 1,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP
+);
+CREATE TABLE refresh_tokens (
+    user_id UUID NOT NULL UNIQUE REFERENCES users(user_id),
+    token_hash BLOB NOT NULL,
+    expires_at TIMESTAMP NOT NULL
+);
+"""
+
+_SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _to_sqlite_param(value):
+    """psycopg2 파라미터 -> SQLite 호환 값 (UUID는 문자열, datetime은 UTC 문자열)"""
+    from uuid import UUID
+    from datetime import datetime, timezone
+
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(_SQLITE_TIMESTAMP_FORMAT)
+    return value
+
+
+class _SQLiteCursor:
+    """psycopg2 커서 인터페이스(%s placeholder, context manager)를 흉내내는 sqlite3 커서 래퍼"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._rows = []
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._cursor.close()
+
+    def execute(self, sql, params=()):
+        parts = sql.replace("NOW()", "CURRENT_TIMESTAMP").split("%s")
+        converted = [parts[0]]
+        values = []
+        for param, part in zip(params, parts[1:]):
+            if isinstance(param, (list, tuple)):
+                # "= ANY(%s)" (배열 파라미터) -> "IN (?, ?, ...)"
+                converted[-1] = re.sub(r"=\s*ANY\($", "IN (", converted[-1])
+                converted.append(", ".join("?" * len(param)) or "NULL")
+                values.extend(_to_sqlite_param(p) for p in param)
+            else:
+                converted.append("?")
+                values.append(_to_sqlite_param(param))
+            converted.append(part)
+
+        self._cursor.execute("".join(converted), values)
+        # RETURNING 결과를 미리 모두 읽어 statement를 종료 (commit 전에 완료되어야 함)
+        self._rows = self._cursor.fetchall()
+        self.rowcount = self._cursor.rowcount
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class _SQLiteConnection:
+    """get_db_connection()이 반환하는 psycopg2 connection 대체"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, cursor_factory=None):
+        # sqlite3.Row -> row[0] / row["column"] 모두 지원하므로 RealDictCursor도 그대로 대응
+        return _SQLiteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+
+@pytest.fixture(scope="session")
+def sqlite_conn():
+    """세션 전체에서 공유하는 in-memory SQLite 연결 (users, refresh_tokens 테이블)"""
+    import sqlite3
+    from uuid import UUID, uuid4
+    from datetime import datetime, timezone
+
+    # 컬럼 선언 타입 기준으로 User 도메인 타입에 맞게 변환
+    sqlite3.register_converter("UUID", lambda b: UUID(b.decode()))
+    sqlite3.register_converter("BOOLEAN", lambda b: bool(int(b)))
+    sqlite3.register_converter(
+        "TIMESTAMP",
+        lambda b: datetime.strptime(b.decode(), _SQLITE_TIMESTAMP_FORMAT).replace(
+            tzinfo=timezone.utc
+        ),
+    )
+
+    conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    conn.row_factory = sqlite3.Row
+    # PostgreSQL의 gen_random_uuid()와 같은 형식 (하이픈 포함 문자열)
+    conn.create_function("gen_random_uuid", 0, lambda: str(uuid4()))
+    conn.executescript(_SQLITE_SCHEMA)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch, sqlite_conn):
+    """
+    AuthService의 get_db_connection을 in-memory SQLite로 대체
+    실제 SQL 실행 경로를 검증, 테스트 종료 후 데이터 초기화
+    """
+    from contextlib import contextmanager
+
+    @contextmanager
+    def fake_get_db_connection():
+        yield _SQLiteConnection(sqlite_conn)
+
+    monkeypatch.setattr(
+        "app.services.auth_service.get_db_connection", fake_get_db_connection
+    )
+    yield sqlite_conn
+
+    sqlite_conn.rollback()
+    sqlite_conn.execute("DELETE FROM refresh_tokens")
+    sqlite_conn.execute("DELETE FROM users")
+    sqlite_conn.commit()
@@ -8,19 +8,30 @@
     python test/run_tests.py --file test_pathfinding_service.py  # 특정 파일만
 """
 
+import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
 
+import pytest
+
 
 def run_tests(args):
     """테스트 실행"""
     # 프로젝트 루트 디렉토리
     project_root = Path(__file__).parent.parent
 
+    # 테스트 경로는 명령어를 구성하기 전에 결정 (옵션 추가 후 cmd[-1]을 덮어쓰면 옵션 값이 바뀜)
+    test_path = "test/"
+    if args.file:
+        # 특정 파일만
+        test_path = f"test/{args.file}"
+        print(f"📁 {args.file} 파일만 테스트합니다...")
+
     # pytest 명령어 구성
-    cmd = ["pytest", "test/"]
+    cmd = ["pytest", test_path]
 
     if args.verbose:
         cmd.append("-v")
@@ -28,6 +39,8 @@ def run_tests(args):
     if args.fast:
         # 빠른 테스트만 (integration, slow 제외)
         cmd.extend(["-m", "not slow and not integration"])
+        # 반복 실행용 모드 -> --lf/--ff 캐시가 필요 없으므로 .pytest_cache 쓰기 생략
+        cmd.extend(["-p", "no:cacheprovider"])
         print("🏃 빠른 테스트만 실행합니다...")
 
     if args.cov:
@@ -35,15 +48,14 @@ def run_tests(args):
         cmd.extend(["--cov=app", "--cov-report=html", "--cov-report=term-missing"])
         print("📊 커버리지를 측정합니다...")
 
-    if args.file:
-        # 특정 파일만
-        cmd[-1] = f"test/{args.file}"
-        print(f"📁 {args.file} 파일만 테스트합니다...")
-
     if args.parallel:
-        # 병렬 실행
-        cmd.extend(["-n", str(args.parallel)])
+        # 병렬 실행 (파일 단위로 워커에 분배)
+        cmd.extend(["-n", str(args.parallel), "--dist=loadfile"])
         print(f"⚡ {args.parallel}개 프로세스로 병렬 실행합니다...")
+    elif not args.cov and _XDIST_AVAILABLE:
+        # 기본값: CPU 수만큼 병렬 실행
+        # (--cov는 단일 프로세스: xdist + coverage 조합은 combine 설정이 필요하므로 제외)
+        cmd.extend(["-n", "auto", "--dist=loadfile"])
 
     if args.keyword:
         # 키워드 필터링
@@ -54,11 +66,17 @@ def run_tests(args):
     print(f"\n실행 명령어: {' '.join(cmd)}\n")
     print("=" * 70)
 
-    result = subprocess.run(cmd, cwd=project_root)
+    if args.cov:
+        # coverage.py는 인터프리터 시작 시점에 훅을 걸어야 하므로 별도 프로세스로 실행
+        returncode = subprocess.run(cmd, cwd=project_root).returncode
+    else:
+        # 같은 인터프리터에서 실행하여 Python 기동 + 플러그인 로딩 비용 제거
+        os.chdir(project_root)
+        returncode = pytest.main(cmd[1:])
 
     # 결과 출력
     print("=" * 70)
-    if result.returncode == 0:
+    if returncode == 0:
         print("\n✅ 모든 테스트를 통과했습니다!")
         if args.cov:
             print("\n📊 커버리지 리포트: htmlcov/index.html")
@@ -67,46 +85,56 @@ def run_tests(args):
         sys.exit(1)
 
 
+# pytest-xdist 설치 여부 (미설치 시 기본 실행은 단일 프로세스)
+_XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# 테스트 파일 목록 (--file 오타를 pytest 실행 전에 걸러내기 위해 한 번만 계산)
+_TEST_FILES = sorted(p.name for p in Path(__file__).parent.glob("test_*.py"))
+
+# 파서는 모듈 로드 시 한 번만 구성하고 main() 호출마다 재사용
+_PARSER = argparse.ArgumentParser(description="Transit-Routing 테스트 실행")
+
+_PARSER.add_argument(
+    "-v", "--verbose",
+    action="store_true",
+    help="상세한 출력"
+)
+
+_PARSER.add_argument(
+    "--fast",
+    action="store_true",
+    help="빠른 테스트만 실행 (단위 테스트)"
+)
+
+_PARSER.add_argument(
+    "--cov",
+    action="store_true",
+    help="코드 커버리지 측정"
+)
+
+_PARSER.add_argument(
+    "--file",
+    type=str,
+    choices=_TEST_FILES,
+    metavar="FILE",
+    help="특정 테스트 파일만 실행 (예: test_pathfinding_service.py)"
+)
+
+_PARSER.add_argument(
+    "-n", "--parallel",
+    type=int,
+    help="병렬 실행 프로세스 수 (기본값: -n auto, pytest-xdist 필요)"
+)
+
+_PARSER.add_argument(
+    "-k", "--keyword",
+    type=str,
+    help="키워드로 테스트 필터링"
+)
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Transit-Routing 테스트 실행")
-
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="상세한 출력"
-    )
-
-    parser.add_argument(
-        "--fast",
-        action="store_true",
-        help="빠른 테스트만 실행 (단위 테스트)"
-    )
-
-    parser.add_argument(
-        "--cov",
-        action="store_true",
-        help="코드 커버리지 측정"
-    )
-
-    parser.add_argument(
-        "--file",
-        type=str,
-        help="특정 테스트 파일만 실행 (예: test_pathfinding_service.py)"
-    )
-
-    parser.add_argument(
-        "-n", "--parallel",
-        type=int,
-        help="병렬 실행 프로세스 수 (pytest-xdist 필요)"
-    )
-
-    parser.add_argument(
-        "-k", "--keyword",
-        type=str,
-        help="키워드로 테스트 필터링"
-    )
-
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     print("🧪 Transit-Routing 테스트 실행")
     print("=" * 70)
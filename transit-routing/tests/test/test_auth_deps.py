@@ -4,35 +4,40 @@ app/api/deps.py의 FastAPI 의존성 함수 테스트
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 from fastapi import HTTPException
-from uuid import UUID
 
 from app.api.deps import get_current_user, get_current_active_user
 
 
+@pytest.fixture
+def deps_mocks(mocker):
+    """decode_token / AuthService.get_user_by_id를 한 번에 patch"""
+    return SimpleNamespace(
+        decode=mocker.patch("app.api.deps.decode_token"),
+        get_user=mocker.patch("app.api.deps.AuthService.get_user_by_id"),
+    )
+
+
 class TestGetCurrentUser:
     """Optional 인증 의존성 테스트 (get_current_user)"""
 
-    @patch('app.api.deps.decode_token')
-    @patch('app.api.deps.AuthService.get_user_by_id')
     async def test_get_current_user_with_valid_token(
         self,
-        mock_get_user,
-        mock_decode,
+        deps_mocks,
         sample_user,
-        sample_tokens
+        dummy_tokens
     ):
         """유효한 토큰으로 사용자 조회 - 성공"""
         # Given
-        mock_decode.return_value = {
+        deps_mocks.decode.return_value = {
             "sub": str(sample_user.user_id),
             "type": "access"
         }
-        mock_get_user.return_value = sample_user
+        deps_mocks.get_user.return_value = sample_user
 
         # When
-        user = await get_current_user(token=sample_tokens["access_token"])
+        user = await get_current_user(token=dummy_tokens["access_token"])
 
         # Then
         assert user is not None
@@ -47,11 +52,10 @@ class TestGetCurrentUser:
         # Then
         assert user is None
 
-    @patch('app.api.deps.decode_token')
-    async def test_get_current_user_with_invalid_token(self, mock_decode):
+    async def test_get_current_user_with_invalid_token(self, deps_mocks):
         """잘못된 토큰 - None 반환"""
         # Given
-        mock_decode.return_value = None  # 디코딩 실패
+        deps_mocks.decode.return_value = None  # 디코딩 실패
 
         # When
         user = await get_current_user(token="invalid_token")
@@ -59,11 +63,10 @@ class TestGetCurrentUser:
         # Then
         assert user is None
 
-    @patch('app.api.deps.decode_token')
-    async def test_get_current_user_with_refresh_token(self, mock_decode, sample_user):
+    async def test_get_current_user_with_refresh_token(self, deps_mocks, sample_user):
         """Refresh 토큰으로 호출 - None 반환 (type 불일치)"""
         # Given
-        mock_decode.return_value = {
+        deps_mocks.decode.return_value = {
             "sub": str(sample_user.user_id),
             "type": "refresh"  # access가 아님
         }
@@ -74,16 +77,14 @@ class TestGetCurrentUser:
         # Then
         assert user is None
 
-    @patch('app.api.deps.decode_token')
-    @patch('app.api.deps.AuthService.get_user_by_id')
-    async def test_get_current_user_user_not_found(self, mock_get_user, mock_decode):
+    async def test_get_current_user_user_not_found(self, deps_mocks):
         """토큰은 유효하나 사용자가 DB에 없음 - None 반환"""
         # Given
-        mock_decode.return_value = {
+        deps_mocks.decode.return_value = {
             "sub": "12345678-1234-5678-1234-567812345678",
             "type": "access"
         }
-        mock_get_user.return_value = None  # DB에서 사용자 없음
+        deps_mocks.get_user.return_value = None  # DB에서 사용자 없음
 
         # When
         user = await get_current_user(token="valid_token")
@@ -91,11 +92,10 @@ class TestGetCurrentUser:
         # Then
         assert user is None
 
-    @patch('app.api.deps.decode_token')
-    async def test_get_current_user_with_expired_token(self, mock_decode):
+    async def test_get_current_user_with_expired_token(self, deps_mocks):
         """만료된 토큰 - None 반환"""
         # Given
-        mock_decode.return_value = None  # 만료된 토큰은 decode_token에서 None 반환
+        deps_mocks.decode.return_value = None  # 만료된 토큰은 decode_token에서 None 반환
 
         # When
         user = await get_current_user(token="expired_token")
@@ -147,25 +147,22 @@ class TestGetCurrentActiveUser:
 class TestDependencyIntegration:
     """의존성 함수 통합 테스트"""
 
-    @patch('app.api.deps.decode_token')
-    @patch('app.api.deps.AuthService.get_user_by_id')
     async def test_optional_to_required_flow(
         self,
-        mock_get_user,
-        mock_decode,
+        deps_mocks,
         sample_user,
-        sample_tokens
+        dummy_tokens
     ):
         """Optional → Required 의존성 체인 테스트"""
         # Given
-        mock_decode.return_value = {
+        deps_mocks.decode.return_value = {
             "sub": str(sample_user.user_id),
             "type": "access"
         }
-        mock_get_user.return_value = sample_user
+        deps_mocks.get_user.return_value = sample_user
 
         # When - Optional 의존성 호출
-        user_from_optional = await get_current_user(token=sample_tokens["access_token"])
+        user_from_optional = await get_current_user(token=dummy_tokens["access_token"])
 
         # Then - 사용자 객체 반환
         assert user_from_optional is not None
@@ -190,25 +187,22 @@ class TestDependencyIntegration:
 
         assert exc_info.value.status_code == 401
 
-    @patch('app.api.deps.decode_token')
-    @patch('app.api.deps.AuthService.get_user_by_id')
     async def test_inactive_user_through_chain(
         self,
-        mock_get_user,
-        mock_decode,
+        deps_mocks,
         sample_inactive_user,
-        sample_tokens
+        dummy_tokens
     ):
         """비활성 사용자가 Optional 통과 → Required에서 차단"""
         # Given
-        mock_decode.return_value = {
+        deps_mocks.decode.return_value = {
             "sub": str(sample_inactive_user.user_id),
             "type": "access"
         }
-        mock_get_user.return_value = sample_inactive_user
+        deps_mocks.get_user.return_value = sample_inactive_user
 
         # When - Optional 의존성
-        user_from_optional = await get_current_user(token=sample_tokens["access_token"])
+        user_from_optional = await get_current_user(token=dummy_tokens["access_token"])
 
         # Then - Optional은 비활성 사용자도 반환
         assert user_from_optional is not None
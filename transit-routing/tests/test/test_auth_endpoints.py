@@ -4,7 +4,7 @@ app/api/v1/endpoints/auth.py의 HTTP API 엔드포인트 테스트
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
 from fastapi.testclient import TestClient
 from uuid import UUID
 
@@ -65,7 +65,7 @@ class TestRegisterEndpoint:
         assert response.status_code == 400
         assert "이미 사용 중인 이메일" in response.json()["detail"]
 
-    def test_register_invalid_email_format(self):
+    def test_register_invalid_email_format(self, client):
         """회원가입 - 잘못된 이메일 형식 (422 Validation Error)"""
         # Given
         invalid_email = "not-an-email"
@@ -82,7 +82,7 @@ class TestRegisterEndpoint:
         # Then
         assert response.status_code == 422  # Pydantic validation error
 
-    def test_register_password_too_short(self):
+    def test_register_password_too_short(self, client):
         """회원가입 - 비밀번호 너무 짧음 (422 Validation Error)"""
         # Given
         short_password = "short"
@@ -99,7 +99,7 @@ class TestRegisterEndpoint:
         # Then
         assert response.status_code == 422
 
-    def test_register_invalid_disability_type(self):
+    def test_register_invalid_disability_type(self, client):
         """회원가입 - 잘못된 disability_type (422 Validation Error)"""
         # Given
         invalid_disability_type = "INVALID"
@@ -182,7 +182,7 @@ class TestLoginEndpoint:
         assert response.status_code == 400
         assert "만료된 사용자" in response.json()["detail"]
 
-    def test_login_missing_credentials(self):
+    def test_login_missing_credentials(self, client):
         """로그인 - 자격증명 누락 (422 Validation Error)"""
         # When
         response = client.post(
@@ -196,12 +196,12 @@ class TestLoginEndpoint:
     @patch('app.api.v1.endpoints.auth.AuthService.authenticate_user')
     @patch('app.api.v1.endpoints.auth.create_access_token')
     @patch('app.api.v1.endpoints.auth.create_refresh_token')
-    def test_login_token_generation(self, mock_refresh, mock_access, mock_authenticate, sample_user, client):
+    def test_login_token_generation(self, mock_refresh, mock_access, mock_authenticate, sample_user, dummy_tokens, client):
         """로그인 - 토큰 생성 확인"""
         # Given
         mock_authenticate.return_value = sample_user
-        mock_access.return_value = "access_token_123"
-        mock_refresh.return_value = "refresh_token_456"
+        mock_access.return_value = dummy_tokens["access_token"]
+        mock_refresh.return_value = dummy_tokens["refresh_token"]
 
         # When
         response = client.post(
@@ -214,7 +214,7 @@ class TestLoginEndpoint:
 
         # Then
         assert response.status_code == 200
-        mock_access.assert_called_once_with(subject=str(sample_user.user_id))
+        mock_access.assert_called_once_with(subject=sample_user.user_id)
         mock_refresh.assert_called_once_with(sample_user.user_id)
 
 
@@ -261,7 +261,7 @@ class TestRefreshEndpoint:
         assert response.status_code == 401
         assert "Invalid refresh token" in response.json()["detail"]
 
-    def test_refresh_missing_token(self):
+    def test_refresh_missing_token(self, client):
         """토큰 갱신 - 토큰 누락 (422 Validation Error)"""
         # When
         response = client.post(
@@ -275,12 +275,12 @@ class TestRefreshEndpoint:
     @patch('app.api.v1.endpoints.auth.AuthService.verify_refresh_token')
     @patch('app.api.v1.endpoints.auth.create_access_token')
     @patch('app.api.v1.endpoints.auth.create_refresh_token')
-    def test_refresh_generates_new_tokens(self, mock_new_refresh, mock_new_access, mock_verify, sample_user, client):
+    def test_refresh_generates_new_tokens(self, mock_new_refresh, mock_new_access, mock_verify, sample_user, dummy_tokens, client):
         """토큰 갱신 - 새로운 토큰 쌍 생성"""
         # Given
         mock_verify.return_value = sample_user.user_id
-        mock_new_access.return_value = "new_access_token"
-        mock_new_refresh.return_value = "new_refresh_token"
+        mock_new_access.return_value = dummy_tokens["access_token"]
+        mock_new_refresh.return_value = dummy_tokens["refresh_token"]
 
         # When
         response = client.post(
@@ -293,8 +293,8 @@ class TestRefreshEndpoint:
         # Then
         assert response.status_code == 200
         data = response.json()
-        assert data["access_token"] == "new_access_token"
-        assert data["refresh_token"] == "new_refresh_token"
+        assert data["access_token"] == dummy_tokens["access_token"]
+        assert data["refresh_token"] == dummy_tokens["refresh_token"]
 
     @patch('app.api.v1.endpoints.auth.AuthService.verify_refresh_token')
     def test_refresh_expired_token(self, mock_verify, client):
@@ -319,7 +319,7 @@ class TestLogoutEndpoint:
 
     @patch('app.api.v1.endpoints.auth.get_current_active_user')
     @patch('app.api.v1.endpoints.auth.AuthService.revoke_refresh_tokens')
-    def test_logout_success(self, mock_revoke, mock_get_user, sample_user, sample_tokens, client):
+    def test_logout_success(self, mock_revoke, mock_get_user, sample_user, dummy_tokens, client):
         """로그아웃 - 성공 (200 OK)"""
         # Given
         mock_get_user.return_value = sample_user
@@ -328,7 +328,7 @@ class TestLogoutEndpoint:
         response = client.post(
             "/api/v1/auth/logout",
             headers={
-                "Authorization": f"Bearer {sample_tokens['access_token']}"
+                "Authorization": f"Bearer {dummy_tokens['access_token']}"
             }
         )
 
@@ -357,7 +357,7 @@ class TestLogoutEndpoint:
 
     @patch('app.api.v1.endpoints.auth.get_current_active_user')
     @patch('app.api.v1.endpoints.auth.AuthService.revoke_refresh_tokens')
-    def test_logout_revokes_all_tokens(self, mock_revoke, mock_get_user, sample_user, sample_tokens, client):
+    def test_logout_revokes_all_tokens(self, mock_revoke, mock_get_user, sample_user, dummy_tokens, client):
         """로그아웃 - 모든 리프레시 토큰 철회 확인"""
         # Given
         mock_get_user.return_value = sample_user
@@ -366,7 +366,7 @@ class TestLogoutEndpoint:
         client.post(
             "/api/v1/auth/logout",
             headers={
-                "Authorization": f"Bearer {sample_tokens['access_token']}"
+                "Authorization": f"Bearer {dummy_tokens['access_token']}"
             }
         )
 
@@ -378,7 +378,7 @@ class TestGetMeEndpoint:
     """현재 사용자 정보 조회 엔드포인트 테스트"""
 
     @patch('app.api.v1.endpoints.auth.get_current_active_user')
-    def test_get_me_success(self, mock_get_user, sample_user, sample_tokens, client):
+    def test_get_me_success(self, mock_get_user, sample_user, dummy_tokens, client):
         """사용자 정보 조회 - 성공 (200 OK)"""
         # Given
         mock_get_user.return_value = sample_user
@@ -387,7 +387,7 @@ class TestGetMeEndpoint:
         response = client.get(
             "/api/v1/auth/me",
             headers={
-                "Authorization": f"Bearer {sample_tokens['access_token']}"
+                "Authorization": f"Bearer {dummy_tokens['access_token']}"
             }
         )
 
@@ -439,23 +439,19 @@ class TestGetMeEndpoint:
 class TestAuthenticationFlow:
     """전체 인증 플로우 통합 테스트"""
 
-    @patch('app.api.v1.endpoints.auth.AuthService.email_exists')
-    @patch('app.api.v1.endpoints.auth.AuthService.create_user')
-    @patch('app.api.v1.endpoints.auth.AuthService.authenticate_user')
-    @patch('app.api.v1.endpoints.auth.AuthService.save_refresh_token')
-    def test_full_registration_and_login_flow(
-        self,
-        mock_save_token,
-        mock_authenticate,
-        mock_create_user,
-        mock_email_exists,
-        sample_user
-    ):
+    @patch.multiple(
+        'app.api.v1.endpoints.auth.AuthService',
+        email_exists=DEFAULT,
+        create_user=DEFAULT,
+        authenticate_user=DEFAULT,
+        save_refresh_token=DEFAULT,
+    )
+    def test_full_registration_and_login_flow(self, sample_user, client, **mocks):
         """회원가입 → 로그인 전체 플로우"""
         # Given
-        mock_email_exists.return_value = False
-        mock_create_user.return_value = sample_user
-        mock_authenticate.return_value = sample_user
+        mocks["email_exists"].return_value = False
+        mocks["create_user"].return_value = sample_user
+        mocks["authenticate_user"].return_value = sample_user
 
         # When - 회원가입
         register_response = client.post(
@@ -3,38 +3,32 @@
 app/services/auth_service.py의 사용자 관리 및 인증 로직 테스트
 """
 
+import hashlib
 import pytest
-from unittest.mock import patch, MagicMock
-from uuid import UUID
+from unittest.mock import patch
+from uuid import UUID, uuid4
 from datetime import datetime, timezone, timedelta
 
 from app.services.auth_service import AuthService
-from app.auth.security import get_password_hash, create_refresh_token
+from app.core.config import settings
+from app.auth.security import verify_password, create_refresh_token
+
+
+def _insert_user(conn, email: str, password_hash: str) -> UUID:
+    """테스트용 사용자 행을 직접 추가하고 user_id 반환"""
+    row = conn.execute(
+        "INSERT INTO users (email, password_hash, username) VALUES (?, ?, ?) RETURNING user_id",
+        (email, password_hash, "testuser"),
+    ).fetchone()
+    conn.commit()
+    return row["user_id"]
 
 
 class TestUserCreation:
     """사용자 생성 테스트"""
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_create_user_success(self, mock_get_conn, sample_user, mocker):
+    def test_create_user_success(self, sqlite_db):
         """사용자 생성 - 성공"""
-        # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_cursor.fetchone.return_value = (
-            str(sample_user.user_id),
-            sample_user.email,
-            sample_user.username,
-            sample_user.disability_type,
-            sample_user.is_active,
-            sample_user.created_at
-        )
-        mock_get_conn.return_value = mock_conn
-
         # When
         user = AuthService.create_user(
             email="test@example.com",
@@ -45,55 +39,45 @@ class TestUserCreation:
 
         # Then
         assert user is not None
-        assert user.email == sample_user.email
-        assert user.username == sample_user.username
-        mock_cursor.execute.assert_called_once()
-
-    @patch('app.services.auth_service.get_db_connection')
-    def test_create_user_password_hashed(self, mock_get_conn, mocker):
-        """사용자 생성 시 비밀번호 해싱 확인"""
+        assert isinstance(user.user_id, UUID)
+        assert user.email == "test@example.com"
+        assert user.username == "testuser"
+        assert user.is_active is True
+        assert user.last_login is None
+
+        row = sqlite_db.execute(
+            "SELECT email, password_hash FROM users WHERE user_id = ?",
+            (str(user.user_id),),
+        ).fetchone()
+        assert row["email"] == "test@example.com"
+        # 평문 대신 bcrypt 해시 저장
+        assert row["password_hash"] != "password123"
+        assert verify_password("password123", row["password_hash"])
+
+    def test_create_user_password_hashed(self, sqlite_db):
+        """사용자 생성 시 비밀번호 해싱 확인 (해시 값이 그대로 저장)"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_get_conn.return_value = mock_conn
-
         plain_password = "password123"
 
         # When
         with patch('app.services.auth_service.get_password_hash') as mock_hash:
             mock_hash.return_value = "hashed_password"
-            AuthService.create_user(
+            user = AuthService.create_user(
                 email="test@example.com",
-                password=plain_password
+                password=plain_password,
+                username="testuser",
+                disability_type="PHY"
             )
 
-            # Then
-            mock_hash.assert_called_once_with(plain_password)
+        # Then
+        mock_hash.assert_called_once_with(plain_password)
+        row = sqlite_db.execute(
+            "SELECT password_hash FROM users WHERE user_id = ?", (str(user.user_id),)
+        ).fetchone()
+        assert row["password_hash"] == "hashed_password"
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_create_user_with_optional_fields(self, mock_get_conn, mocker):
+    def test_create_user_with_optional_fields(self, sqlite_db):
         """사용자 생성 - 선택 필드 포함"""
-        # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_cursor.fetchone.return_value = (
-            "12345678-1234-5678-1234-567812345678",
-            "test@example.com",
-            "testuser",
-            "VIS",
-            True,
-            datetime.now(timezone.utc)
-        )
-        mock_get_conn.return_value = mock_conn
-
         # When
         user = AuthService.create_user(
             email="test@example.com",
@@ -106,109 +90,67 @@ class TestUserCreation:
         assert user is not None
         assert user.username == "testuser"
         assert user.disability_type == "VIS"
+        row = sqlite_db.execute(
+            "SELECT disability_type FROM users WHERE user_id = ?", (str(user.user_id),)
+        ).fetchone()
+        assert row["disability_type"] == "VIS"
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_create_user_db_error(self, mock_get_conn, mocker):
-        """사용자 생성 - DB 에러 시 None 반환"""
+    def test_create_user_db_error(self, mocked_db):
+        """사용자 생성 - DB 에러는 호출자(엔드포인트)로 전파"""
         # Given
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(side_effect=Exception("DB Error"))
-        mock_get_conn.return_value = mock_conn
-
-        # When
-        user = AuthService.create_user(
-            email="test@example.com",
-            password="password123"
-        )
+        _, mock_get_conn = mocked_db
+        mock_get_conn.return_value.__enter__.side_effect = Exception("DB Error")
 
-        # Then
-        assert user is None
+        # When / Then
+        with pytest.raises(Exception, match="DB Error"):
+            AuthService.create_user(
+                email="test@example.com",
+                password="password123",
+                username="testuser",
+                disability_type="PHY"
+            )
 
 
 class TestUserAuthentication:
     """사용자 인증 테스트"""
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_authenticate_user_success(self, mock_get_conn, sample_user, sample_user_credentials, mocker):
+    def test_authenticate_user_success(self, sqlite_db, sample_user_credentials):
         """사용자 인증 - 성공"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        # 첫 번째 fetchone: 사용자 조회 (password_hash 포함)
-        mock_cursor.fetchone.return_value = (
-            str(sample_user.user_id),
-            sample_user.email,
-            sample_user_credentials["password_hash"],
-            sample_user.username,
-            sample_user.disability_type,
-            sample_user.is_active,
-            sample_user.created_at,
-            sample_user.last_login
-        )
-        mock_get_conn.return_value = mock_conn
+        created = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
 
         # When
         user = AuthService.authenticate_user(
-            email=sample_user.email,
+            email="test@example.com",
             password=sample_user_credentials["password"]
         )
 
         # Then
         assert user is not None
-        assert user.email == sample_user.email
-        assert user.user_id == sample_user.user_id
+        assert user.email == "test@example.com"
+        assert user.user_id == created
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_authenticate_user_wrong_password(self, mock_get_conn, sample_user, sample_user_credentials, mocker):
+    def test_authenticate_user_wrong_password(self, sqlite_db, sample_user_credentials):
         """사용자 인증 - 잘못된 비밀번호"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = (
-            str(sample_user.user_id),
-            sample_user.email,
-            sample_user_credentials["password_hash"],
-            sample_user.username,
-            sample_user.disability_type,
-            sample_user.is_active,
-            sample_user.created_at,
-            sample_user.last_login
-        )
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
 
         # When
         user = AuthService.authenticate_user(
-            email=sample_user.email,
+            email="test@example.com",
             password=sample_user_credentials["wrong_password"]
         )
 
         # Then
         assert user is None
+        # 검증 실패 시 last_login 갱신 없음
+        row = sqlite_db.execute(
+            "SELECT last_login FROM users WHERE user_id = ?", (str(user_id),)
+        ).fetchone()
+        assert row["last_login"] is None
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_authenticate_user_not_found(self, mock_get_conn, mocker):
+    def test_authenticate_user_not_found(self, sqlite_db):
         """사용자 인증 - 존재하지 않는 이메일"""
-        # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = None
-        mock_get_conn.return_value = mock_conn
-
         # When
         user = AuthService.authenticate_user(
             email="nonexistent@example.com",
@@ -218,56 +160,32 @@ class TestUserAuthentication:
         # Then
         assert user is None
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_authenticate_user_updates_last_login(self, mock_get_conn, sample_user, sample_user_credentials, mocker):
+    def test_authenticate_user_updates_last_login(self, sqlite_db, sample_user_credentials):
         """사용자 인증 시 last_login 업데이트 확인"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = (
-            str(sample_user.user_id),
-            sample_user.email,
-            sample_user_credentials["password_hash"],
-            sample_user.username,
-            sample_user.disability_type,
-            sample_user.is_active,
-            sample_user.created_at,
-            sample_user.last_login
-        )
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
 
         # When
-        AuthService.authenticate_user(
-            email=sample_user.email,
+        user = AuthService.authenticate_user(
+            email="test@example.com",
             password=sample_user_credentials["password"]
         )
 
         # Then
-        # execute가 2번 호출되어야 함: 1) 사용자 조회, 2) last_login 업데이트
-        assert mock_cursor.execute.call_count == 2
+        assert user.last_login is not None
+        row = sqlite_db.execute(
+            "SELECT last_login FROM users WHERE user_id = ?", (str(user_id),)
+        ).fetchone()
+        assert row["last_login"] == user.last_login
 
 
 class TestEmailCheck:
     """이메일 중복 확인 테스트"""
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_email_exists_true(self, mock_get_conn, mocker):
+    def test_email_exists_true(self, sqlite_db, sample_user_credentials):
         """이메일 존재 - True 반환"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = (1,)  # COUNT(*) = 1
-        mock_get_conn.return_value = mock_conn
+        _insert_user(sqlite_db, "existing@example.com", sample_user_credentials["password_hash"])
 
         # When
         exists = AuthService.email_exists("existing@example.com")
@@ -275,20 +193,8 @@ class TestEmailCheck:
         # Then
         assert exists is True
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_email_exists_false(self, mock_get_conn, mocker):
+    def test_email_exists_false(self, sqlite_db):
         """이메일 없음 - False 반환"""
-        # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = (0,)  # COUNT(*) = 0
-        mock_get_conn.return_value = mock_conn
-
         # When
         exists = AuthService.email_exists("new@example.com")
 
@@ -299,50 +205,21 @@ class TestEmailCheck:
 class TestGetUser:
     """사용자 조회 테스트"""
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_get_user_by_id_success(self, mock_get_conn, sample_user, mocker):
+    def test_get_user_by_id_success(self, sqlite_db, sample_user_credentials):
         """사용자 ID로 조회 - 성공"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = (
-            str(sample_user.user_id),
-            sample_user.email,
-            sample_user.username,
-            sample_user.disability_type,
-            sample_user.is_active,
-            sample_user.created_at,
-            sample_user.last_login
-        )
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
 
         # When
-        user = AuthService.get_user_by_id(sample_user.user_id)
+        user = AuthService.get_user_by_id(user_id)
 
         # Then
         assert user is not None
-        assert user.user_id == sample_user.user_id
-        assert user.email == sample_user.email
+        assert user.user_id == user_id
+        assert user.email == "test@example.com"
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_get_user_by_id_not_found(self, mock_get_conn, mocker):
+    def test_get_user_by_id_not_found(self, sqlite_db):
         """사용자 ID로 조회 - 없음"""
-        # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        mock_cursor.fetchone.return_value = None
-        mock_get_conn.return_value = mock_conn
-
         # When
         user = AuthService.get_user_by_id(UUID("00000000-0000-0000-0000-000000000000"))
 
@@ -353,63 +230,42 @@ class TestGetUser:
 class TestRefreshTokenManagement:
     """Refresh 토큰 관리 테스트"""
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_save_refresh_token_success(self, mock_get_conn, sample_user, mocker):
+    def test_save_refresh_token_success(self, sqlite_db, sample_user_credentials):
         """Refresh 토큰 저장 - 성공"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_get_conn.return_value = mock_conn
-
-        refresh_token = create_refresh_token(sample_user.user_id)
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
+        refresh_token = create_refresh_token(user_id)
 
         # When
-        AuthService.save_refresh_token(sample_user.user_id, refresh_token)
+        AuthService.save_refresh_token(user_id, refresh_token)
 
         # Then
-        # 2번 호출: 1) 기존 토큰 삭제, 2) 새 토큰 저장
-        assert mock_cursor.execute.call_count == 2
-
-    @patch('app.services.auth_service.get_db_connection')
-    def test_verify_refresh_token_valid(self, mock_get_conn, sample_user, mocker):
+        rows = sqlite_db.execute(
+            "SELECT token_hash, expires_at FROM refresh_tokens WHERE user_id = ?",
+            (str(user_id),),
+        ).fetchall()
+        assert len(rows) == 1
+        # JWT 원문 대신 SHA-256 digest(32byte) 저장
+        assert rows[0]["token_hash"] == hashlib.sha256(refresh_token.encode("utf-8")).digest()
+        assert rows[0]["expires_at"] > datetime.now(timezone.utc)
+
+    def test_verify_refresh_token_valid(self, sqlite_db, sample_user_credentials):
         """Refresh 토큰 검증 - 유효함"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        refresh_token = create_refresh_token(sample_user.user_id)
-        future_time = datetime.now(timezone.utc) + timedelta(days=7)
-        mock_cursor.fetchone.return_value = (str(sample_user.user_id), future_time)
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
+        refresh_token = create_refresh_token(user_id)
+        AuthService.save_refresh_token(user_id, refresh_token)
 
         # When
-        user_id = AuthService.verify_refresh_token(refresh_token)
+        verified = AuthService.verify_refresh_token(refresh_token)
 
         # Then
-        assert user_id == sample_user.user_id
+        assert verified == user_id
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_verify_refresh_token_not_in_db(self, mock_get_conn, sample_user, mocker):
+    def test_verify_refresh_token_not_in_db(self, sqlite_db, sample_user):
         """Refresh 토큰 검증 - DB에 없음 (화이트리스트 실패)"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
         refresh_token = create_refresh_token(sample_user.user_id)
-        mock_cursor.fetchone.return_value = None  # DB에 없음
-        mock_get_conn.return_value = mock_conn
 
         # When
         user_id = AuthService.verify_refresh_token(refresh_token)
@@ -417,27 +273,27 @@ class TestRefreshTokenManagement:
         # Then
         assert user_id is None
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_verify_refresh_token_expired(self, mock_get_conn, sample_user, mocker):
+    def test_verify_refresh_token_expired(self, sqlite_db, sample_user_credentials):
         """Refresh 토큰 검증 - 만료됨"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-
-        refresh_token = create_refresh_token(sample_user.user_id)
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
+        refresh_token = create_refresh_token(user_id)
         past_time = datetime.now(timezone.utc) - timedelta(days=1)  # 만료됨
-        mock_cursor.fetchone.return_value = (str(sample_user.user_id), past_time)
-        mock_get_conn.return_value = mock_conn
+        sqlite_db.execute(
+            "INSERT INTO refresh_tokens (user_id, token_hash, expires_at) VALUES (?, ?, ?)",
+            (
+                str(user_id),
+                hashlib.sha256(refresh_token.encode("utf-8")).digest(),
+                past_time.strftime("%Y-%m-%d %H:%M:%S"),
+            ),
+        )
+        sqlite_db.commit()
 
         # When
-        user_id = AuthService.verify_refresh_token(refresh_token)
+        verified = AuthService.verify_refresh_token(refresh_token)
 
         # Then
-        assert user_id is None
+        assert verified is None
 
     def test_verify_refresh_token_invalid_format(self):
         """Refresh 토큰 검증 - 잘못된 형식"""
@@ -454,7 +310,7 @@ class TestRefreshTokenManagement:
         """Refresh 토큰 검증 - Access 토큰 사용 (type 불일치)"""
         # Given
         from app.auth.security import create_access_token
-        access_token = create_access_token(subject=str(sample_user.user_id))
+        access_token = create_access_token(subject=sample_user.user_id)
 
         # When
         user_id = AuthService.verify_refresh_token(access_token)
@@ -462,47 +318,100 @@ class TestRefreshTokenManagement:
         # Then
         assert user_id is None
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_revoke_refresh_tokens_success(self, mock_get_conn, sample_user, mocker):
+    def test_revoke_refresh_tokens_success(self, sqlite_db, sample_user_credentials):
         """Refresh 토큰 철회 - 성공"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
+        refresh_token = create_refresh_token(user_id)
+        AuthService.save_refresh_token(user_id, refresh_token)
 
         # When
-        AuthService.revoke_refresh_tokens(sample_user.user_id)
+        AuthService.revoke_refresh_tokens(user_id)
 
         # Then
-        mock_cursor.execute.assert_called_once()
-        # DELETE 쿼리가 실행되었는지 확인
-        call_args = mock_cursor.execute.call_args[0]
-        assert "DELETE" in call_args[0]
+        count = sqlite_db.execute("SELECT COUNT(*) FROM refresh_tokens").fetchone()[0]
+        assert count == 0
+        assert AuthService.verify_refresh_token(refresh_token) is None
 
-    @patch('app.services.auth_service.get_db_connection')
-    def test_save_refresh_token_replaces_old(self, mock_get_conn, sample_user, mocker):
+    def test_save_refresh_token_replaces_old(self, sqlite_db, sample_user_credentials):
         """Refresh 토큰 저장 시 기존 토큰 대체 (단일 디바이스 정책)"""
         # Given
-        mock_cursor = mocker.MagicMock()
-        mock_conn = mocker.MagicMock()
-        mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = mocker.MagicMock(return_value=None)
-        mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=None)
-        mock_get_conn.return_value = mock_conn
+        user_id = _insert_user(sqlite_db, "test@example.com", sample_user_credentials["password_hash"])
+        # 만료 시각이 다른 토큰 (exp 차이로 서로 다른 JWT)
+        with patch.object(settings, "REFRESH_TOKEN_EXPIRE_DAYS", 1):
+            old_token = create_refresh_token(user_id)
+        new_token = create_refresh_token(user_id)
+        AuthService.save_refresh_token(user_id, old_token)
 
-        refresh_token = create_refresh_token(sample_user.user_id)
+        # When
+        AuthService.save_refresh_token(user_id, new_token)
+
+        # Then
+        count = sqlite_db.execute("SELECT COUNT(*) FROM refresh_tokens").fetchone()[0]
+        assert count == 1
+        assert AuthService.verify_refresh_token(old_token) is None
+        assert AuthService.verify_refresh_token(new_token) == user_id
+
+
+class TestBatchRefreshTokenVerification:
+    """Refresh 토큰 일괄 검증 테스트"""
+
+    def test_verify_refresh_tokens_single_query(self, mocked_db):
+        """토큰 10개 검증 - SELECT 한 번만 실행"""
+        # Given
+        mock_cursor, _ = mocked_db
+        user_ids = [uuid4() for _ in range(10)]
+        tokens = [create_refresh_token(user_id) for user_id in user_ids]
+        mock_cursor.fetchall.return_value = [
+            (hashlib.sha256(token.encode("utf-8")).digest(), str(user_id))
+            for token, user_id in zip(tokens, user_ids)
+        ]
+
+        # When
+        results = AuthService.verify_refresh_tokens(tokens)
+
+        # Then
+        assert results == user_ids
+        assert mock_cursor.execute.call_count == 1
+        assert "ANY" in mock_cursor.execute.call_args[0][0]
+
+    def test_verify_refresh_tokens_mixed(self, sqlite_db, sample_user_credentials):
+        """유효/미저장/만료/잘못된 토큰 혼합 - 입력 순서대로 결과 반환"""
+        # Given
+        password_hash = sample_user_credentials["password_hash"]
+        valid_user = _insert_user(sqlite_db, "valid@example.com", password_hash)
+        expired_user = _insert_user(sqlite_db, "expired@example.com", password_hash)
+
+        valid_token = create_refresh_token(valid_user)
+        AuthService.save_refresh_token(valid_user, valid_token)
+        unsaved_token = create_refresh_token(uuid4())
+        expired_token = create_refresh_token(expired_user)
+        sqlite_db.execute(
+            "INSERT INTO refresh_tokens (user_id, token_hash, expires_at) VALUES (?, ?, ?)",
+            (
+                str(expired_user),
+                hashlib.sha256(expired_token.encode("utf-8")).digest(),
+                (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            ),
+        )
+        sqlite_db.commit()
+
+        # When
+        results = AuthService.verify_refresh_tokens(
+            [unsaved_token, valid_token, "invalid.token.format", expired_token]
+        )
+
+        # Then
+        assert results == [None, valid_user, None, None]
+
+    def test_verify_refresh_tokens_skips_db_when_all_invalid(self, mocked_db):
+        """JWT 검증을 모두 통과하지 못하면 DB 조회 생략"""
+        # Given
+        mock_cursor, _ = mocked_db
 
         # When
-        AuthService.save_refresh_token(sample_user.user_id, refresh_token)
+        results = AuthService.verify_refresh_tokens(["invalid.token.format", ""])
 
         # Then
-        # 첫 번째 execute: DELETE (기존 토큰 삭제)
-        # 두 번째 execute: INSERT (새 토큰 저장)
-        assert mock_cursor.execute.call_count == 2
-        first_call = mock_cursor.execute.call_args_list[0][0][0]
-        assert "DELETE" in first_call
+        assert results == [None, None]
+        mock_cursor.execute.assert_not_called()
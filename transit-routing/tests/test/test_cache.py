@@ -2,6 +2,8 @@
 Cache 모듈 테스트
 """
 
+from collections import OrderedDict
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -52,23 +54,51 @@ class TestDataCache:
             assert station_cd is None or station_cd is not None
 
     @patch("app.db.cache._cache_init", True)
-    @patch("app.db.cache._stations_cache")
-    def test_get_station_name_by_code(self, mock_stations_cache, sample_stations):
+    @patch("app.db.cache._station_alias_cache", OrderedDict())
+    def test_get_station_cd_by_name_partial_match_cached(self, mock_cache):
+        """부분 일치 결과는 별칭으로 저장 -> 두 번째 조회는 전체 순회 없이 반환"""
+        name_map = MagicMock(wraps=dict(mock_cache["station_name_map"]))
+        name_map.get.side_effect = mock_cache["station_name_map"].get
+
+        with patch("app.db.cache._station_name_map_cache", name_map):
+            assert get_station_cd_by_name("서울") == "1000000100"
+            assert name_map.items.call_count == 1
+
+            assert get_station_cd_by_name("서울") == "1000000100"
+            assert name_map.items.call_count == 1
+
+    @patch("app.db.cache._cache_init", True)
+    @patch("app.db.cache._STATION_ALIAS_CACHE_MAX_SIZE", 2)
+    def test_get_station_cd_by_name_alias_cache_bounded(self, mock_cache):
+        """별칭 캐시는 최대 크기 유지, 역 이름보다 긴 입력은 저장하지 않음"""
+        alias_cache = OrderedDict()
+
+        with patch("app.db.cache._station_alias_cache", alias_cache), \
+             patch("app.db.cache._station_name_map_cache", dict(mock_cache["station_name_map"])):
+            for query in ["서울", "서울역1", "서울역2"]:
+                assert get_station_cd_by_name(query) == "1000000100"
+            assert list(alias_cache) == ["서울역1", "서울역2"]
+
+            assert get_station_cd_by_name("서울역" + "x" * 100) == "1000000100"
+            assert list(alias_cache) == ["서울역1", "서울역2"]
+
+    @patch("app.db.cache._cache_init", True)
+    def test_get_station_name_by_code(self, sample_stations):
         """역 코드로 역 이름 조회"""
-        import app.db.cache as cache_module
-        cache_module._stations_cache = sample_stations
+        name_by_cd = {cd: s["name"] for cd, s in sample_stations.items()}
 
-        station_name = get_station_name_by_code("1000000100")
+        with patch("app.db.cache._station_name_by_cd_cache", name_by_cd):
+            station_name = get_station_name_by_code("1000000100")
 
         assert station_name == "서울역"
 
     @patch("app.db.cache._cache_init", True)
     def test_get_station_name_by_code_not_found(self, sample_stations):
         """존재하지 않는 역 코드 조회"""
-        import app.db.cache as cache_module
-        cache_module._stations_cache = sample_stations
+        name_by_cd = {cd: s["name"] for cd, s in sample_stations.items()}
 
-        station_name = get_station_name_by_code("9999999999")
+        with patch("app.db.cache._station_name_by_cd_cache", name_by_cd):
+            station_name = get_station_name_by_code("9999999999")
 
         assert station_name == "9999999999"  # 코드를 그대로 반환
 
@@ -76,7 +106,7 @@ class TestDataCache:
     def test_get_lines_dict(self, mock_cache):
         """노선 딕셔너리 조회"""
         import app.db.cache as cache_module
-        cache_module._lines_cache = mock_cache["lines"]
+        cache_module._lines_cache = dict(mock_cache["lines"])
 
         lines = get_lines_dict()
 
@@ -88,7 +118,7 @@ class TestDataCache:
     def test_cache_persistence(self, sample_stations):
         """캐시 데이터 영속성 테스트"""
         import app.db.cache as cache_module
-        cache_module._stations_cache = sample_stations.copy()
+        cache_module._stations_cache = dict(sample_stations)
 
         # 첫 번째 조회
         stations1 = get_stations_dict()
@@ -103,7 +133,7 @@ class TestDataCache:
     def test_station_data_structure(self, sample_stations):
         """역 데이터 구조 확인"""
         import app.db.cache as cache_module
-        cache_module._stations_cache = sample_stations
+        cache_module._stations_cache = dict(sample_stations)
 
         stations = get_stations_dict()
         station = stations["1000000100"]
@@ -119,7 +149,7 @@ class TestDataCache:
     def test_lines_dict_structure(self, mock_cache):
         """노선 딕셔너리 구조 확인"""
         import app.db.cache as cache_module
-        cache_module._lines_cache = mock_cache["lines"]
+        cache_module._lines_cache = dict(mock_cache["lines"])
 
         lines = get_lines_dict()
 
@@ -142,3 +172,25 @@ class TestDataCache:
         assert isinstance(station["station_cd"], str)
         assert isinstance(station["name"], str)
         assert isinstance(station["line"], str)
+
+    def test_initialize_cache_builds_bidirectional_name_map(self, sample_stations):
+        """캐시 초기화 시 역 이름 <-> 역 코드 양방향 매핑 생성"""
+        import app.db.cache as cache_module
+
+        clear_cache()
+        try:
+            with patch.multiple(
+                "app.db.database",
+                get_all_stations=MagicMock(return_value=list(sample_stations.values())),
+                get_all_sections=MagicMock(return_value=[]),
+                get_all_transfer_station_conv_scores=MagicMock(return_value=[]),
+                get_all_facility_data=MagicMock(return_value=[]),
+                get_all_congestion_data=MagicMock(return_value=[]),
+            ):
+                cache_module.initialize_cache()
+
+            assert get_station_cd_by_name("강남역") == "2000000201"
+            assert get_station_name_by_code("2000000201") == "강남역"
+            assert len(cache_module._station_name_by_cd_cache) == len(sample_stations)
+        finally:
+            clear_cache()
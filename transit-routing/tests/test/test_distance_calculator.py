@@ -188,3 +188,69 @@ class TestDistanceCalculator:
 
         assert distance < (north_south + east_west)
         assert distance > max(north_south, east_west)
+
+    def test_calculate_distance_vector_matches_scalar(self, calculator):
+        """배열 거리 계산 결과가 스칼라 계산과 일치"""
+        lat, lon = 37.5546788, 126.9706188  # 서울역
+        lats = [37.4979462, 37.5003706, 37.5546788, 35.1796]
+        lons = [127.0276368, 127.0363573, 126.9706188, 129.0756]
+
+        distances = calculator.calculate_distance_vector(lat, lon, lats, lons)
+
+        assert distances.shape == (4,)
+        for distance, lat2, lon2 in zip(distances, lats, lons):
+            assert distance == pytest.approx(
+                calculator.calculate_distance(lat, lon, lat2, lon2)
+            )
+
+    def test_distance_rad_one_side_matches_scalar(self, calculator):
+        """라디안 역 좌표 입력 결과가 스칼라 계산과 일치"""
+        lat, lon = 37.5546788, 126.9706188  # 서울역
+        lats = [37.4979462, 37.5003706]
+        lons = [127.0276368, 127.0363573]
+
+        distances = calculator.distance_rad_one_side(
+            lat, lon, [math.radians(v) for v in lats], [math.radians(v) for v in lons]
+        )
+
+        for distance, lat2, lon2 in zip(distances, lats, lons):
+            assert distance == pytest.approx(
+                calculator.calculate_distance(lat, lon, lat2, lon2)
+            )
+
+
+def test_nearest_equirectangular_matches_argmin():
+    """최근접 index가 numpy argmin 결과와 일치"""
+    import numpy as np
+    from app.algorithms.distance_calculator import nearest_equirectangular
+
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(-0.2, 0.2, 500).astype(np.float32)
+    lons = rng.uniform(-0.3, 0.3, 500).astype(np.float32)
+    cos_lats = np.cos(np.radians(lats + 37.5)).astype(np.float32)
+
+    for qlat, qlon in rng.uniform(-0.2, 0.2, (20, 2)).astype(np.float32):
+        dlat = lats - qlat
+        dlon = (lons - qlon) * cos_lats
+        expected = int(np.argmin(dlat * dlat + dlon * dlon))
+
+        assert nearest_equirectangular(qlat, qlon, lats, lons, cos_lats) == expected
+
+
+def test_cumulative_distance_rad_matches_scalar_sum():
+    """누적 거리가 인접 역 간 거리 합과 일치 (첫 값 0, 점 1개면 [0])"""
+    import numpy as np
+    from app.algorithms.distance_calculator import cumulative_distance_rad
+
+    calculator = DistanceCalculator()
+    points = [(37.5546788, 126.9706188), (37.4979462, 127.0276368), (37.5003706, 127.0363573)]
+    lats = np.radians([p[0] for p in points])
+    lons = np.radians([p[1] for p in points])
+
+    cum = cumulative_distance_rad(lats, lons)
+
+    expected = [0.0]
+    for (lat1, lon1), (lat2, lon2) in zip(points, points[1:]):
+        expected.append(expected[-1] + calculator.calculate_distance(lat1, lon1, lat2, lon2))
+    assert cum == pytest.approx(expected)
+    assert cumulative_distance_rad(lats[:1], lons[:1]).tolist() == [0.0]
@@ -4,10 +4,13 @@ GuidanceService 테스트
 
 import pytest
 import numpy as np
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, Mock
-from scipy.spatial import KDTree
 
+from app.algorithms.distance_calculator import DistanceCalculator
 from app.services.guidance_service import GuidanceService
+from app.core.config import settings
 from app.core.exceptions import SessionNotFoundException, InvalidLocationException
 
 
@@ -20,32 +23,43 @@ class TestGuidanceService:
         mock = MagicMock()
         # 기본적으로 100m 거리 반환
         mock.calculate_distance.return_value = 100.0
+        mock.distance_rad_one_side.side_effect = (
+            lambda lat, lon, lats, lons: np.full(len(lats), 100.0)
+        )
         return mock
 
-    @pytest.fixture
-    def service(self, mock_redis_session_manager, mock_cache, mock_distance_calc):
-        """GuidanceService 인스턴스"""
+    @pytest.fixture(scope="module")
+    def shared_service(self, sample_stations):
+        """모듈 전체에서 공유하는 GuidanceService (역 좌표 배열은 한 번만 생성)"""
         with patch(
             "app.services.guidance_service.get_stations_dict"
         ) as mock_get_stations, patch(
-            "app.services.guidance_service.get_station_name_by_code"
-        ) as mock_get_name, patch(
             "app.services.guidance_service.DistanceCalculator"
-        ) as mock_calc_class:
-
-            mock_get_stations.return_value = mock_cache["stations"]
-            mock_get_name.side_effect = lambda cd: next(
-                (
-                    s["name"]
-                    for s in mock_cache["stations"].values()
-                    if s["station_cd"] == cd
-                ),
-                cd,
-            )
-            mock_calc_class.return_value = mock_distance_calc
+        ):
+            mock_get_stations.return_value = sample_stations
+            return GuidanceService(MagicMock())
 
-            service = GuidanceService(mock_redis_session_manager)
-            return service
+    @pytest.fixture
+    def service(self, shared_service, mock_redis_session_manager, mock_distance_calc):
+        """GuidanceService 인스턴스 (mock 의존성만 테스트마다 교체)"""
+        stations = shared_service.stations
+        shared_service.redis_client = mock_redis_session_manager
+        shared_service.distance_calc = mock_distance_calc
+
+        # 역 이름 조회는 DB 캐시 대신 샘플 역 정보 사용 (역 코드 -> 이름 dict, O(1))
+        cd_to_name = {s["station_cd"]: s["name"] for s in stations.values()}
+        with patch(
+            "app.services.guidance_service.get_station_name_by_code"
+        ) as mock_get_name:
+            mock_get_name.side_effect = lambda cd: cd_to_name.get(cd, cd)
+            yield shared_service
+
+        # 역 데이터를 바꾼 테스트 이후 원래 데이터와 검색용 배열 복원
+        if shared_service.stations is not stations:
+            shared_service.stations = stations
+            shared_service._build_station_index()
+        else:
+            shared_service._route_cache.clear()
 
     def test_service_initialization(self, service):
         """서비스 초기화 테스트"""
@@ -53,8 +67,9 @@ class TestGuidanceService:
         assert service.redis_client is not None
         assert service.distance_calc is not None
         assert service.stations is not None
-        assert service.kdtree is not None
-        assert isinstance(service.kdtree, KDTree)
+        assert len(service.station_cd_list) == len(service.stations)
+        assert service._lats.dtype == np.float32
+        assert service._lats.shape == service._lons.shape == service._cos_lats.shape
 
     def test_find_nearest_station(self, service, seoul_gps_coords):
         """가장 가까운 역 찾기 테스트"""
@@ -64,9 +79,22 @@ class TestGuidanceService:
 
         assert nearest is not None
         assert isinstance(nearest, str)
-        # KDTree가 가장 가까운 역을 반환하는지 확인
+        # 가장 가까운 역을 반환하는지 확인
         assert nearest in service.stations
 
+    def test_find_nearest_station_close_stations(self, service):
+        """수 m 간격의 인접 역도 구분 (float32 좌표 정밀도)"""
+        # 서울역 부근에 약 3m 간격으로 배치된 두 역
+        service.stations = {
+            "A": {"station_cd": "A", "name": "A", "lat": 37.5546788, "lng": 126.9706188},
+            "B": {"station_cd": "B", "name": "B", "lat": 37.5546788, "lng": 126.9706528},
+            "C": {"station_cd": "C", "name": "C", "lat": 37.4979462, "lng": 127.0276368},
+        }
+        service._build_station_index()
+
+        assert service.find_nearest_station(37.5546788, 126.9706200) == "A"
+        assert service.find_nearest_station(37.5546788, 126.9706520) == "B"
+
     def test_find_nearest_station_name(self, service, seoul_gps_coords):
         """가장 가까운 역 이름 찾기 테스트"""
         coords = seoul_gps_coords["valid"]["seoul_station"]
@@ -188,7 +216,8 @@ class TestGuidanceService:
     ):
         """환승역에서 안내"""
         # 환승 정보가 있는 경로 데이터 설정
-        session_with_transfer = sample_session_data.copy()
+        # sample_session_data는 테스트마다 새로 생성 -> 복사 없이 수정
+        session_with_transfer = sample_session_data
         session_with_transfer["route_sequence"] = ["1000000100", "2000000201"]
         session_with_transfer["transfer_stations"] = ["2000000201"]
         session_with_transfer["transfer_info"] = [["2000000201", "1호선", "2호선"]]
@@ -209,7 +238,7 @@ class TestGuidanceService:
             assert "환승" in guidance["message"]
 
     def test_get_navigation_guidance_progress_calculation(
-        self, service, seoul_gps_coords, mock_redis_session_manager, mocker
+        self, service, mock_redis_session_manager
     ):
         """진행률 계산 테스트"""
         # 5개 역이 있는 경로
@@ -230,7 +259,7 @@ class TestGuidanceService:
             station_cd: {
                 "station_cd": station_cd,
                 "name": f"역{station_cd[-1]}",
-                "lat": 37.0 + i * 0.01, # KDTree가 동일 좌표를 갖지 않도록 약간씩 다르게 설정
+                "lat": 37.0 + i * 0.01, # 역끼리 동일 좌표를 갖지 않도록 약간씩 다르게 설정
                 "lng": 127.0 + i * 0.01,
             }
             for i, station_cd in enumerate(["cd1", "cd2", "cd3", "cd4", "cd5"])
@@ -240,31 +269,37 @@ class TestGuidanceService:
         # 3. 서비스의 'self.stations'를 가짜 데이터로 직접 덮어쓰기
         service.stations = fake_stations_dict
 
-        # 4. 'self.stations'가 바뀌었으므로 KDTree와 리스트도 다시 빌드
-        station_coords = []
-        service.station_cd_list = []
-        for station_cd, info in service.stations.items():
-            station_coords.append([info["lat"], info["lng"]])
-            service.station_cd_list.append(station_cd)
-        service.kdtree = KDTree(np.array(station_coords))
+        # 4. 'self.stations'가 바뀌었으므로 검색용 좌표 배열도 다시 빌드
+        service._build_station_index()
         # ------------------------
 
         # 5. Redis Mock 설정
         mock_redis_session_manager.get_session.return_value = session
-        coords = seoul_gps_coords["valid"]["seoul_station"] # 이 좌표는 어차피 Mocking됨
 
-        # 6. 'find_nearest_station' Mock (현재 역)
-        #    (이제 service.kdtree가 "cd" 코드를 반환하므로 patch.object가 필요 없을 수도 있으나,
-        #     테스트의 일관성을 위해 "cd3"을 반환하도록 명시하는 것이 좋습니다.)
-        with patch.object(service, "find_nearest_station") as mock_find:
-            mock_find.return_value = "cd3" # 현재 역을 "cd3"으로 설정
+        # 6. 현재 위치 = cd3 좌표
+        #    경로 상 현재 역은 경로 역까지의 실제 거리로 결정 -> 거리 계산은 Mock 대신 실제 구현 사용
+        #    (Mock은 모든 역까지 100m를 반환해 항상 첫 역이 선택됨)
+        service.distance_calc = DistanceCalculator()
+        current = fake_stations_dict["cd3"]
+
+        # 7. 테스트 실행
+        guidance = service.get_navigation_guidance("user123", current["lat"], current["lng"])
 
-            # 7. 테스트 실행
-            guidance = service.get_navigation_guidance("user123", coords["lat"], coords["lon"])
+        # 8. 검증 (역 간 거리가 거의 같으므로 누적 거리 기준으로도 절반)
+        assert guidance["current_station"] == "cd3"
+        assert guidance["progress_percent"] == 50
+        assert guidance["remaining_stations"] == 2
 
-            # 8. 검증
-            assert guidance["progress_percent"] == 50
-            assert guidance["remaining_stations"] == 2
+    def test_route_progress(self, service):
+        """진행률은 누적 거리 기준, 남은 역 수는 역 개수 기준"""
+        # 역 간 거리 100m, 300m
+        route = SimpleNamespace(cum_distance=np.array([0.0, 100.0, 400.0]))
+        assert service._route_progress(route, 0, 0, 3) == (0, 2)
+        assert service._route_progress(route, 1, 1, 3) == (25, 1)
+
+        # 경로 길이가 0이면 역 개수 기준
+        route = SimpleNamespace(cum_distance=np.zeros(5))
+        assert service._route_progress(route, 2, 2, 5) == (50, 2)
 
     def test_get_navigation_guidance_updates_location(
         self, service, seoul_gps_coords, mock_redis_session_manager, sample_session_data
@@ -281,8 +316,79 @@ class TestGuidanceService:
             # update_location이 호출되었는지 확인
             mock_redis_session_manager.update_location.assert_called_once()
 
-    def test_kdtree_performance(self, service):
-        """KD-Tree 성능 테스트 (빠른 검색)"""
+    def test_get_navigation_guidance_skips_unchanged_location(
+        self, service, seoul_gps_coords, mock_redis_session_manager, sample_session_data
+    ):
+        """같은 역에 머무르고 최근에 갱신됐으면 위치 업데이트 생략"""
+        session = sample_session_data
+        session["current_station"] = session["route_sequence"][0]
+        session["last_update"] = datetime.now().isoformat()
+        mock_redis_session_manager.get_session.return_value = session
+        coords = seoul_gps_coords["valid"]["seoul_station"]
+
+        service.get_navigation_guidance("user123", coords["lat"], coords["lon"])
+
+        mock_redis_session_manager.update_location.assert_not_called()
+
+    def test_get_navigation_guidance_uses_given_session(
+        self, service, seoul_gps_coords, mock_redis_session_manager, sample_session_data
+    ):
+        """호출자가 세션을 넘기면 Redis 세션 재조회 생략"""
+        coords = seoul_gps_coords["valid"]["seoul_station"]
+
+        guidance = service.get_navigation_guidance(
+            "user123", coords["lat"], coords["lon"], session=sample_session_data
+        )
+
+        assert guidance["current_station"] == sample_session_data["route_sequence"][0]
+        mock_redis_session_manager.get_session.assert_not_called()
+
+    def test_needs_location_update(self, service):
+        """역 변경 또는 TTL 절반 경과 시에만 위치 업데이트"""
+        now = datetime.now()
+        session = {"current_station": "A", "last_update": now.isoformat()}
+
+        assert service._needs_location_update(session, "A") is False
+        assert service._needs_location_update(session, "B") is True
+
+        session["last_update"] = (
+            now - timedelta(seconds=settings.SESSION_TTL_SECONDS)
+        ).isoformat()
+        assert service._needs_location_update(session, "A") is True
+
+        del session["last_update"]
+        assert service._needs_location_update(session, "A") is True
+
+    def test_route_geometry_cached_by_route_id(self, service):
+        """같은 route_id의 경로 좌표 배열은 재사용, 경로가 바뀌면 다시 생성"""
+        route = list(service.stations.keys())[:3]
+
+        geometry1 = service._get_route_geometry("route-1", route)
+        geometry2 = service._get_route_geometry("route-1", list(route))
+
+        assert geometry1.station_cds == route
+        assert geometry2 is geometry1
+        assert geometry1.lat_rad[0] == pytest.approx(
+            np.radians(service.stations[route[0]]["lat"])
+        )
+
+        # 같은 route_id라도 경로가 다르면 새로 생성
+        geometry3 = service._get_route_geometry("route-1", route[:2])
+        assert geometry3.station_cds == route[:2]
+        assert geometry3 is not geometry1
+
+    def test_route_geometry_skips_unknown_stations(self, service):
+        """역 정보가 없는 역은 경로 좌표에서 제외, 경로 내 위치는 유지"""
+        known = list(service.stations.keys())[0]
+
+        geometry = service._get_route_geometry(None, ["9999999999", known])
+
+        assert geometry.station_cds == [known]
+        assert geometry.positions == [1]
+        assert geometry.lat_rad.shape == geometry.lon_rad.shape == (1,)
+
+    def test_find_nearest_station_performance(self, service):
+        """최근접 역 검색 성능 테스트 (GPS 업데이트마다 호출되는 단건 검색)"""
         import time
 
         coords = (37.5546788, 126.9706188)  # 서울역 좌표
@@ -296,6 +402,32 @@ class TestGuidanceService:
         # 100번 검색이 1초 이내에 완료되어야 함 (충분히 빠름)
         assert (end_time - start_time) < 1.0
 
+    def test_find_nearest_stations_batch_performance(self, service):
+        """일괄 최근접 역 검색 성능 테스트"""
+        import time
+
+        coords = (37.5546788, 126.9706188)  # 서울역 좌표
+
+        # 100개 위치를 한 번에 검색
+        start_time = time.time()
+        nearest = service.find_nearest_stations_batch(np.tile(coords, (100, 1)))
+        end_time = time.time()
+
+        assert len(nearest) == 100
+        # 100개 위치 검색이 1초 이내에 완료되어야 함
+        assert (end_time - start_time) < 1.0
+
+    def test_find_nearest_stations_batch_matches_single(self, service, seoul_gps_coords):
+        """일괄 검색 결과가 단건 검색과 일치 (입력 순서 유지)"""
+        points = [
+            (coords["lat"], coords["lon"])
+            for coords in seoul_gps_coords["valid"].values()
+        ]
+
+        nearest = service.find_nearest_stations_batch(points)
+
+        assert nearest == [service.find_nearest_station(lat, lon) for lat, lon in points]
+
     def test_distance_to_next_calculation(
         self,
         service,
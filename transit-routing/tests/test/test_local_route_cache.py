@@ -0,0 +1,67 @@
+"""
+LocalRouteCache 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.services.local_route_cache import LocalRouteCache
+
+
+class TestLocalRouteCache:
+    """LocalRouteCache 테스트 클래스"""
+
+    @pytest.fixture
+    def cache(self):
+        """LocalRouteCache 인스턴스 (최대 2개, TTL 60초)"""
+        return LocalRouteCache(max_size=2, ttl_seconds=60)
+
+    def test_get_miss(self, cache):
+        """저장되지 않은 키 조회"""
+        assert cache.get("route:cpp:A:B:PHY") is None
+
+    def test_put_and_get_returns_copy(self, cache, sample_route_data):
+        """조회 결과를 수정해도 캐시 원본은 유지"""
+        cache.put("route:cpp:A:B:PHY", sample_route_data)
+
+        first = cache.get("route:cpp:A:B:PHY")
+        first["route_id"] = "changed"
+
+        assert cache.get("route:cpp:A:B:PHY")["route_id"] == sample_route_data["route_id"]
+
+    def test_lru_eviction(self, cache):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache.put("a", {"n": 1})
+        cache.put("b", {"n": 2})
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.put("c", {"n": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"n": 1}
+        assert cache.get("c") == {"n": 3}
+        assert len(cache) == 2
+
+    def test_expired_entry(self, cache):
+        """TTL이 지난 항목은 None 반환 후 삭제"""
+        with patch("app.services.local_route_cache.time.monotonic", return_value=1000.0):
+            cache.put("a", {"n": 1})
+
+        with patch("app.services.local_route_cache.time.monotonic", return_value=1060.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        """TTL 0 -> 저장/조회 모두 비활성화"""
+        cache = LocalRouteCache(max_size=10, ttl_seconds=0)
+        cache.put("a", {"n": 1})
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache):
+        """전체 삭제"""
+        cache.put("a", {"n": 1})
+        cache.clear()
+
+        assert cache.get("a") is None
@@ -0,0 +1,93 @@
+"""
+LocationHistoryBuffer 테스트
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.services.location_history_buffer import LocationHistoryBuffer
+
+
+class TestLocationHistoryBuffer:
+    """LocationHistoryBuffer 테스트 클래스"""
+
+    @pytest.fixture
+    def tasks(self):
+        """Celery task Mock (브로커 발행 차단)"""
+        with patch("app.services.location_history_buffer.save_location_history") as single, \
+             patch("app.services.location_history_buffer.batch_save_locations") as batch:
+            yield {"single": single, "batch": batch}
+
+    @pytest.fixture
+    def buffer(self):
+        """LocationHistoryBuffer 인스턴스 (batch_size=3, flush 주기 10ms)"""
+        buffer = LocationHistoryBuffer()
+        buffer.batch_size = 3
+        buffer.flush_interval = 0.01
+        return buffer
+
+    def test_add_without_flush_task_sends_single_task(self, buffer, tasks):
+        """flush 태스크 미실행 - 건별 task 발행 (기존 동작)"""
+        buffer.add("user123", 37.5546788, 126.9706188, 10, "route-1")
+
+        tasks["single"].delay.assert_called_once_with(
+            "user123", 37.5546788, 126.9706188, 10, "route-1"
+        )
+        tasks["batch"].delay.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_splits_by_batch_size(self, buffer, tasks):
+        """batch_size 단위로 나누어 batch_save_locations 발행"""
+        await buffer.start()
+        for i in range(7):
+            buffer.add(f"user{i}", 37.5, 127.0, 10, "route-1")
+        await buffer.stop()
+
+        batches = [c.args[0] for c in tasks["batch"].delay.call_args_list]
+        assert sum(len(b) for b in batches) == 7
+        assert all(len(b) <= 3 for b in batches)
+        # (user_id, lat, lon, accuracy, route_id, timestamp)
+        assert batches[0][0][:5] == ("user0", 37.5, 127.0, 10, "route-1")
+        tasks["single"].delay.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_publishes_on_interval(self, buffer, tasks):
+        """batch_size 미만이어도 flush 주기마다 발행"""
+        await buffer.start()
+        buffer.add("user123", 37.5, 127.0, 10, "route-1")
+
+        await asyncio.sleep(0.1)
+
+        tasks["batch"].delay.assert_called_once()
+        assert len(tasks["batch"].delay.call_args[0][0]) == 1
+        await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_requeues_failed_batch(self, buffer, tasks):
+        """발행 실패한 배치는 버퍼에 되돌려 다음 flush에서 재시도"""
+        tasks["batch"].delay.side_effect = [ConnectionError("broker down"), None]
+        buffer._queue.extend(
+            (f"user{i}", 37.5, 127.0, 10, "route-1", "ts") for i in range(2)
+        )
+
+        await buffer.flush()
+        assert [item[0] for item in buffer._queue] == ["user0", "user1"]
+
+        await buffer.flush()
+        assert not buffer._queue
+        assert tasks["batch"].delay.call_count == 2
+        assert tasks["batch"].delay.call_args[0][0][0][0] == "user0"
+
+    @pytest.mark.asyncio
+    async def test_stop_drops_batch_after_max_retries(self, buffer, tasks):
+        """연속 실패가 max_publish_retries를 넘으면 배치 폐기 (stop이 무한 반복하지 않음)"""
+        buffer.max_publish_retries = 2
+        tasks["batch"].delay.side_effect = ConnectionError("broker down")
+        buffer._queue.append(("user0", 37.5, 127.0, 10, "route-1", "ts"))
+
+        await buffer.stop()
+
+        assert not buffer._queue
+        assert tasks["batch"].delay.call_count == 3
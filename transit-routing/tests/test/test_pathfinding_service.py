@@ -3,59 +3,96 @@ PathfindingService 테스트
 """
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
-from datetime import datetime
+from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 from app.services.pathfinding_service import PathfindingService
 from app.core.exceptions import StationNotFoundException, RouteNotFoundException
 
 
+def _label(
+    arrival_time,
+    transfers,
+    avg_convenience,
+    avg_congestion,
+    max_transfer_difficulty,
+    route,
+    lines,
+    transfer_info,
+):
+    """테스트용 Label (MagicMock 대신 필요한 속성/메서드만 가진 가벼운 객체)"""
+    return SimpleNamespace(
+        arrival_time=arrival_time,
+        transfers=transfers,
+        avg_convenience=avg_convenience,
+        avg_congestion=avg_congestion,
+        max_transfer_difficulty=max_transfer_difficulty,
+        reconstruct_route=lambda **kwargs: route,
+        reconstruct_lines=lambda **kwargs: lines,
+        reconstruct_transfer_info=lambda: transfer_info,
+    )
+
+
 class TestPathfindingService:
     """PathfindingService 테스트 클래스"""
 
-    @pytest.fixture
-    def mock_cache_functions(self, mock_cache):
-        """캐시 함수 Mock"""
+    @staticmethod
+    def _configure_raptor(mock):
+        """Mock McRaptor 기본 동작 설정 (경로 1개 반환)"""
+        mock_label = _label(
+            arrival_time=25.5,
+            transfers=1,
+            avg_convenience=0.85,
+            avg_congestion=0.57,
+            max_transfer_difficulty=0.42,
+            route=["1000000100", "2000000201"],
+            lines=["1호선", "2호선"],
+            transfer_info=[["1000000100", "1호선", "2호선"]],
+        )
+
+        mock.find_routes.return_value = [mock_label]
+        mock.rank_routes.return_value = [(mock_label, 0.3542)]
+
+    @pytest.fixture(scope="module")
+    def mock_cache_functions(self, sample_stations):
+        """캐시 함수 Mock (모듈 전체에서 공유, 역 코드 조회 동작은 reset_mocks에서 테스트마다 설정)"""
         with patch("app.services.pathfinding_service.get_stations_dict") as mock_get_stations, \
              patch("app.services.pathfinding_service.get_station_cd_by_name") as mock_get_cd:
 
-            mock_get_stations.return_value = mock_cache["stations"]
-            mock_get_cd.side_effect = lambda name: mock_cache["station_name_map"].get(name)
-
+            # service(module scope) 생성 시점에 필요
+            mock_get_stations.return_value = sample_stations
             yield {
                 "get_stations_dict": mock_get_stations,
                 "get_station_cd_by_name": mock_get_cd,
             }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_raptor(self):
-        """Mock McRaptor"""
-        mock = MagicMock()
-
-        # Mock Label 객체
-        mock_label = MagicMock()
-        mock_label.arrival_time = 25.5
-        mock_label.transfers = 1
-        mock_label.avg_convenience = 0.85
-        mock_label.avg_congestion = 0.57
-        mock_label.max_transfer_difficulty = 0.42
-        mock_label.reconstruct_route.return_value = ["1000000100", "2000000201"]
-        mock_label.reconstruct_lines.return_value = ["1호선", "2호선"]
-        mock_label.reconstruct_transfer_info.return_value = [["1000000100", "1호선", "2호선"]]
-
-        mock.find_routes.return_value = [mock_label]
-        mock.rank_routes.return_value = [(mock_label, 0.3542)]
+        """Mock McRaptor (모듈 전체에서 공유)"""
+        return MagicMock()
 
-        return mock
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self, mock_cache_functions, mock_raptor):
-        """PathfindingService 인스턴스"""
+        """PathfindingService 인스턴스 (모듈 전체에서 공유)"""
         with patch("app.services.pathfinding_service.McRaptor") as mock_raptor_class:
             mock_raptor_class.return_value = mock_raptor
             service = PathfindingService()
             return service
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_cache_functions, mock_raptor, mock_cache):
+        """이전 테스트에서 바꾼 Mock 동작을 기본값으로 복원"""
+        mock_raptor.reset_mock(return_value=True, side_effect=True)
+        self._configure_raptor(mock_raptor)
+
+        mock_get_stations = mock_cache_functions["get_stations_dict"]
+        mock_get_cd = mock_cache_functions["get_station_cd_by_name"]
+        mock_get_stations.reset_mock(return_value=True, side_effect=True)
+        mock_get_cd.reset_mock(return_value=True, side_effect=True)
+        mock_get_stations.return_value = mock_cache["stations"]
+        # dict.get bound method -> 조회마다 Python 함수 frame 생성 없음
+        mock_get_cd.side_effect = mock_cache["station_name_map"].get
+
     def test_service_initialization(self, service):
         """서비스 초기화 테스트"""
         assert service is not None
@@ -78,7 +115,7 @@ class TestPathfindingService:
 
     def test_calculate_route_invalid_origin(self, service, mock_cache_functions):
         """유효하지 않은 출발지로 경로 계산 시도"""
-        mock_cache_functions["get_station_cd_by_name"].side_effect = lambda name: None
+        mock_cache_functions["get_station_cd_by_name"].side_effect = {}.get
 
         with pytest.raises(StationNotFoundException) as exc_info:
             service.calculate_route("존재하지않는역", "강남역", "PHY")
@@ -87,12 +124,9 @@ class TestPathfindingService:
 
     def test_calculate_route_invalid_destination(self, service, mock_cache_functions):
         """유효하지 않은 목적지로 경로 계산 시도"""
-        def get_cd_side_effect(name):
-            if name == "서울역":
-                return "1000000100"
-            return None
-
-        mock_cache_functions["get_station_cd_by_name"].side_effect = get_cd_side_effect
+        mock_cache_functions["get_station_cd_by_name"].side_effect = {
+            "서울역": "1000000100"
+        }.get
 
         with pytest.raises(StationNotFoundException) as exc_info:
             service.calculate_route("서울역", "존재하지않는역", "PHY")
@@ -110,19 +144,20 @@ class TestPathfindingService:
 
     def test_calculate_route_multiple_routes(self, service, mock_raptor):
         """여러 경로 반환 테스트"""
-        # 3개의 Mock 라벨 생성
-        mock_labels = []
-        for i in range(3):
-            label = MagicMock()
-            label.arrival_time = 25.5 + i * 5
-            label.transfers = i
-            label.avg_convenience = 0.85 - i * 0.05
-            label.avg_congestion = 0.57 + i * 0.05
-            label.max_transfer_difficulty = 0.42 + i * 0.1
-            label.reconstruct_route.return_value = [f"station_{j}" for j in range(i + 2)]
-            label.reconstruct_lines.return_value = [f"{i + 1}호선"] * (i + 2)
-            label.reconstruct_transfer_info.return_value = [[f"transfer_{i}", f"{i}호선", f"{i + 1}호선"]]
-            mock_labels.append(label)
+        # 3개의 라벨 생성
+        mock_labels = [
+            _label(
+                arrival_time=25.5 + i * 5,
+                transfers=i,
+                avg_convenience=0.85 - i * 0.05,
+                avg_congestion=0.57 + i * 0.05,
+                max_transfer_difficulty=0.42 + i * 0.1,
+                route=[f"station_{j}" for j in range(i + 2)],
+                lines=[f"{i + 1}호선"] * (i + 2),
+                transfer_info=[[f"transfer_{i}", f"{i}호선", f"{i + 1}호선"]],
+            )
+            for i in range(3)
+        ]
 
         mock_raptor.find_routes.return_value = mock_labels
         mock_raptor.rank_routes.return_value = [(label, 0.3 + i * 0.1) for i, label in enumerate(mock_labels)]
@@ -134,14 +169,12 @@ class TestPathfindingService:
         assert result["routes"][1]["rank"] == 2
         assert result["routes"][2]["rank"] == 3
 
-    def test_calculate_route_all_disability_types(self, service):
+    @pytest.mark.parametrize("disability_type", ["PHY", "VIS", "AUD", "ELD"])
+    def test_calculate_route_all_disability_types(self, service, disability_type):
         """모든 장애 유형에 대한 경로 계산 테스트"""
-        disability_types = ["PHY", "VIS", "AUD", "ELD"]
-
-        for disability_type in disability_types:
-            result = service.calculate_route("서울역", "강남역", disability_type)
-            assert result is not None
-            assert len(result["routes"]) > 0
+        result = service.calculate_route("서울역", "강남역", disability_type)
+        assert result is not None
+        assert len(result["routes"]) > 0
 
     def test_calculate_route_max_rounds(self, service, mock_raptor):
         """최대 라운드 설정 확인"""
@@ -2,14 +2,27 @@
 RedisSessionManager 테스트
 """
 
-import pytest
 import json
-from unittest.mock import MagicMock, patch
-from datetime import datetime
+from functools import lru_cache
+
+import orjson
+import pytest
+from unittest.mock import patch
 
 from app.db.redis_client import RedisSessionManager
 
 
+@lru_cache(maxsize=8)
+def _parse(session_json: str) -> dict:
+    """세션 JSON 파싱 (같은 문자열은 재사용, 결과는 읽기 전용으로 사용)"""
+    return orjson.loads(session_json)
+
+
+def _stored_session(setex_calls) -> dict:
+    """마지막 setex 호출로 저장된 세션 데이터 (setex(key, ttl, session_json))"""
+    return _parse(setex_calls[-1][2])
+
+
 class TestRedisSessionManager:
     """RedisSessionManager 테스트 클래스"""
 
@@ -22,27 +35,29 @@ class TestRedisSessionManager:
             manager.redis_client = mock_redis_client
             return manager
 
-    def test_create_session(self, redis_manager, sample_route_data, mock_redis_client):
-        """세션 생성 테스트"""
-        mock_redis_client.setex.return_value = True
+    @pytest.fixture
+    def setex_calls(self, mock_redis_client):
+        """setex 호출 인자 (key, ttl, session_json)를 호출 순서대로 기록하는 리스트"""
+        calls = []
+        mock_redis_client.setex.side_effect = lambda *args: calls.append(args) or True
+        return calls
 
+    def test_create_session(self, redis_manager, sample_route_data, setex_calls):
+        """세션 생성 테스트"""
         result = redis_manager.create_session("user123", sample_route_data)
 
         assert result is True
-        mock_redis_client.setex.assert_called_once()
+        assert len(setex_calls) == 1
+        session_key, ttl, _ = setex_calls[0]
 
         # 세션 키 확인
-        call_args = mock_redis_client.setex.call_args
-        session_key = call_args[0][0]
         assert session_key == "session:user123"
 
         # TTL 확인 (4시간 = 14400초)
-        ttl = call_args[0][1]
         assert ttl == 14400
 
         # 세션 데이터 확인
-        session_data_json = call_args[0][2]
-        session_data = json.loads(session_data_json)
+        session_data = _stored_session(setex_calls)
 
         assert session_data["route_id"] == sample_route_data["route_id"]
         assert session_data["origin"] == sample_route_data["origin"]
@@ -50,36 +65,27 @@ class TestRedisSessionManager:
         assert session_data["selected_route_rank"] == 1
 
     def test_create_session_with_primary_route(
-        self, redis_manager, sample_route_data, mock_redis_client
+        self, redis_manager, sample_route_data, setex_calls
     ):
         """세션 생성 시 1순위 경로 저장 확인"""
-        mock_redis_client.setex.return_value = True
-
         redis_manager.create_session("user123", sample_route_data)
 
-        call_args = mock_redis_client.setex.call_args
-        session_data_json = call_args[0][2]
-        session_data = json.loads(session_data_json)
+        session_data = _stored_session(setex_calls)
 
         primary_route = sample_route_data["routes"][0]
 
-        # 1순위 경로 정보 확인
-        assert json.loads(session_data["route_sequence"]) == primary_route["route_sequence"]
-        assert json.loads(session_data["route_lines"]) == primary_route["route_lines"]
+        # 1순위 경로 정보 확인 (중첩 필드는 create_session과 같은 json.dumps 결과와 문자열 비교)
+        assert session_data["route_sequence"] == json.dumps(primary_route["route_sequence"])
+        assert session_data["route_lines"] == json.dumps(primary_route["route_lines"])
         assert session_data["total_time"] == primary_route["total_time"]
         assert session_data["transfers"] == primary_route["transfers"]
 
-    def test_get_session_exists(self, redis_manager, sample_session_data, mock_redis_client):
+    def test_get_session_exists(
+        self, redis_manager, sample_session_data, sample_session_json, mock_redis_client
+    ):
         """세션 조회 - 존재하는 경우"""
-        # Redis에서 반환할 데이터 준비
-        stored_data = sample_session_data.copy()
-        stored_data["route_sequence"] = json.dumps(stored_data["route_sequence"])
-        stored_data["route_lines"] = json.dumps(stored_data["route_lines"])
-        stored_data["transfer_stations"] = json.dumps(stored_data["transfer_stations"])
-        stored_data["transfer_info"] = json.dumps(stored_data["transfer_info"])
-        stored_data["all_routes"] = json.dumps(stored_data["all_routes"])
-
-        mock_redis_client.get.return_value = json.dumps(stored_data)
+        # Redis에서 반환할 데이터 (직렬화된 세션)
+        mock_redis_client.get.return_value = sample_session_json
 
         session = redis_manager.get_session("user123")
 
@@ -89,6 +95,16 @@ class TestRedisSessionManager:
         assert isinstance(session["route_sequence"], list)
         assert isinstance(session["route_lines"], list)
 
+    def test_get_session_stdlib_json(self, redis_manager, sample_session_json, mock_redis_client):
+        """표준 json 모듈로 직렬화한 세션도 동일하게 조회 (서버는 stdlib json 사용)"""
+        mock_redis_client.get.return_value = sample_session_json
+        expected = redis_manager.get_session("user123")
+
+        mock_redis_client.get.return_value = json.dumps(orjson.loads(sample_session_json))
+        session = redis_manager.get_session("user123")
+
+        assert session == expected
+
     def test_get_session_not_exists(self, redis_manager, mock_redis_client):
         """세션 조회 - 존재하지 않는 경우"""
         mock_redis_client.get.return_value = None
@@ -114,37 +130,32 @@ class TestRedisSessionManager:
 
         assert result is False
 
-    def test_switch_route_success(self, redis_manager, sample_session_data, mock_redis_client):
+    def test_switch_route_success(self, redis_manager, sample_session_data, setex_calls):
         """경로 변경 - 성공"""
         # get_session이 세션 데이터를 반환하도록 설정
         with patch.object(redis_manager, "get_session") as mock_get_session:
             mock_get_session.return_value = sample_session_data
-            mock_redis_client.setex.return_value = True
 
             result = redis_manager.switch_route("user123", 2)
 
             assert result is True
-            mock_redis_client.setex.assert_called_once()
+            assert len(setex_calls) == 1
 
             # 변경된 세션 데이터 확인
-            call_args = mock_redis_client.setex.call_args
-            session_data_json = call_args[0][2]
-            session_data = json.loads(session_data_json)
+            session_data = _stored_session(setex_calls)
 
             assert session_data["selected_route_rank"] == 2
 
-    def test_switch_route_invalid_rank(self, redis_manager, sample_session_data, mock_redis_client):
-        """경로 변경 - 유효하지 않은 순위"""
+    @pytest.mark.parametrize("rank", [0, 4, -1, 99])
+    def test_switch_route_invalid_rank(self, redis_manager, sample_session_data, mock_redis_client, rank):
+        """경로 변경 - 유효하지 않은 순위 (0 이하 또는 경로 수(3) 초과)"""
         with patch.object(redis_manager, "get_session") as mock_get_session:
             mock_get_session.return_value = sample_session_data
 
-            # 0번 경로 (유효하지 않음)
-            result = redis_manager.switch_route("user123", 0)
-            assert result is False
+            result = redis_manager.switch_route("user123", rank)
 
-            # 4번 경로 (존재하지 않음, 3개만 있음)
-            result = redis_manager.switch_route("user123", 4)
             assert result is False
+            mock_redis_client.setex.assert_not_called()
 
     def test_switch_route_no_session(self, redis_manager, mock_redis_client):
         """경로 변경 - 세션 없음"""
@@ -155,20 +166,17 @@ class TestRedisSessionManager:
 
             assert result is False
 
-    def test_update_location(self, redis_manager, sample_session_data, mock_redis_client):
+    def test_update_location(self, redis_manager, sample_session_data, setex_calls):
         """위치 업데이트 테스트"""
         with patch.object(redis_manager, "get_session") as mock_get_session:
             mock_get_session.return_value = sample_session_data
-            mock_redis_client.setex.return_value = True
 
             redis_manager.update_location("user123", "new_station_cd")
 
-            mock_redis_client.setex.assert_called_once()
+            assert len(setex_calls) == 1
 
             # 업데이트된 데이터 확인
-            call_args = mock_redis_client.setex.call_args
-            session_data_json = call_args[0][2]
-            session_data = json.loads(session_data_json)
+            session_data = _stored_session(setex_calls)
 
             assert session_data["current_station"] == "new_station_cd"
             assert "last_update" in session_data
@@ -183,51 +191,40 @@ class TestRedisSessionManager:
 
             mock_redis_client.setex.assert_not_called()
 
-    def test_session_ttl(self, redis_manager, sample_route_data, mock_redis_client):
+    def test_session_ttl(self, redis_manager, sample_route_data, setex_calls):
         """세션 TTL 확인 (4시간)"""
-        mock_redis_client.setex.return_value = True
-
         redis_manager.create_session("user123", sample_route_data)
 
-        call_args = mock_redis_client.setex.call_args
-        ttl = call_args[0][1]
+        _, ttl, _ = setex_calls[-1]
 
         # 4시간 = 14400초
         assert ttl == 14400
 
-    def test_session_key_format(self, redis_manager, sample_route_data, mock_redis_client):
+    def test_session_key_format(self, redis_manager, sample_route_data, setex_calls):
         """세션 키 형식 확인"""
-        mock_redis_client.setex.return_value = True
-
         redis_manager.create_session("test_user_456", sample_route_data)
 
-        call_args = mock_redis_client.setex.call_args
-        session_key = call_args[0][0]
+        session_key, _, _ = setex_calls[-1]
 
         assert session_key == "session:test_user_456"
         assert session_key.startswith("session:")
 
-    def test_all_routes_stored(self, redis_manager, sample_route_data, mock_redis_client):
+    def test_all_routes_stored(self, redis_manager, sample_route_data, setex_calls):
         """전체 경로 정보 저장 확인"""
-        mock_redis_client.setex.return_value = True
-
         redis_manager.create_session("user123", sample_route_data)
 
-        call_args = mock_redis_client.setex.call_args
-        session_data_json = call_args[0][2]
-        session_data = json.loads(session_data_json)
+        session_data = _stored_session(setex_calls)
 
-        all_routes = json.loads(session_data["all_routes"])
+        all_routes = orjson.loads(session_data["all_routes"])
         assert len(all_routes) == 3
         assert all_routes == sample_route_data["routes"]
 
     def test_switch_route_changes_correct_route(
-        self, redis_manager, sample_session_data, mock_redis_client
+        self, redis_manager, sample_session_data, setex_calls
     ):
         """경로 변경 시 올바른 경로로 변경되는지 확인"""
         with patch.object(redis_manager, "get_session") as mock_get_session:
             mock_get_session.return_value = sample_session_data
-            mock_redis_client.setex.return_value = True
 
             result = redis_manager.switch_route("user123", 3)
 
@@ -235,12 +232,25 @@ class TestRedisSessionManager:
             assert result is True
 
             # setex가 호출되었는지 확인
-            mock_redis_client.setex.assert_called_once()
-
-            call_args = mock_redis_client.setex.call_args
-            if call_args and call_args[0] and len(call_args[0]) > 2:
-                session_data_json = call_args[0][2]
-                if session_data_json:
-                    session_data = json.loads(session_data_json)
-                    # 선택된 경로 순위가 3으로 변경되었는지 확인
-                    assert session_data["selected_route_rank"] == 3
+            assert len(setex_calls) == 1
+
+            # 선택된 경로 순위가 3으로 변경되었는지 확인
+            session_data = _stored_session(setex_calls)
+            assert session_data["selected_route_rank"] == 3
+
+    def test_cache_route_roundtrip(self, redis_manager, sample_route_data, setex_calls, mock_redis_client):
+        """경로 캐시 저장 후 조회 - 같은 데이터, 공백 없는 JSON으로 저장"""
+        assert redis_manager.cache_route("route:A:B:PHY", sample_route_data, ttl=60) is True
+
+        cache_key, ttl, stored = setex_calls[0]
+        assert (cache_key, ttl) == ("route:A:B:PHY", 60)
+        assert len(stored) < len(json.dumps(sample_route_data, ensure_ascii=False))
+
+        mock_redis_client.get.return_value = stored
+        assert redis_manager.get_cached_route("route:A:B:PHY") == sample_route_data
+
+    def test_get_cached_route_invalid_json(self, redis_manager, mock_redis_client):
+        """경로 캐시 파싱 실패 - None 반환 (재계산)"""
+        mock_redis_client.get.return_value = "{not json"
+
+        assert redis_manager.get_cached_route("route:A:B:PHY") is None
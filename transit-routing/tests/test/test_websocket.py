@@ -4,8 +4,11 @@ WebSocket 엔드포인트 테스트
 
 import pytest
 import json
-from unittest.mock import MagicMock, patch, AsyncMock
-from fastapi import WebSocket
+import uuid
+from types import SimpleNamespace
+from unittest.mock import ANY, DEFAULT, MagicMock, patch, AsyncMock
+
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.v1.endpoints.websocket import (
     ConnectionManager,
@@ -14,9 +17,38 @@ from app.api.v1.endpoints.websocket import (
     handle_switch_route,
     handle_recalculate_route,
     handle_end_navigation,
+    _new_uuid,
 )
 
 
+def _mock_websocket():
+    """
+    Mock WebSocket (ConnectionManager가 사용하는 accept/send_json/send_text/close만 AsyncMock)
+    AsyncMock(spec=WebSocket)은 생성마다 WebSocket 클래스 전체 속성을 검사 -> 필요한 메서드만 설정
+    """
+    ws = MagicMock()
+    ws.accept = AsyncMock()
+    ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
+    return ws
+
+
+def _sent_message(ws):
+    """WebSocket으로 전송된 메시지 (orjson 경로는 send_text, 없으면 send_json)"""
+    if ws.send_text.called:
+        return json.loads(ws.send_text.call_args[0][0])
+    return ws.send_json.call_args[0][0]
+
+
+def test_new_uuid_is_unique_uuid4():
+    """풀에서 꺼낸 ID는 서로 다른 UUID4 문자열 (풀 재충전 경계 포함)"""
+    ids = [_new_uuid() for _ in range(3000)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(i).version == 4 and str(uuid.UUID(i)) == i for i in ids)
+
+
 class TestConnectionManager:
     """ConnectionManager 테스트"""
 
@@ -28,11 +60,7 @@ class TestConnectionManager:
     @pytest.fixture
     def mock_websocket(self):
         """Mock WebSocket"""
-        ws = AsyncMock(spec=WebSocket)
-        ws.accept = AsyncMock()
-        ws.send_json = AsyncMock()
-        ws.close = AsyncMock()
-        return ws
+        return _mock_websocket()
 
     @pytest.mark.asyncio
     async def test_connect_new_user(self, manager, mock_websocket):
@@ -46,16 +74,13 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_connect_duplicate_user(self, manager, mock_websocket):
         """중복 연결 처리"""
-        old_ws = AsyncMock(spec=WebSocket)
-        old_ws.send_json = AsyncMock()
-        old_ws.close = AsyncMock()
+        old_ws = _mock_websocket()
 
         # 첫 번째 연결
         await manager.connect(old_ws, "user123")
 
         # 두 번째 연결 (중복)
-        new_ws = AsyncMock(spec=WebSocket)
-        new_ws.accept = AsyncMock()
+        new_ws = _mock_websocket()
         await manager.connect(new_ws, "user123")
 
         # 이전 연결이 종료되고 새 연결로 대체되어야 함
@@ -70,17 +95,14 @@ class TestConnectionManager:
         manager.MAX_CONNECTIONS = 2
 
         # 2개 연결
-        ws1 = AsyncMock(spec=WebSocket)
-        ws1.accept = AsyncMock()
-        ws2 = AsyncMock(spec=WebSocket)
-        ws2.accept = AsyncMock()
+        ws1 = _mock_websocket()
+        ws2 = _mock_websocket()
 
         await manager.connect(ws1, "user1")
         await manager.connect(ws2, "user2")
 
         # 3번째 연결 시도 (초과)
-        ws3 = AsyncMock(spec=WebSocket)
-        ws3.close = AsyncMock()
+        ws3 = _mock_websocket()
 
         with pytest.raises(Exception, match="최대 연결 수 초과"):
             await manager.connect(ws3, "user3")
@@ -108,12 +130,24 @@ class TestConnectionManager:
         message = {"type": "test", "data": "hello"}
         await manager.send_message("user123", message)
 
-        mock_websocket.send_json.assert_called_once_with(message)
+        assert mock_websocket.send_text.call_count + mock_websocket.send_json.call_count == 1
+        assert _sent_message(mock_websocket) == message
+
+    @pytest.mark.asyncio
+    async def test_send_message_numpy_scalar(self, manager, mock_websocket):
+        """numpy 스칼라가 포함된 메시지도 JSON 텍스트로 전송"""
+        np = pytest.importorskip("numpy")
+        manager.active_connections["user123"] = mock_websocket
+
+        await manager.send_message("user123", {"type": "test", "progress": np.float64(42.5)})
+
+        assert _sent_message(mock_websocket) == {"type": "test", "progress": 42.5}
 
     @pytest.mark.asyncio
     async def test_send_message_connection_error(self, manager, mock_websocket):
         """메시지 전송 실패 시 연결 해제"""
         mock_websocket.send_json = AsyncMock(side_effect=Exception("Connection error"))
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Connection error"))
         manager.active_connections["user123"] = mock_websocket
 
         message = {"type": "test"}
@@ -129,11 +163,8 @@ class TestConnectionManager:
 
         await manager.send_error("user123", "Error occurred", "ERROR_CODE")
 
-        # send_json이 호출되었는지 확인
-        mock_websocket.send_json.assert_called_once()
-
         # 전송된 메시지 확인
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent_message(mock_websocket)
         assert call_args["type"] == "error"
         assert call_args["message"] == "Error occurred"
         assert call_args["code"] == "ERROR_CODE"
@@ -154,15 +185,35 @@ class TestConnectionManager:
 class TestWebSocketHandlers:
     """WebSocket 핸들러 함수 테스트"""
 
+    @pytest.fixture(scope="class")
+    def _patched_deps(self):
+        """
+        핸들러가 사용하는 모듈 의존성을 클래스당 한 번만 patch (patch.multiple)
+        manager 전송 메서드는 AsyncMock, redis client는 get_redis_client().return_value
+        """
+        with patch.multiple(
+            "app.api.v1.endpoints.websocket",
+            manager=DEFAULT,
+            get_redis_client=DEFAULT,
+            save_navigation_event=DEFAULT,
+            get_location_buffer=DEFAULT,
+        ) as mocks:
+            mocks["manager"].send_message = AsyncMock()
+            mocks["manager"].send_error = AsyncMock()
+            mocks["redis"] = mocks["get_redis_client"].return_value
+            yield mocks
+
+    @pytest.fixture(autouse=True)
+    def ws_deps(self, _patched_deps):
+        """테스트마다 호출 기록/반환값만 초기화 (patch 재설치 없음)"""
+        _patched_deps["redis"].reset_mock(return_value=True, side_effect=True)
+        for name in ("manager", "get_redis_client", "save_navigation_event", "get_location_buffer"):
+            _patched_deps[name].reset_mock()
+        return _patched_deps
+
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_start_navigation_success(
-        self, mock_manager, sample_route_data
-    ):
+    async def test_handle_start_navigation_success(self, ws_deps, sample_route_data):
         """경로 계산 시작 - 성공"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         mock_service = MagicMock()
         mock_service.calculate_route.return_value = sample_route_data
 
@@ -172,32 +223,42 @@ class TestWebSocketHandlers:
             "disability_type": "PHY",
         }
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis, \
-             patch("app.api.v1.endpoints.websocket.save_navigation_event"):
+        await handle_start_navigation("user123", data, mock_service)
 
-            mock_redis = mock_get_redis.return_value
-            mock_redis.create_session = MagicMock()
+        # 경로 계산 호출 확인
+        mock_service.calculate_route.assert_called_once_with(
+            "서울역", "강남역", "PHY"
+        )
 
-            await handle_start_navigation("user123", data, mock_service)
+        # 세션 생성 확인
+        ws_deps["redis"].create_session.assert_called_once()
+
+        # 성공 메시지 전송 확인
+        ws_deps["manager"].send_message.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_start_navigation_creates_session_in_threadpool(
+        self, ws_deps, sample_route_data
+    ):
+        """세션 생성(동기 Redis 호출)은 이벤트 루프가 아닌 스레드풀에서 실행"""
+        mock_service = MagicMock()
+        mock_service.calculate_route.return_value = sample_route_data
 
-            # 경로 계산 호출 확인
-            mock_service.calculate_route.assert_called_once_with(
-                "서울역", "강남역", "PHY"
-            )
+        data = {"origin": "서울역", "destination": "강남역", "disability_type": "PHY"}
 
-            # 세션 생성 확인
-            mock_redis.create_session.assert_called_once()
+        with patch(
+            "app.api.v1.endpoints.websocket.run_in_threadpool",
+            new=AsyncMock(side_effect=run_in_threadpool),
+        ) as mock_run:
+            await handle_start_navigation("user123", data, mock_service)
 
-            # 성공 메시지 전송 확인
-            mock_manager.send_message.assert_called_once()
+        create_session = ws_deps["redis"].create_session
+        create_session.assert_called_once()
+        mock_run.assert_any_await(create_session, "user123", ANY)
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_start_navigation_missing_params(self, mock_manager):
+    async def test_handle_start_navigation_missing_params(self, ws_deps):
         """경로 계산 시작 - 파라미터 누락"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         mock_service = MagicMock()
 
         # 목적지 누락
@@ -206,15 +267,11 @@ class TestWebSocketHandlers:
         await handle_start_navigation("user123", data, mock_service)
 
         # 에러 메시지 전송 확인
-        mock_manager.send_error.assert_called_once()
+        ws_deps["manager"].send_error.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_location_update_success(self, mock_manager, sample_session_data):
+    async def test_handle_location_update_success(self, ws_deps, sample_session_data):
         """위치 업데이트 - 성공"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         mock_service = MagicMock()
         mock_service.get_navigation_guidance.return_value = {
             "current_station": "1000000100",
@@ -225,32 +282,30 @@ class TestWebSocketHandlers:
             "remaining_stations": 1,
             "progress_percent": 50,
             "is_transfer": False,
+            "transfer_from_line": None,
+            "transfer_to_line": None,
             "message": "강남역 방향으로 이동 중",
         }
 
         data = {"latitude": 37.5546788, "longitude": 126.9706188}
+        ws_deps["redis"].get_session.return_value = sample_session_data
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis, \
-             patch("app.api.v1.endpoints.websocket.save_location_history"):
+        await handle_location_update("user123", data, mock_service)
 
-            mock_redis = mock_get_redis.return_value
-            mock_redis.get_session.return_value = sample_session_data
+        # 안내 생성 호출 확인
+        mock_service.get_navigation_guidance.assert_called_once()
 
-            await handle_location_update("user123", data, mock_service)
-
-            # 안내 생성 호출 확인
-            mock_service.get_navigation_guidance.assert_called_once()
-
-            # 메시지 전송 확인
-            mock_manager.send_message.assert_called_once()
+        # 메시지 전송 확인
+        ws_deps["manager"].send_message.assert_called_once()
+        message = ws_deps["manager"].send_message.call_args[0][1]
+        assert message["type"] == "navigation_update"
+        assert message["next_station_name"] == "강남역"
+        assert message["progress_percent"] == 50
+        assert message["transfer_to_line"] is None
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_location_update_deviation(self, mock_manager, sample_session_data):
+    async def test_handle_location_update_deviation(self, ws_deps, sample_session_data):
         """위치 업데이트 - 경로 이탈"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         mock_service = MagicMock()
         mock_service.get_navigation_guidance.return_value = {
             "recalculate": True,
@@ -260,127 +315,113 @@ class TestWebSocketHandlers:
         }
 
         data = {"latitude": 37.5, "longitude": 127.0}
+        ws_deps["redis"].get_session.return_value = sample_session_data
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis, \
-             patch("app.api.v1.endpoints.websocket.save_navigation_event"):
-
-            mock_redis = mock_get_redis.return_value
-            mock_redis.get_session.return_value = sample_session_data
-
-            await handle_location_update("user123", data, mock_service)
+        await handle_location_update("user123", data, mock_service)
 
-            # 이탈 메시지 전송 확인
-            call_args = mock_manager.send_message.call_args[0]
-            message = call_args[1]
-            assert message["type"] == "route_deviation"
+        # 이탈 메시지 전송 확인
+        call_args = ws_deps["manager"].send_message.call_args[0]
+        message = call_args[1]
+        assert message["type"] == "route_deviation"
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_switch_route_success(self, mock_manager, sample_session_data):
+    async def test_handle_switch_route_success(self, ws_deps, sample_session_data):
         """경로 변경 - 성공"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         data = {"target_rank": 2}
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis:
-            mock_redis = mock_get_redis.return_value
-            mock_redis.switch_route.return_value = True
-            mock_redis.get_session.return_value = sample_session_data
+        mock_redis = ws_deps["redis"]
+        mock_redis.switch_route.return_value = True
+        mock_redis.get_session.return_value = sample_session_data
 
-            await handle_switch_route("user123", data)
+        await handle_switch_route("user123", data)
 
-            # 경로 변경 호출 확인
-            mock_redis.switch_route.assert_called_once_with("user123", 2)
+        # 경로 변경 호출 확인
+        mock_redis.switch_route.assert_called_once_with("user123", 2)
 
-            # 성공 메시지 전송 확인
-            call_args = mock_manager.send_message.call_args[0]
-            message = call_args[1]
-            assert message["type"] == "route_switched"
+        # 성공 메시지 전송 확인
+        call_args = ws_deps["manager"].send_message.call_args[0]
+        message = call_args[1]
+        assert message["type"] == "route_switched"
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_switch_route_invalid_rank(self, mock_manager):
+    async def test_handle_switch_route_invalid_rank(self, ws_deps):
         """경로 변경 - 유효하지 않은 순위"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
         data = {"target_rank": 5}  # 1-3만 유효
 
         await handle_switch_route("user123", data)
 
         # 에러 메시지 전송 확인
-        mock_manager.send_error.assert_called_once()
+        ws_deps["manager"].send_error.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
     async def test_handle_recalculate_route_success(
-        self, mock_manager, sample_session_data, sample_route_data
+        self, ws_deps, sample_session_data, sample_route_data
     ):
         """경로 재계산 - 성공"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
+        # 홀더는 SimpleNamespace, 호출 검증이 필요한 메서드만 MagicMock
+        mock_pathfinding = SimpleNamespace(
+            calculate_route=MagicMock(return_value=sample_route_data)
+        )
+        mock_guidance = SimpleNamespace(
+            find_nearest_station_name=MagicMock(return_value="서울역")
+        )
 
-        mock_pathfinding = MagicMock()
-        mock_pathfinding.calculate_route.return_value = sample_route_data
+        data = {"latitude": 37.5546788, "longitude": 126.9706188, "disability_type": "PHY"}
+        ws_deps["redis"].get_session.return_value = sample_session_data
 
-        mock_guidance = MagicMock()
-        mock_guidance.find_nearest_station_name.return_value = "서울역"
+        await handle_recalculate_route("user123", data, mock_pathfinding, mock_guidance)
 
-        data = {"latitude": 37.5546788, "longitude": 126.9706188, "disability_type": "PHY"}
+        # 경로 재계산 호출 확인
+        mock_pathfinding.calculate_route.assert_called_once()
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis, \
-             patch("app.api.v1.endpoints.websocket.save_navigation_event"):
+        # 메시지 전송 확인
+        call_args = ws_deps["manager"].send_message.call_args[0]
+        message = call_args[1]
+        assert message["type"] == "route_recalculated"
+        assert message["origin_cd"] == sample_route_data["origin_cd"]
+        assert message["routes"] == sample_route_data["routes"]
+        assert message["selected_route_rank"] == 1
+        assert message["message"] == "경로가 재계산되었습니다"
 
-            mock_redis = mock_get_redis.return_value
-            mock_redis.get_session.return_value = sample_session_data
+    @pytest.mark.asyncio
+    async def test_handle_recalculate_route_invalid_disability_type(
+        self, ws_deps, sample_session_data
+    ):
+        """경로 재계산 - 유효하지 않은 교통약자 유형은 계산 전에 거부"""
+        mock_pathfinding = SimpleNamespace(calculate_route=MagicMock())
+        mock_guidance = SimpleNamespace(find_nearest_station_name=MagicMock())
 
-            await handle_recalculate_route("user123", data, mock_pathfinding, mock_guidance)
+        data = {"latitude": 37.5546788, "longitude": 126.9706188, "disability_type": "XYZ"}
+        ws_deps["redis"].get_session.return_value = sample_session_data
 
-            # 경로 재계산 호출 확인
-            mock_pathfinding.calculate_route.assert_called_once()
+        await handle_recalculate_route("user123", data, mock_pathfinding, mock_guidance)
 
-            # 메시지 전송 확인
-            call_args = mock_manager.send_message.call_args[0]
-            message = call_args[1]
-            assert message["type"] == "route_recalculated"
+        mock_pathfinding.calculate_route.assert_not_called()
+        assert ws_deps["manager"].send_error.call_args[0][2] == "INVALID_PARAMETERS"
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_end_navigation_success(self, mock_manager, sample_session_data):
+    async def test_handle_end_navigation_success(self, ws_deps, sample_session_data):
         """내비게이션 종료 - 성공"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
-
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis, \
-             patch("app.api.v1.endpoints.websocket.save_navigation_event"):
-
-            mock_redis = mock_get_redis.return_value
-            mock_redis.get_session.return_value = sample_session_data
-            mock_redis.delete_session = MagicMock(return_value=True)
+        mock_redis = ws_deps["redis"]
+        mock_redis.get_session.return_value = sample_session_data
+        mock_redis.delete_session.return_value = True
 
-            await handle_end_navigation("user123")
+        await handle_end_navigation("user123")
 
-            # 세션 삭제 확인
-            mock_redis.delete_session.assert_called_once_with("user123")
+        # 세션 삭제 확인
+        mock_redis.delete_session.assert_called_once_with("user123")
 
-            # 종료 메시지 전송 확인
-            call_args = mock_manager.send_message.call_args[0]
-            message = call_args[1]
-            assert message["type"] == "navigation_ended"
+        # 종료 메시지 전송 확인
+        call_args = ws_deps["manager"].send_message.call_args[0]
+        message = call_args[1]
+        assert message["type"] == "navigation_ended"
 
     @pytest.mark.asyncio
-    @patch("app.api.v1.endpoints.websocket.manager")
-    async def test_handle_end_navigation_no_session(self, mock_manager):
+    async def test_handle_end_navigation_no_session(self, ws_deps):
         """내비게이션 종료 - 세션 없음"""
-        mock_manager.send_message = AsyncMock()
-        mock_manager.send_error = AsyncMock()
+        ws_deps["redis"].get_session.return_value = None
 
-        with patch("app.api.v1.endpoints.websocket.get_redis_client") as mock_get_redis:
-            mock_redis = mock_get_redis.return_value
-            mock_redis.get_session.return_value = None
+        await handle_end_navigation("user123")
 
-            await handle_end_navigation("user123")
-
-            # 에러 메시지 전송 확인
-            mock_manager.send_error.assert_called_once()
+        # 에러 메시지 전송 확인
+        ws_deps["manager"].send_error.assert_called_once()
@@ -4,7 +4,6 @@ import pytest
 import logging
 from datetime import datetime
 
-from app.services.pathfinding_service_cpp import PathfindingServiceCPP
 from app.core.exceptions import StationNotFoundException, RouteNotFoundException
 
 logger = logging.getLogger(__name__)
@@ -13,15 +12,10 @@ logger = logging.getLogger(__name__)
 class TestPathfindingServiceCPP:
     """PathfindingServiceCPP 통합 테스트"""
 
-    @pytest.fixture(scope="class")
-    def service(self):
-        """테스트용 PathfindingServiceCPP 인스턴스"""
-        try:
-            service = PathfindingServiceCPP()
-            logger.info("PathfindingServiceCPP 초기화 성공")
-            return service
-        except RuntimeError as e:
-            pytest.skip(f"C++ 모듈을 사용할 수 없습니다: {e}")
+    @pytest.fixture
+    def service(self, cpp_service):
+        """테스트용 PathfindingServiceCPP 인스턴스 (세션 공유)"""
+        return cpp_service
 
     def test_service_initialization(self, service):
         """서비스 초기화 테스트"""
@@ -59,13 +53,23 @@ class TestPathfindingServiceCPP:
 
     def test_calculate_route_all_disability_types(self, service):
         """모든 장애 유형별 경로 계산 테스트"""
+        from concurrent.futures import ThreadPoolExecutor
+
         disability_types = ["PHY", "VIS", "AUD", "ELD"]
 
-        for dtype in disability_types:
-            result = service.calculate_route(
-                origin_name="강남", destination_name="잠실", disability_type=dtype
+        # 유형별 계산은 서로 독립 -> 동시 실행
+        # (요청마다 McRaptorEngine 생성, find_routes는 GIL 해제 상태로 실행)
+        with ThreadPoolExecutor(max_workers=len(disability_types)) as executor:
+            results = list(
+                executor.map(
+                    lambda dtype: service.calculate_route(
+                        origin_name="강남", destination_name="잠실", disability_type=dtype
+                    ),
+                    disability_types,
+                )
             )
 
+        for dtype, result in zip(disability_types, results):
             assert result is not None
             assert len(result["routes"]) > 0
 
@@ -108,10 +112,10 @@ class TestPathfindingServiceCPP:
             logger.info("✓ 직통 경로 (환승 없음)")
 
     def test_calculate_route_performance(self, service):
-        """성능 테스트 (캐시 미스)"""
+        """성능 테스트 (캐시 미스, 워밍업 후 측정)"""
         import time
+        from app.db.cache import get_station_cd_by_name
 
-        # 캐시를 우회하기 위해 매번 다른 경로 테스트
         test_cases = [
             ("강남", "서울역"),
             ("잠실", "홍대입구"),
@@ -119,13 +123,25 @@ class TestPathfindingServiceCPP:
         ]
 
         for origin, destination in test_cases:
-            start_time = time.time()
+            # 워밍업: 최초 호출의 일회성 비용(C++ 모듈 로드, Redis 연결 등)을 측정에서 제외
+            service.calculate_route(
+                origin_name=origin, destination_name=destination, disability_type="PHY"
+            )
+            # 워밍업이 저장한 캐시(Redis + 프로세스 로컬) 삭제 -> 측정 구간은 캐시 미스
+            cache_key = (
+                f"route:cpp:{get_station_cd_by_name(origin)}:"
+                f"{get_station_cd_by_name(destination)}:PHY"
+            )
+            service.redis_client.redis_client.delete(cache_key)
+            service.local_route_cache.clear()
+
+            start_ns = time.perf_counter_ns()
 
             result = service.calculate_route(
                 origin_name=origin, destination_name=destination, disability_type="PHY"
             )
 
-            elapsed_time = (time.time() - start_time) * 1000  # ms
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
 
             assert result is not None
             logger.info(
@@ -134,7 +150,7 @@ class TestPathfindingServiceCPP:
                 f"경로 수={len(result['routes'])}"
             )
 
-            # 성능 기준: 첫 계산은 2초 이내 (C++ 최적화)
+            # 성능 기준: 캐시 미스 계산은 2초 이내 (C++ 최적화)
             assert elapsed_time < 2000, f"응답시간 초과: {elapsed_time:.1f}ms > 2000ms"
 
     def test_calculate_route_cache_hit(self, service):
@@ -147,17 +163,29 @@ class TestPathfindingServiceCPP:
         )
 
         # 두 번째 호출 (캐시 히트)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = service.calculate_route(
             origin_name="강남", destination_name="역삼", disability_type="PHY"
         )
-        elapsed_time = (time.time() - start_time) * 1000  # ms
+        elapsed_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
 
         assert result is not None
         logger.info(f"✓ 캐시 히트 성능: {elapsed_time:.1f}ms")
 
-        # 캐시 히트는 50ms 이내 (Redis 조회)
-        assert elapsed_time < 50, f"캐시 응답시간 초과: {elapsed_time:.1f}ms > 50ms"
+        # 캐시 히트는 5ms 이내 (프로세스 로컬 캐시, Redis 왕복 없음)
+        assert elapsed_time < 5, f"캐시 응답시간 초과: {elapsed_time:.1f}ms > 5ms"
+
+        # 캐시 값은 공백 없는 JSON -> 기본 json.dumps 출력보다 작아야 함
+        import json
+        from app.db.cache import get_station_cd_by_name
+
+        cache_key = (
+            f"route:cpp:{get_station_cd_by_name('강남')}:"
+            f"{get_station_cd_by_name('역삼')}:PHY"
+        )
+        raw = service.redis_client.redis_client.get(cache_key)
+        assert raw is not None
+        assert len(raw) < len(json.dumps(json.loads(raw), ensure_ascii=False))
 
     def test_station_not_found(self, service):
         """존재하지 않는 역 테스트"""
@@ -269,43 +297,50 @@ class TestPathfindingServiceCPP:
 
 
 # 통합 테스트 실행 함수
-def test_full_integration():
+def test_full_integration(cpp_service, subtests):
     """전체 통합 테스트"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     logger.info("=" * 60)
     logger.info("PathfindingServiceCPP 통합 테스트 시작")
     logger.info("=" * 60)
 
-    try:
-        service = PathfindingServiceCPP()
-
-        # 여러 경로 테스트
-        test_routes = [
-            ("강남", "서울역", "PHY"),
-            ("잠실", "홍대입구", "VIS"),
-            ("신림", "종로3가", "AUD"),
-            ("역삼", "신촌", "ELD"),
-        ]
-
-        for origin, destination, dtype in test_routes:
-            result = service.calculate_route(origin, destination, dtype)
-            logger.info(
-                f"✓ {origin} → {destination} ({dtype}): "
-                f"{len(result['routes'])}개 경로, "
-                f"최적={result['routes'][0]['total_time']}분"
+    # 여러 경로 테스트
+    test_routes = [
+        ("강남", "서울역", "PHY"),
+        ("잠실", "홍대입구", "VIS"),
+        ("신림", "종로3가", "AUD"),
+        ("역삼", "신촌", "ELD"),
+    ]
+
+    # 경로별 계산은 서로 독립 -> 동시 실행 후 경로마다 subtest로 결과 보고
+    with ThreadPoolExecutor(max_workers=len(test_routes)) as executor:
+        futures = {
+            executor.submit(cpp_service.calculate_route, origin, destination, dtype): (
+                origin,
+                destination,
+                dtype,
             )
+            for origin, destination, dtype in test_routes
+        }
+
+        for future in as_completed(futures):
+            origin, destination, dtype = futures[future]
+            with subtests.test(msg=f"{origin} → {destination} ({dtype})"):
+                result = future.result()
+                assert result is not None
+                assert len(result["routes"]) > 0
+                logger.info(
+                    f"✓ {origin} → {destination} ({dtype}): "
+                    f"{len(result['routes'])}개 경로, "
+                    f"최적={result['routes'][0]['total_time']}분"
+                )
 
-        logger.info("=" * 60)
-        logger.info("모든 통합 테스트 통과!")
-        logger.info("=" * 60)
-
-    except Exception as e:
-        logger.error(f"통합 테스트 실패: {e}", exc_info=True)
-        raise
+    logger.info("=" * 60)
+    logger.info("통합 테스트 종료")
+    logger.info("=" * 60)
 
 
 if __name__ == "__main__":
     # 직접 실행 시 통합 테스트만 수행
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    test_full_integration()
+    pytest.main([__file__, "-k", "test_full_integration", "-s", "--log-cli-level=INFO"])